@@ -23,7 +23,7 @@ from src.form_builder.infrastructure.models import FormDefinitionModel  # noqa:
 from src.projects.infrastructure.models import ProjectModel  # noqa: E402, F401
 from src.process_design.infrastructure.models import ProcessDefinitionModel  # noqa: E402, F401
 from src.runtime.infrastructure.models import ProcessInstanceModel, FormSubmissionModel  # noqa: E402, F401
-from src.catalogs.infrastructure.models import CatalogModel  # noqa: E402, F401
+from src.catalogs.infrastructure.models import CatalogModel, CatalogItemModel  # noqa: E402, F401
 
 target_metadata = Base.metadata
 
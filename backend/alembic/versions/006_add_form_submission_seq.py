@@ -0,0 +1,67 @@
+"""add seq/created_at and (instance, node, seq) index to form_submissions
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEQ_NAME = "form_submissions_seq_seq"
+INDEX_NAME = "ix_form_submissions_instance_node_seq"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "form_submissions" not in inspector.get_table_names():
+        return
+    cols = [c["name"] for c in inspector.get_columns("form_submissions")]
+    if "seq" not in cols:
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {SEQ_NAME}")
+        op.add_column("form_submissions", sa.Column("seq", sa.BigInteger(), nullable=True))
+        # Истинный порядок вставки не сохранён; ближайшее приближение — физический порядок строк (ctid)
+        op.execute("""
+            UPDATE form_submissions s SET seq = sub.rn
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY ctid) AS rn
+                FROM form_submissions
+            ) sub
+            WHERE s.id = sub.id
+        """)
+        op.execute(f"SELECT setval('{SEQ_NAME}', (SELECT COALESCE(MAX(seq), 0) + 1 FROM form_submissions), false)")
+        op.alter_column(
+            "form_submissions",
+            "seq",
+            nullable=False,
+            server_default=sa.text(f"nextval('{SEQ_NAME}'::regclass)"),
+        )
+    if "created_at" not in cols:
+        op.add_column(
+            "form_submissions",
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        )
+    indexes = [i["name"] for i in inspector.get_indexes("form_submissions")]
+    if INDEX_NAME not in indexes:
+        op.create_index(
+            INDEX_NAME,
+            "form_submissions",
+            ["process_instance_id", "node_id", sa.text("seq DESC")],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name="form_submissions")
+    op.drop_column("form_submissions", "created_at")
+    op.drop_column("form_submissions", "seq")
+    op.execute(f"DROP SEQUENCE IF EXISTS {SEQ_NAME}")
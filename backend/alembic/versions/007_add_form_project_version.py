@@ -0,0 +1,40 @@
+"""add version to form_definitions and projects
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "007"
+down_revision: Union[str, Sequence[str], None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("form_definitions", "projects")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+    for table in TABLES:
+        if table not in tables:
+            continue
+        cols = [c["name"] for c in inspector.get_columns(table)]
+        if "version" not in cols:
+            op.add_column(
+                table,
+                sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "version")
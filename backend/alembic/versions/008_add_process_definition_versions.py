@@ -0,0 +1,69 @@
+"""add immutable process_definition_versions and process_instances.process_version
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "008"
+down_revision: Union[str, Sequence[str], None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+    if "process_definition_versions" not in tables:
+        op.create_table(
+            "process_definition_versions",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("process_definition_id", sa.String(36), nullable=False, index=True),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False, server_default=""),
+            sa.Column("project_id", sa.String(36), nullable=True),
+            sa.Column("nodes_schema", sa.Text(), nullable=False, server_default="[]"),
+            sa.Column("edges_schema", sa.Text(), nullable=False, server_default="[]"),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.UniqueConstraint("process_definition_id", "version", name="uq_process_definition_versions_process_version"),
+        )
+    if "process_definitions" in tables:
+        # Снимок текущего состояния каждого процесса как его текущей версии
+        op.execute("""
+            INSERT INTO process_definition_versions
+                (id, process_definition_id, version, name, description, project_id, nodes_schema, edges_schema)
+            SELECT gen_random_uuid()::text, d.id, COALESCE(d.version, 1), d.name, d.description,
+                   d.project_id, d.nodes_schema, d.edges_schema
+            FROM process_definitions d
+            WHERE NOT EXISTS (
+                SELECT 1 FROM process_definition_versions v
+                WHERE v.process_definition_id = d.id AND v.version = COALESCE(d.version, 1)
+            )
+        """)
+    if "process_instances" in tables:
+        cols = [c["name"] for c in inspector.get_columns("process_instances")]
+        if "process_version" not in cols:
+            op.add_column(
+                "process_instances",
+                sa.Column("process_version", sa.Integer(), nullable=False, server_default="1"),
+            )
+            # Уже запущенные экземпляры закрепляем за текущей версией их процесса
+            op.execute("""
+                UPDATE process_instances i SET process_version = COALESCE(d.version, 1)
+                FROM process_definitions d
+                WHERE d.id = i.process_definition_id
+            """)
+
+
+def downgrade() -> None:
+    op.drop_column("process_instances", "process_version")
+    op.drop_table("process_definition_versions")
@@ -0,0 +1,33 @@
+"""add routes_schema to process_definition_versions
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "009"
+down_revision: Union[str, Sequence[str], None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "process_definition_versions" not in inspector.get_table_names():
+        return
+    cols = [c["name"] for c in inspector.get_columns("process_definition_versions")]
+    if "routes_schema" not in cols:
+        # NULL — маршруты рассчитываются при загрузке версии (см. _deserialize_process)
+        op.add_column("process_definition_versions", sa.Column("routes_schema", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("process_definition_versions", "routes_schema")
@@ -0,0 +1,81 @@
+"""move catalog items from catalogs.items_schema to indexed catalog_items table
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "011"
+down_revision: Union[str, Sequence[str], None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEX = "ix_catalog_items_label_trgm"
+VALUE_INDEX = "ix_catalog_items_catalog_value"
+
+
+def upgrade() -> None:
+    # Нужно и для пустой БД: индекс gin_trgm_ops создаёт и Base.metadata.create_all
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+    if "catalog_items" not in tables:
+        op.create_table(
+            "catalog_items",
+            sa.Column("catalog_id", sa.String(36), primary_key=True),
+            sa.Column("position", sa.Integer(), primary_key=True),
+            sa.Column("value", sa.Text(), nullable=False),
+            sa.Column("label", sa.Text(), nullable=False),
+        )
+        op.create_index(
+            TRGM_INDEX,
+            "catalog_items",
+            ["label"],
+            postgresql_using="gin",
+            postgresql_ops={"label": "gin_trgm_ops"},
+        )
+        op.create_index(
+            VALUE_INDEX,
+            "catalog_items",
+            ["catalog_id", "value"],
+            postgresql_ops={"value": "text_pattern_ops"},
+        )
+    if "catalogs" not in tables:
+        return
+    cols = [c["name"] for c in inspector.get_columns("catalogs")]
+    if "items_schema" in cols:
+        op.execute("""
+            INSERT INTO catalog_items (catalog_id, position, value, label)
+            SELECT c.id, e.ord, COALESCE(e.item->>'value', ''), COALESCE(e.item->>'label', e.item->>'value', '')
+            FROM catalogs c
+            CROSS JOIN LATERAL jsonb_array_elements(
+                CASE WHEN jsonb_typeof(c.items_schema::jsonb) = 'array' THEN c.items_schema::jsonb ELSE '[]'::jsonb END
+            ) WITH ORDINALITY AS e(item, ord)
+            WHERE jsonb_typeof(e.item) = 'object'
+            ON CONFLICT DO NOTHING
+        """)
+        op.drop_column("catalogs", "items_schema")
+
+
+def downgrade() -> None:
+    op.add_column("catalogs", sa.Column("items_schema", sa.Text(), nullable=False, server_default="[]"))
+    op.execute("""
+        UPDATE catalogs c SET items_schema = sub.items::text
+        FROM (
+            SELECT catalog_id, jsonb_agg(jsonb_build_object('value', value, 'label', label) ORDER BY position) AS items
+            FROM catalog_items
+            GROUP BY catalog_id
+        ) sub
+        WHERE sub.catalog_id = c.id
+    """)
+    op.drop_index(VALUE_INDEX, table_name="catalog_items")
+    op.drop_index(TRGM_INDEX, table_name="catalog_items")
+    op.drop_table("catalog_items")
@@ -0,0 +1 @@
+"""Нагрузочные прогоны API (python -m bench.load_test) — см. README, раздел «Нагрузочное тестирование»."""
@@ -0,0 +1,229 @@
+"""
+Нагрузочный прогон runtime API: засев данных через API, затем N виртуальных пользователей параллельно проводят
+документы по процессу (start → current-form → save → submit до завершения, список документов каждые K документов).
+Результат — JSON с пропускной способностью, перцентилями задержек и долей ошибок по операциям, коммитом и
+параметрами прогона: файлы разных коммитов сравниваются между собой.
+
+Из каталога backend, с DATABASE_URL на локальный Postgres (например, из docker compose):
+    python -m bench.load_test --start-server --concurrency 16 --duration 60
+    python -m bench.load_test --base-url http://127.0.0.1:8000 --admin-email admin@bpm.local --admin-password changeme
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from bench.scenario import ApiError, Recorder, login, new_run_id, run_flow, seed
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Перцентиль по ближайшему рангу (значения отсортированы)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    operations = {}
+    for name in sorted(set(recorder.latencies) | set(recorder.errors)):
+        values = sorted(recorder.latencies.get(name, []))
+        errors = sum(recorder.errors.get(name, {}).values())
+        total = len(values) + errors
+        operations[name] = {
+            "count": total,
+            "ok": len(values),
+            "errors": errors,
+            "error_rate": round(errors / total, 6) if total else 0.0,
+            "errors_by_kind": recorder.errors.get(name, {}),
+            "throughput_rps": round(len(values) / elapsed, 3) if elapsed else 0.0,
+            "latency_ms": {
+                "mean": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+                **{f"p{p}": round(percentile(values, p) * 1000, 3) for p in PERCENTILES},
+                "max": round(values[-1] * 1000, 3) if values else 0.0,
+            },
+        }
+    ok = sum(op["ok"] for op in operations.values())
+    errors = sum(op["errors"] for op in operations.values())
+    return {
+        "requests": ok + errors,
+        "errors": errors,
+        "error_rate": round(errors / (ok + errors), 6) if ok + errors else 0.0,
+        "throughput_rps": round(ok / elapsed, 3) if elapsed else 0.0,
+        "operations": operations,
+    }
+
+
+def _git_revision() -> dict:
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=BACKEND_DIR, capture_output=True, text=True).stdout.strip()
+
+    return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--", "."))}
+
+
+def _bootstrap_admin(email: str, password: str) -> None:
+    """Схема БД и админ для засева через существующий CLI (код 2 у user create — пользователь уже есть)."""
+    if subprocess.run([sys.executable, "-m", "src.cli", "db-upgrade"], cwd=BACKEND_DIR).returncode != 0:
+        raise SystemExit("bpm db-upgrade завершился с ошибкой")
+    code = subprocess.run(
+        [sys.executable, "-m", "src.cli", "user", "create", "--email", email, "--password", password, "--admin"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+    ).returncode
+    if code not in (0, 2):
+        raise SystemExit(f"Не удалось создать администратора для прогона (код {code})")
+
+
+def _start_server(port: int, workers: int) -> subprocess.Popen:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([BACKEND_DIR, os.path.join(BACKEND_DIR, "src")])}
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--app-dir", os.path.join(BACKEND_DIR, "src"),
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", str(workers),
+            "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+async def _wait_healthy(client: httpx.AsyncClient, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.25)
+    raise SystemExit(f"Сервер не ответил на /health за {timeout:.0f} с")
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        await _wait_healthy(client, args.startup_timeout)
+        run_id = new_run_id()
+        try:
+            admin_token = await login(client, args.admin_email, args.admin_password)
+            seeded = await seed(client, admin_token, args.users, args.user_password, run_id)
+        except ApiError as e:
+            raise SystemExit(f"Засев данных не удался: {e}")
+
+        recorder = Recorder()
+        flows = {"completed": 0, "failed": 0}
+        recorder.measure_from = time.perf_counter() + args.warmup
+        deadline = recorder.measure_from + args.duration
+
+        async def virtual_user(index: int) -> None:
+            # Свой генератор на пользователя: данные не зависят от того, как чередуются корутины
+            rng = random.Random(args.seed * 10_007 + index)
+            token = seeded.user_tokens[index % len(seeded.user_tokens)]
+            n = 0
+            while time.perf_counter() < deadline:
+                measured = time.perf_counter() >= recorder.measure_from
+                n += 1
+                ok = await run_flow(client, token, seeded, rng, recorder, list_documents=n % args.list_every == 0)
+                if measured:
+                    flows["completed" if ok else "failed"] += 1
+
+        await asyncio.gather(*(virtual_user(i) for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - recorder.measure_from
+
+    summary = summarize(recorder, elapsed)
+    summary["flows"] = {**flows, "throughput_per_s": round(flows["completed"] / elapsed, 3) if elapsed else 0.0}
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "run_id": run_id,
+        "git": _git_revision(),
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "parameters": {
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "users": args.users,
+            "list_every": args.list_every,
+            "seed": args.seed,
+            "server_workers": args.workers if args.start_server else None,
+        },
+        "elapsed_s": round(elapsed, 3),
+        **summary,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон runtime API")
+    parser.add_argument("--base-url", default=None, help="Адрес запущенного API (по умолчанию — --start-server)")
+    parser.add_argument("--start-server", action="store_true", help="Запустить uvicorn локально на время прогона")
+    parser.add_argument("--port", type=int, default=8765, help="Порт для --start-server")
+    parser.add_argument("--workers", type=int, default=1, help="Воркеры uvicorn для --start-server")
+    parser.add_argument("--concurrency", type=int, default=8, help="Виртуальные пользователи")
+    parser.add_argument("--duration", type=float, default=30.0, help="Секунды измерения")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Секунды прогрева (в отчёт не входят)")
+    parser.add_argument("--users", type=int, default=4, help="Пользователи, создаваемые при засеве")
+    parser.add_argument("--list-every", type=int, default=5, help="Список документов после каждого K-го документа")
+    parser.add_argument("--seed", type=int, default=1, help="Seed генератора данных форм")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Таймаут HTTP-запроса, с")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--admin-email", default="bench-admin@bench.local")
+    parser.add_argument("--admin-password", default="bench-admin")
+    parser.add_argument("--user-password", default="bench-user")
+    parser.add_argument(
+        "--no-bootstrap-admin",
+        action="store_true",
+        help="Не создавать администратора через CLI (он уже есть в БД)",
+    )
+    parser.add_argument("--output", default=None, help="Файл отчёта (по умолчанию bench/results/<время>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.base_url is None:
+        args.start_server = True
+        args.base_url = f"http://127.0.0.1:{args.port}"
+    if not args.no_bootstrap_admin:
+        _bootstrap_admin(args.admin_email, args.admin_password)
+    server = _start_server(args.port, args.workers) if args.start_server else None
+    try:
+        report = asyncio.run(_run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+    output = args.output or os.path.join(
+        BACKEND_DIR, "bench", "results", datetime.now().strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    flows = report["flows"]
+    print(
+        f"{flows['completed']} документов ({flows['throughput_per_s']}/с), {report['requests']} запросов "
+        f"({report['throughput_rps']} rps), ошибок {report['error_rate']:.2%} → {output}"
+    )
+    for name, op in report["operations"].items():
+        lat = op["latency_ms"]
+        print(f"  {name:15} {op['ok']:7} ok  p50 {lat['p50']:8.1f} ms  p95 {lat['p95']:8.1f} ms  p99 {lat['p99']:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
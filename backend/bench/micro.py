@@ -0,0 +1,587 @@
+"""
+Микробенчмарки правил, валидаторов и (де)сериализации: evaluate_expression / CompiledExpression,
+evaluate_field_access, run_field_visibility_validators / run_step_access_validators, _deserialize_process,
+_deserialize_form и json_codec; группа runtime — документ целиком во встроенном движке (без БД). Корпуса выражений и контексты генерируются из random.Random(seed) в нескольких
+размерах, поэтому при одних параметрах замеряется одно и то же. Результат — JSON; baseline — такой же JSON,
+сохранённый с --save-baseline; compare сравнивает два отчёта по медиане с учётом разброса повторов.
+
+Из каталога backend:
+    python -m bench.micro run --save-baseline main
+    python -m bench.micro run --group evaluator --output /tmp/new.json
+    python -m bench.micro compare bench/baselines/main.json /tmp/new.json
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Callable
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_DIR = os.path.join(BENCH_DIR, "baselines")
+
+CONTEXT_SIZES = (10, 100, 1000)
+FORM_SIZES = (10, 50, 200)
+GRAPH_SIZES = (10, 50, 200)
+STATUSES = ["draft", "review", "approved", "rejected", "archived"]
+ROLES = ["admin", "manager", "accountant", "viewer", "auditor"]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    fn: Callable[[], Any]
+    ops: int = 1  # операций за вызов fn: время в отчёте — на одну операцию
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+# --- Корпуса ---------------------------------------------------------------
+# Ключи контекста — field_N: токенизатор выражений режет идентификаторы, начинающиеся с in/or/and.
+
+
+def make_context(rng: random.Random, size: int) -> dict[str, Any]:
+    """Плоский контекст документа: числа, значения справочника, флаги и тексты поровну, плюс role_ids и status."""
+    ctx: dict[str, Any] = {"role_ids": rng.sample(ROLES, 2), "status": rng.choice(STATUSES)}
+    for i in range(size):
+        kind = i % 4
+        if kind == 0:
+            ctx[f"field_{i}"] = rng.randint(0, 100_000)
+        elif kind == 1:
+            ctx[f"field_{i}"] = rng.choice(STATUSES)
+        elif kind == 2:
+            ctx[f"field_{i}"] = rng.random() < 0.5
+        else:
+            ctx[f"field_{i}"] = "".join(rng.choice("abcdefghij ") for _ in range(rng.randint(5, 60)))
+    return ctx
+
+
+def _comparison(rng: random.Random, context_size: int) -> str:
+    i = rng.randrange(context_size)
+    key = f"field_{i}"
+    kind = i % 4
+    if kind == 0:
+        return f"{key} {rng.choice(['>', '>=', '<', '<=', '==', '!='])} {rng.randint(0, 100_000)}"
+    if kind == 1:
+        if rng.random() < 0.5:
+            return f"{key} == '{rng.choice(STATUSES)}'"
+        return f"{key} in [{', '.join(repr(s) for s in rng.sample(STATUSES, 3))}]"
+    if kind == 2:
+        return f"{key} == {rng.choice(['true', 'false'])}"
+    return f"status != '{rng.choice(STATUSES)}'"
+
+
+def make_expression(rng: random.Random, context_size: int, terms: int) -> str:
+    """Выражение из terms сравнений, соединённых and/or, иногда в скобках."""
+    parts = [_comparison(rng, context_size)]
+    for _ in range(terms - 1):
+        term = _comparison(rng, context_size)
+        if rng.random() < 0.2:
+            term = f"({term} or {_comparison(rng, context_size)})"
+        parts.append(rng.choice(["and", "or"]))
+        parts.append(term)
+    return " ".join(parts)
+
+
+def make_expression_corpus(seed: int, context_size: int, terms: int, count: int = 200) -> list[str]:
+    rng = random.Random(f"{seed}:expr:{context_size}:{terms}")
+    return [make_expression(rng, context_size, terms) for _ in range(count)]
+
+
+def make_access_rules(rng: random.Random, context_size: int, count: int) -> list[dict]:
+    rules = []
+    for _ in range(count):
+        if rng.random() < 0.3:
+            rules.append({"role_id": rng.choice(ROLES), "expression": None, "permission": "write"})
+        else:
+            rules.append(
+                {
+                    "role_id": None,
+                    "expression": make_expression(rng, context_size, rng.randint(1, 3)),
+                    "permission": rng.choice(["read", "write", "hidden"]),
+                }
+            )
+    return rules
+
+
+def make_form_fields(rng: random.Random, count: int) -> list[dict]:
+    """Поля формы в формате fields_schema (как их сохраняет FormDefinitionRepository)."""
+    fields = []
+    for i in range(count):
+        field_type = rng.choice(["text", "number", "select", "textarea", "boolean", "date"])
+        fields.append(
+            {
+                "name": f"field_{i}",
+                "label": f"Поле {i}",
+                "field_type": field_type,
+                "required": rng.random() < 0.3,
+                "options": [{"value": s, "label": s} for s in STATUSES] if field_type == "select" else None,
+                "catalog_id": None,
+                "catalog_remote": False,
+                "validations": {"max_length": 200} if field_type == "text" else None,
+                "access_rules": make_access_rules(rng, count, rng.randint(0, 2)),
+                "width": rng.choice([None, 6, 12]),
+            }
+        )
+    return fields
+
+
+def make_process_graph(rng: random.Random, steps: int) -> tuple[list[dict], list[dict]]:
+    """Узлы и рёбра в формате nodes_schema/edges_schema: цепочка шагов с условными ветками назад."""
+    nodes = [{"id": "start", "node_type": "start", "label": "Старт", "position_x": 0, "position_y": 0}]
+    edges = []
+    prev = "start"
+    for i in range(steps):
+        node_id = f"step_{i}"
+        nodes.append(
+            {
+                "id": node_id,
+                "node_type": "step",
+                "label": f"Шаг {i}",
+                "form_definition_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "position_x": 200.0 * (i + 1),
+                "position_y": 0.0,
+                "expression": None,
+                "validator_keys": ["visibility"] if rng.random() < 0.3 else [],
+            }
+        )
+        edges.append({"id": f"e{i}", "key": f"to_{node_id}", "source_node_id": prev, "target_node_id": node_id,
+                      "label": "", "condition_expression": make_expression(rng, 20, 2),
+                      "transition_validator_keys": ["can_advance"] if rng.random() < 0.2 else []})
+        if i > 1 and rng.random() < 0.2:
+            edges.append({"id": f"back{i}", "key": f"back_{i}", "source_node_id": node_id,
+                          "target_node_id": f"step_{i - 1}", "label": "На доработку",
+                          "condition_expression": "status == 'rejected'", "transition_validator_keys": []})
+        prev = node_id
+    nodes.append({"id": "end", "node_type": "end", "label": "Конец", "position_x": 200.0 * (steps + 1), "position_y": 0})
+    edges.append({"id": "e_end", "key": "finish", "source_node_id": prev, "target_node_id": "end", "label": ""})
+    return nodes, edges
+
+
+# --- Бенчмарки -------------------------------------------------------------
+
+
+def _evaluator_benchmarks(seed: int) -> list[Benchmark]:
+    from src.rules.evaluator import compile_expression, evaluate_expression, evaluate_field_access
+
+    out = []
+    for size in CONTEXT_SIZES:
+        ctx = make_context(random.Random(f"{seed}:ctx:{size}"), size)
+        for terms in (1, 4, 12):
+            corpus = make_expression_corpus(seed, size, terms)
+            compiled = [compile_expression(e) for e in corpus]
+            params = {"context_size": size, "terms": terms, "corpus": len(corpus)}
+
+            def parse_and_eval(corpus=corpus, ctx=ctx):
+                for e in corpus:
+                    evaluate_expression(e, ctx)
+
+            def eval_compiled(compiled=compiled, ctx=ctx):
+                for c in compiled:
+                    c.evaluate(ctx)
+
+            out.append(Benchmark(f"evaluate_expression[ctx={size},terms={terms}]", "evaluator",
+                                 parse_and_eval, len(corpus), params))
+            out.append(Benchmark(f"compiled_expression[ctx={size},terms={terms}]", "evaluator",
+                                 eval_compiled, len(compiled), params))
+        rng = random.Random(f"{seed}:rules:{size}")
+        rule_sets = [make_access_rules(rng, size, rng.randint(1, 4)) for _ in range(200)]
+
+        def field_access(rule_sets=rule_sets, ctx=ctx):
+            for rules in rule_sets:
+                evaluate_field_access(rules, ctx)
+
+        out.append(Benchmark(f"evaluate_field_access[ctx={size}]", "evaluator", field_access, len(rule_sets),
+                             {"context_size": size, "fields": len(rule_sets)}))
+    return out
+
+
+# Без присваивания по индексу: песочница не даёт _write_, валидаторы проектов собирают dict литералом
+FIELD_VISIBILITY_CODE = """
+def validate(context):
+    hidden = {key: "hidden" for key in ("field_2", "field_3", "field_5") if context.get(key) in (None, "", False)}
+    if context.get("field_0", 0) > 50000:
+        return {"field_1": "read", **hidden}
+    return hidden
+"""
+
+STEP_ACCESS_CODE = """
+def validate(context, node_id):
+    return "admin" in context.get("role_ids", []) or context.get("status") != "archived"
+"""
+
+
+def expected_field_visibility(context: dict[str, Any]) -> dict[str, str]:
+    """То же, что FIELD_VISIBILITY_CODE, на чистом Python — для проверки результата перед замером."""
+    out = {key: "hidden" for key in ("field_2", "field_3", "field_5") if context.get(key) in (None, "", False)}
+    if context.get("field_0", 0) > 50000:
+        out["field_1"] = "read"
+    return out
+
+
+def expected_step_access(context: dict[str, Any]) -> bool:
+    return "admin" in context.get("role_ids", []) or context.get("status") != "archived"
+
+
+def _validator_benchmarks(seed: int) -> list[Benchmark]:
+    from src.rules.validator_runner import (
+        FIELD_VISIBILITY_TYPE,
+        STEP_ACCESS_TYPE,
+        compile_validator,
+        run_field_visibility_validators,
+        run_step_access_validators,
+    )
+
+    def validator(type_: str, code: str, precompiled: bool) -> SimpleNamespace:
+        # Та же форма, что у ProjectValidator / ExecutionBundle: type, code, name и, опционально, compiled
+        return SimpleNamespace(type=type_, code=code, name=type_,
+                               compiled=compile_validator(code) if precompiled else None)
+
+    def check(visibility: list, access: list, ctx: dict[str, Any], label: str) -> None:
+        # Ошибка в песочнице не пробрасывается (пустые права / запрет перехода): без проверки замерялся бы путь
+        # исключения. Пробный контекст даёт непустые права и разрешённый переход, чтобы отличить их от ошибки.
+        probe = {"field_0": 60_000, "field_2": False, "status": "approved", "role_ids": []}
+        for c in (probe, ctx):
+            got_visibility = run_field_visibility_validators(visibility, c)
+            got_access = run_step_access_validators(access, c, "step_1")
+            if got_visibility != expected_field_visibility(c) or got_access != expected_step_access(c):
+                raise RuntimeError(f"Валидаторы вернули не то, что ожидалось ({label}): {got_visibility}, {got_access}")
+
+    out = []
+    for size in CONTEXT_SIZES:
+        ctx = make_context(random.Random(f"{seed}:ctx:{size}"), size)
+        for precompiled in (False, True):
+            mode = "compiled" if precompiled else "source"
+            visibility = [validator(FIELD_VISIBILITY_TYPE, FIELD_VISIBILITY_CODE, precompiled) for _ in range(3)]
+            access = [validator(STEP_ACCESS_TYPE, STEP_ACCESS_CODE, precompiled) for _ in range(3)]
+            check(visibility, access, ctx, f"ctx={size},{mode}")
+            params = {"context_size": size, "validators": 3, "mode": mode}
+            out.append(Benchmark(f"field_visibility_validators[ctx={size},{mode}]", "validators",
+                                 lambda v=visibility, c=ctx: run_field_visibility_validators(v, c), 1, params))
+            out.append(Benchmark(f"step_access_validators[ctx={size},{mode}]", "validators",
+                                 lambda v=access, c=ctx: run_step_access_validators(v, c, "step_1"), 1, params))
+    return out
+
+
+def _serialization_benchmarks(seed: int) -> list[Benchmark]:
+    from src import json_codec
+
+    out = []
+    for size in CONTEXT_SIZES:
+        ctx = make_context(random.Random(f"{seed}:ctx:{size}"), size)
+        raw = json_codec.dumps(ctx)
+        params = {"context_size": size, "bytes": len(raw.encode())}
+        out.append(Benchmark(f"json_dumps_context[ctx={size}]", "serialization",
+                             lambda c=ctx: json_codec.dumps(c), 1, params))
+        out.append(Benchmark(f"json_loads_context[ctx={size}]", "serialization",
+                             lambda r=raw: json_codec.loads(r), 1, params))
+
+    from src.form_builder.infrastructure.models import FormDefinitionModel
+    from src.form_builder.infrastructure.repository import _deserialize_form
+    from src.process_design.domain import compute_routes
+    from src.process_design.infrastructure.models import ProcessDefinitionModel, ProcessDefinitionVersionModel
+    from src.process_design.infrastructure.repository import _deserialize_process
+
+    for count in FORM_SIZES:
+        fields_schema = json_codec.dumps(make_form_fields(random.Random(f"{seed}:form:{count}"), count))
+        row = FormDefinitionModel(id=str(uuid.UUID(int=count)), name="Форма", description="",
+                                  fields_schema=fields_schema, version=1)
+        out.append(Benchmark(f"deserialize_form[fields={count}]", "serialization",
+                             lambda r=row: _deserialize_form(r), 1,
+                             {"fields": count, "bytes": len(fields_schema.encode())}))
+    for steps in GRAPH_SIZES:
+        nodes, edges = make_process_graph(random.Random(f"{seed}:graph:{steps}"), steps)
+        common = dict(name="Процесс", description="", project_id=str(uuid.UUID(int=1)), version=1,
+                      nodes_schema=json_codec.dumps(nodes), edges_schema=json_codec.dumps(edges))
+        row = ProcessDefinitionModel(id=str(uuid.UUID(int=steps)), **common)
+        params = {"steps": steps, "edges": len(edges), "bytes": len(common["nodes_schema"]) + len(common["edges_schema"])}
+        out.append(Benchmark(f"deserialize_process[steps={steps}]", "serialization",
+                             lambda r=row: _deserialize_process(r), 1, params))
+        routes = json_codec.dumps(compute_routes(_deserialize_process(row)))
+        version = ProcessDefinitionVersionModel(process_definition_id=row.id, routes_schema=routes, **common)
+        out.append(Benchmark(f"deserialize_process_version[steps={steps}]", "serialization",
+                             lambda r=version: _deserialize_process(r), 1, params))
+    return out
+
+
+def _runtime_benchmarks(seed: int) -> list[Benchmark]:
+    """Документ целиком (старт → текущая форма → отправка по шагам до конца) и список документов во встроенном
+    движке: RuntimeService на репозиториях в памяти, пакет исполнения процесса прогрет в definition_cache."""
+    import asyncio
+    from dataclasses import asdict
+
+    from src.projects.domain import Validator
+    from src.runtime.infrastructure.embedded import EmbeddedEngine
+    from src.seeding import build_graph
+
+    loop = asyncio.new_event_loop()  # один цикл на группу: asyncio.run на каждый вызов исказил бы замер
+
+    def define(steps: int, shape: str, validators: bool, fields: int = 20):
+        rng = random.Random(f"{seed}:runtime:{steps}:{shape}")
+        engine = EmbeddedEngine()
+
+        async def setup():
+            project = await engine.projects.create(
+                "Бенчмарк",
+                validators=[
+                    Validator(key="visibility", name="Видимость", type="field_visibility", code=FIELD_VISIBILITY_CODE),
+                    Validator(key="can_advance", name="Переход", type="step_access", code=STEP_ACCESS_CODE),
+                ] if validators else [],
+            )
+            forms = [await engine.forms.create(f"Форма {i}", fields=make_form_fields(rng, fields)) for i in range(3)]
+            nodes, edges = build_graph(rng, shape, steps, [str(f.id) for f in forms])
+            for n in nodes:
+                n.validator_keys = ["visibility"] if validators and n.form_definition_id else []
+            for e in edges:
+                e.transition_validator_keys = ["can_advance"] if validators else []
+            return await engine.processes.create(
+                "Бенчмарк", project_id=project.id, nodes=[asdict(n) for n in nodes], edges=[asdict(e) for e in edges]
+            )
+
+        process = loop.run_until_complete(setup())
+        # Крупная сумма (ветка проверки в branching), без возврата на доработку в loop; status не archived,
+        # иначе STEP_ACCESS_CODE запретит переход и документ остановится на первом шаге
+        data = {**make_context(rng, fields), "field_0": 60_000, "field_1": "approved", "status": "approved"}
+        return engine, process, data
+
+    out = []
+    for steps in (5, 20):
+        for shape in ("linear", "branching"):
+            for validators in (False, True):
+                engine, process, data = define(steps, shape, validators)
+                done = loop.run_until_complete(engine.run_document(process.id, lambda node_id, ctx: data, ["manager"]))
+                if not done or not done.is_completed:
+                    raise RuntimeError(f"Документ не дошёл до конца процесса: steps={steps}, {shape}, {validators}")
+                params = {"steps": steps, "shape": shape, "validators": validators}
+                out.append(
+                    Benchmark(
+                        f"runtime_document[steps={steps},{shape},validators={validators}]",
+                        "runtime",
+                        lambda e=engine, p=process, d=data: loop.run_until_complete(
+                            e.run_document(p.id, lambda node_id, ctx: d, role_ids=["manager"])
+                        ),
+                        1,
+                        params,
+                    )
+                )
+    for docs in (100, 1000):
+        engine, process, data = define(5, "linear", False)
+        for _ in range(docs):
+            loop.run_until_complete(engine.run_document(process.id, lambda node_id, ctx: data))
+        out.append(
+            Benchmark(
+                f"runtime_list_documents[docs={docs}]",
+                "runtime",
+                lambda e=engine: loop.run_until_complete(e.runtime.list_documents()),
+                1,
+                {"documents": docs},
+            )
+        )
+    return out
+
+
+GROUPS: dict[str, Callable[[int], list[Benchmark]]] = {
+    "evaluator": _evaluator_benchmarks,
+    "validators": _validator_benchmarks,
+    "serialization": _serialization_benchmarks,
+    "runtime": _runtime_benchmarks,
+}
+
+
+# --- Замер -----------------------------------------------------------------
+
+
+def measure(bench: Benchmark, repeats: int, min_time: float) -> dict[str, Any]:
+    """Калибровка числа вызовов на повтор (не меньше min_time секунд), затем repeats повторов.
+    В отчёт — время одной операции в микросекундах; GC на время замера выключен."""
+    bench.fn()  # прогрев: ленивые импорты, кэши
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            bench.fn()
+        if time.perf_counter() - started >= min_time / 5 or loops >= 1 << 20:
+            break
+        loops *= 2
+    per_repeat = max(1, int(loops * min_time / max(time.perf_counter() - started, 1e-9)))
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            started = time.perf_counter()
+            for _ in range(per_repeat):
+                bench.fn()
+            samples.append((time.perf_counter() - started) / (per_repeat * bench.ops) * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    median = statistics.median(samples)
+    return {
+        "group": bench.group,
+        "params": bench.params,
+        "unit": "us/op",
+        "median": round(median, 4),
+        "min": round(min(samples), 4),
+        "stdev": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "rel_spread": round((max(samples) - min(samples)) / median, 4) if median else 0.0,
+        "loops": per_repeat,
+        "repeats": repeats,
+    }
+
+
+def collect(groups: list[str], seed: int) -> tuple[list[Benchmark], dict[str, str]]:
+    """Бенчмарки выбранных групп; группа, чьи зависимости не импортируются, попадает в skipped."""
+    benches: list[Benchmark] = []
+    skipped: dict[str, str] = {}
+    for name in groups:
+        try:
+            benches.extend(GROUPS[name](seed))
+        except ImportError as e:
+            skipped[name] = f"{type(e).__name__}: {e}"
+    return benches, skipped
+
+
+def _git_commit() -> str | None:
+    result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=BENCH_DIR, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    benches, skipped = collect(args.group or list(GROUPS), args.seed)
+    if args.filter:
+        benches = [b for b in benches if args.filter in b.name]
+    results = {}
+    for bench in benches:
+        results[bench.name] = measure(bench, args.repeats, args.min_time)
+        r = results[bench.name]
+        print(f"{bench.name:55} {r['median']:12.3f} us/op  ±{r['rel_spread']:.1%}", flush=True)
+    for name, reason in skipped.items():
+        print(f"пропущена группа {name}: {reason}", file=sys.stderr)
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "json_backend": _json_backend(),
+        },
+        "parameters": {"seed": args.seed, "repeats": args.repeats, "min_time": args.min_time},
+        "skipped_groups": skipped,
+        "results": results,
+    }
+
+
+def _json_backend() -> str:
+    from src import json_codec
+
+    return json_codec.BACKEND
+
+
+# --- Сравнение -------------------------------------------------------------
+
+
+def compare(base: dict[str, Any], new: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """Строки отчёта по бенчмаркам из обоих файлов. Изменение засчитывается, если отношение медиан выходит
+    за threshold и за разброс повторов обоих замеров; иначе — «шум»."""
+    rows = []
+    base_results, new_results = base.get("results", {}), new.get("results", {})
+    for name in sorted(set(base_results) | set(new_results)):
+        b, n = base_results.get(name), new_results.get(name)
+        if b is None or n is None:
+            rows.append({"name": name, "status": "added" if b is None else "removed",
+                         "base": b and b["median"], "new": n and n["median"], "ratio": None})
+            continue
+        ratio = n["median"] / b["median"] if b["median"] else float("inf")
+        noise = max(threshold, b.get("rel_spread", 0.0), n.get("rel_spread", 0.0))
+        if ratio > 1 + noise:
+            status = "slower"
+        elif ratio < 1 / (1 + noise):
+            status = "faster"
+        else:
+            status = "same"
+        rows.append({"name": name, "status": status, "base": b["median"], "new": n["median"], "ratio": round(ratio, 4)})
+    return rows
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':55} {'base us':>12} {'new us':>12} {'ratio':>8}  status"]
+    for r in rows:
+        base = f"{r['base']:.3f}" if r["base"] is not None else "-"
+        new = f"{r['new']:.3f}" if r["new"] is not None else "-"
+        ratio = f"{r['ratio']:.3f}" if r["ratio"] is not None else "-"
+        lines.append(f"{r['name']:55} {base:>12} {new:>12} {ratio:>8}  {r['status']}")
+    counts = {s: sum(1 for r in rows if r["status"] == s) for s in ("slower", "faster", "same", "added", "removed")}
+    lines.append(", ".join(f"{k}: {v}" for k, v in counts.items() if v))
+    return "\n".join(lines)
+
+
+def _baseline_path(name_or_path: str) -> str:
+    if os.sep in name_or_path or name_or_path.endswith(".json"):
+        return name_or_path
+    return os.path.join(BASELINES_DIR, f"{name_or_path}.json")
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write(path: str, report: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Микробенчмарки правил, валидаторов и сериализации")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Замерить и записать отчёт")
+    p_run.add_argument("--group", action="append", choices=list(GROUPS), help="Группа (можно несколько)")
+    p_run.add_argument("--filter", default=None, help="Подстрока имени бенчмарка")
+    p_run.add_argument("--seed", type=int, default=1, help="Seed генерации корпусов")
+    p_run.add_argument("--repeats", type=int, default=7, help="Повторов на бенчмарк")
+    p_run.add_argument("--min-time", type=float, default=0.2, help="Минимальная длительность повтора, с")
+    p_run.add_argument("--output", default=None, help="Файл отчёта")
+    p_run.add_argument("--save-baseline", default=None, metavar="NAME", help="Сохранить как bench/baselines/NAME.json")
+    p_run.add_argument("--compare", default=None, metavar="BASELINE", help="Сразу сравнить с baseline (имя или путь)")
+    p_run.add_argument("--threshold", type=float, default=0.05, help="Порог изменения для --compare")
+
+    p_cmp = sub.add_parser("compare", help="Сравнить два отчёта")
+    p_cmp.add_argument("base", help="Baseline: имя в bench/baselines или путь к JSON")
+    p_cmp.add_argument("new", help="Новый отчёт: имя или путь")
+    p_cmp.add_argument("--threshold", type=float, default=0.05, help="Минимальное значимое изменение (доля)")
+    p_cmp.add_argument("--fail-on-regression", action="store_true", help="Код выхода 1, если есть замедления")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run(args)
+        if args.output:
+            _write(args.output, report)
+        if args.save_baseline:
+            _write(_baseline_path(args.save_baseline), report)
+        if args.compare:
+            print(format_comparison(compare(_load(_baseline_path(args.compare)), report, args.threshold)))
+        return 0
+    rows = compare(_load(_baseline_path(args.base)), _load(_baseline_path(args.new)), args.threshold)
+    print(format_comparison(rows))
+    if args.fail_on_regression and any(r["status"] == "slower" for r in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Данные и сценарий нагрузочного прогона: проект с полями и валидаторами, две формы, процесс
+start → step_1 → step_2 → end и пользователи с ролью; сценарий документа — start → current-form → save → submit
+по каждому шагу до завершения. Все данные создаются через API (как их создаёт администратор в UI),
+значения форм — из random.Random(seed), чтобы прогоны при одинаковых параметрах были воспроизводимы.
+"""
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+
+import httpx
+
+FIELD_VISIBILITY_CODE = """
+def validate(context):
+    if context.get("amount", 0) > 1000:
+        return {"comment": "write", "category": "read"}
+    return {"comment": "write"}
+"""
+
+STEP_ACCESS_CODE = """
+def validate(context, node_id):
+    return context.get("amount", 0) >= 0
+"""
+
+CATEGORIES = ["goods", "services", "travel", "other"]
+
+
+@dataclass
+class SeededData:
+    project_id: str
+    process_id: str
+    user_tokens: list[str] = field(default_factory=list)
+
+
+class ApiError(Exception):
+    def __init__(self, operation: str, status_code: int, body: str):
+        super().__init__(f"{operation}: HTTP {status_code}: {body[:200]}")
+        self.operation = operation
+        self.status_code = status_code
+
+
+def _check(operation: str, response: httpx.Response) -> dict:
+    if response.status_code >= 400:
+        raise ApiError(operation, response.status_code, response.text)
+    return response.json() if response.content else {}
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    data = _check("login", await client.post("/api/identity/login", json={"email": email, "password": password}))
+    return data["access_token"]
+
+
+async def seed(client: httpx.AsyncClient, admin_token: str, users: int, password: str, run_id: str) -> SeededData:
+    """Создаёт проект, формы, процесс, роль и пользователей. run_id делает имена уникальными между прогонами."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    role = _check(
+        "seed role", await client.post("/api/identity/roles", json={"name": f"bench-{run_id}"}, headers=headers)
+    )
+    project = _check(
+        "seed project",
+        await client.post(
+            "/api/projects",
+            headers=headers,
+            json={
+                "name": f"Bench {run_id}",
+                "list_columns": ["document_number", "process_name", "status", "customer", "amount"],
+                "fields": [
+                    {"key": "customer", "label": "Контрагент", "field_type": "text"},
+                    {"key": "amount", "label": "Сумма", "field_type": "number"},
+                    {
+                        "key": "category",
+                        "label": "Категория",
+                        "field_type": "select",
+                        "options": [{"value": c, "label": c} for c in CATEGORIES],
+                    },
+                    {"key": "comment", "label": "Комментарий", "field_type": "textarea"},
+                    {"key": "approved", "label": "Согласовано", "field_type": "boolean"},
+                ],
+                "validators": [
+                    {"key": "visibility", "name": "Видимость", "type": "field_visibility", "code": FIELD_VISIBILITY_CODE},
+                    {"key": "can_advance", "name": "Переход", "type": "step_access", "code": STEP_ACCESS_CODE},
+                ],
+            },
+        ),
+    )
+    form_request = _check(
+        "seed form",
+        await client.post(
+            "/api/forms",
+            headers=headers,
+            json={
+                "name": f"Bench request {run_id}",
+                "fields": [
+                    {"name": "customer", "label": "Контрагент", "field_type": "text", "required": True},
+                    {"name": "amount", "label": "Сумма", "field_type": "number", "required": True},
+                    {
+                        "name": "category",
+                        "label": "Категория",
+                        "field_type": "select",
+                        "options": [{"value": c, "label": c} for c in CATEGORIES],
+                    },
+                    {"name": "comment", "label": "Комментарий", "field_type": "textarea"},
+                ],
+            },
+        ),
+    )
+    form_approval = _check(
+        "seed form",
+        await client.post(
+            "/api/forms",
+            headers=headers,
+            json={
+                "name": f"Bench approval {run_id}",
+                "fields": [
+                    {"name": "approved", "label": "Согласовано", "field_type": "boolean"},
+                    {"name": "comment", "label": "Комментарий", "field_type": "textarea"},
+                ],
+            },
+        ),
+    )
+    process = _check(
+        "seed process",
+        await client.post(
+            "/api/processes",
+            headers=headers,
+            json={
+                "name": f"Bench process {run_id}",
+                "project_id": project["id"],
+                "nodes": [
+                    {"id": "start", "node_type": "start"},
+                    {
+                        "id": "step_1",
+                        "node_type": "step",
+                        "form_definition_id": form_request["id"],
+                        "validator_keys": ["visibility"],
+                    },
+                    {"id": "step_2", "node_type": "step", "form_definition_id": form_approval["id"]},
+                    {"id": "end", "node_type": "end"},
+                ],
+                "edges": [
+                    {"id": "e1", "source_node_id": "start", "target_node_id": "step_1"},
+                    {
+                        "id": "e2",
+                        "key": "to_approval",
+                        "source_node_id": "step_1",
+                        "target_node_id": "step_2",
+                        "condition_expression": "amount >= 0",
+                        "transition_validator_keys": ["can_advance"],
+                    },
+                    {"id": "e3", "source_node_id": "step_2", "target_node_id": "end"},
+                ],
+            },
+        ),
+    )
+    seeded = SeededData(project_id=project["id"], process_id=process["id"])
+    for i in range(users):
+        email = f"bench-{run_id}-{i}@bench.local"
+        _check(
+            "seed user",
+            await client.post(
+                "/api/identity/users",
+                headers=headers,
+                json={"email": email, "password": password, "role_ids": [role["id"]]},
+            ),
+        )
+        seeded.user_tokens.append(await login(client, email, password))
+    return seeded
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:8]
+
+
+def step_data(rng: random.Random, node_id: str) -> dict:
+    if node_id == "step_1":
+        return {
+            "customer": f"Контрагент {rng.randint(1, 500)}",
+            "amount": rng.choice([rng.randint(1, 1000), rng.randint(1001, 50000)]),
+            "category": rng.choice(CATEGORIES),
+            "comment": "x" * rng.randint(0, 400),
+        }
+    return {"approved": rng.random() < 0.8, "comment": "ok"}
+
+
+class Recorder:
+    """Длительности и ошибки по операциям (заполняется из run_flow)."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, dict[str, int]] = {}
+        self.measure_from = 0.0  # time.perf_counter(): запросы, начатые раньше (прогрев), не учитываются
+
+    async def call(self, operation: str, request) -> httpx.Response | None:
+        started = time.perf_counter()
+        measured = started >= self.measure_from
+        try:
+            response = await request
+        except httpx.HTTPError as e:
+            if measured:
+                self._error(operation, type(e).__name__)
+            return None
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            if measured:
+                self._error(operation, str(response.status_code))
+            return None
+        if measured:
+            self.latencies.setdefault(operation, []).append(elapsed)
+        return response
+
+    def _error(self, operation: str, kind: str) -> None:
+        errors = self.errors.setdefault(operation, {})
+        errors[kind] = errors.get(kind, 0) + 1
+
+
+async def run_flow(
+    client: httpx.AsyncClient,
+    token: str,
+    seeded: SeededData,
+    rng: random.Random,
+    recorder: Recorder,
+    list_documents: bool,
+) -> bool:
+    """Один документ от старта до завершения. False — сценарий прерван ошибкой."""
+    headers = {"Authorization": f"Bearer {token}"}
+    started = await recorder.call(
+        "start", client.post(f"/api/runtime/processes/{seeded.process_id}/start", headers=headers)
+    )
+    if started is None:
+        return False
+    instance_id = started.json()["instance_id"]
+    while True:
+        current = await recorder.call(
+            "current_form",
+            client.get(f"/api/runtime/instances/{instance_id}/current-form?catalog_refs=true", headers=headers),
+        )
+        if current is None:
+            return False
+        node_id = current.json()["node_id"]
+        data = step_data(rng, node_id)
+        saved = await recorder.call(
+            "save",
+            client.post(f"/api/runtime/instances/{instance_id}/nodes/{node_id}/save", json={"data": data}, headers=headers),
+        )
+        if saved is None:
+            return False
+        submitted = await recorder.call(
+            "submit",
+            client.post(f"/api/runtime/instances/{instance_id}/nodes/{node_id}/submit", json={"data": data}, headers=headers),
+        )
+        if submitted is None:
+            return False
+        if submitted.json().get("completed"):
+            break
+    if list_documents:
+        listed = await recorder.call(
+            "list_documents",
+            client.get(f"/api/runtime/documents?project_id={seeded.project_id}", headers=headers),
+        )
+        if listed is None:
+            return False
+    return True
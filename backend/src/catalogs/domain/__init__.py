@@ -1,3 +1,3 @@
-from .catalog import Catalog, CatalogItem
+from .catalog import Catalog, CatalogItem, CatalogSummary
 
-__all__ = ["Catalog", "CatalogItem"]
+__all__ = ["Catalog", "CatalogItem", "CatalogSummary"]
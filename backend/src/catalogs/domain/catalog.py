@@ -14,3 +14,13 @@ class Catalog:
     name: str
     description: str
     items: list[CatalogItem]
+    version: int = 1  # увеличивается при каждом изменении (ключ кэша определений)
+
+
+@dataclass
+class CatalogSummary:
+    """Справочник без элементов — для списков (элементов может быть десятки тысяч)."""
+    id: UUID
+    name: str
+    description: str
+    item_count: int = 0
@@ -1,14 +1,16 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
-from src.database import get_session
-from src.catalogs.infrastructure.repository import CatalogRepository
+from src.database import get_read_session, get_session
+from src.catalogs.infrastructure.repository import SEARCH_LIMIT_DEFAULT, SEARCH_LIMIT_MAX, CatalogRepository
 from src.identity.domain import User
-from src.identity.infrastructure.deps import require_admin
+from src.identity.infrastructure.deps import get_current_user_required, require_admin
+from src.json_response import FastJSONResponse
+from src.observability.routing import TracedRoute
 
-router = APIRouter(prefix="/api/catalogs", tags=["catalogs"])
+router = APIRouter(prefix="/api/catalogs", tags=["catalogs"], route_class=TracedRoute)
 
 
 class CatalogItemSchema(BaseModel):
@@ -33,19 +35,66 @@ class CatalogResponse(BaseModel):
     name: str
     description: str
     items: list[dict]
+    version: int
 
 
-def get_catalog_repo(session=Depends(get_session)) -> CatalogRepository:
+class CatalogSummaryResponse(BaseModel):
+    id: str
+    name: str
+    description: str
+    item_count: int
+
+
+class CatalogItemsPage(BaseModel):
+    items: list[CatalogItemSchema]
+    next_cursor: int | None = None  # передать как cursor для следующей страницы; None — страниц больше нет
+
+
+def get_catalog_repo(session=Depends(get_session, scope="function")) -> CatalogRepository:
+    return CatalogRepository(session)
+
+
+def get_read_catalog_repo(session=Depends(get_read_session, scope="function")) -> CatalogRepository:
+    """Для GET-обработчиков: чтение с реплики, если она настроена."""
     return CatalogRepository(session)
 
 
+# Ответ закрыт авторизацией и должен перепроверяться при каждом использовании (If-None-Match -> 304)
+_CACHE_CONTROL = "private, no-cache"
+
+
+def catalog_etag(catalog_id: UUID, version: int) -> str:
+    """Сильный ETag: содержимое справочника полностью определяется (id, version)."""
+    return f'"{catalog_id}-{version}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Слабое сравнение (RFC 9110): сжатый ответ уходит с W/"..." (см. src.compression)
+    return etag in (t.strip().removeprefix("W/") for t in if_none_match.split(","))
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+    return None
+
+
+def _catalog_to_dict(c) -> dict:
+    return {
+        "id": str(c.id),
+        "name": c.name,
+        "description": c.description,
+        "items": [{"value": i.value, "label": i.label} for i in c.items],
+        "version": c.version,
+    }
+
+
 def _catalog_to_response(c) -> CatalogResponse:
-    return CatalogResponse(
-        id=str(c.id),
-        name=c.name,
-        description=c.description,
-        items=[{"value": i.value, "label": i.label} for i in c.items],
-    )
+    return CatalogResponse(**_catalog_to_dict(c))
 
 
 @router.post("", response_model=CatalogResponse)
@@ -59,25 +108,78 @@ async def create_catalog(
     return _catalog_to_response(catalog)
 
 
-@router.get("", response_model=list[CatalogResponse])
+@router.get("", response_model=list[CatalogSummaryResponse])
 async def list_catalogs(
     _admin: User = Depends(require_admin),
-    repo: CatalogRepository = Depends(get_catalog_repo),
+    repo: CatalogRepository = Depends(get_read_catalog_repo),
+):
+    """Список без элементов (элементы — GET /{catalog_id} или поиск /{catalog_id}/items)."""
+    catalogs = await repo.list_summaries()
+    return [
+        CatalogSummaryResponse(id=str(c.id), name=c.name, description=c.description, item_count=c.item_count)
+        for c in catalogs
+    ]
+
+
+@router.get("/{catalog_id}/items", response_model=CatalogItemsPage)
+async def search_catalog_items(
+    catalog_id: UUID,
+    request: Request,
+    response: Response,
+    q: str = Query("", description="Подстрока названия или префикс значения"),
+    limit: int = Query(SEARCH_LIMIT_DEFAULT, ge=1, le=SEARCH_LIMIT_MAX),
+    cursor: int | None = Query(None, description="next_cursor предыдущей страницы"),
+    values: list[str] = Query(
+        [],
+        description="Точные значения (?values=a&values=b) — подписи сохранённых значений; q и cursor не учитываются",
+    ),
+    _user: User = Depends(get_current_user_required),
+    repo: CatalogRepository = Depends(get_read_catalog_repo),
 ):
-    catalogs = await repo.list_all()
-    return [_catalog_to_response(c) for c in catalogs]
+    """Поиск по элементам справочника для полей формы с catalog_remote (варианты не приходят с формой),
+    либо элементы по значениям (values) — чтобы показать подписи у уже выбранных значений открытого документа.
+    Результат для тех же параметров меняется только с версией справочника — ETag по версии."""
+    version = (await repo.get_versions([catalog_id])).get(catalog_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Catalog not found")
+    etag = catalog_etag(catalog_id, version)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    if values:
+        items, next_cursor = await repo.get_items_by_values(catalog_id, values), None
+    else:
+        items, next_cursor = await repo.search_items(catalog_id, q=q, limit=limit, cursor=cursor)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return CatalogItemsPage(
+        items=[CatalogItemSchema(value=i.value, label=i.label) for i in items],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/{catalog_id}", response_model=CatalogResponse)
 async def get_catalog(
     catalog_id: UUID,
-    _admin: User = Depends(require_admin),
-    repo: CatalogRepository = Depends(get_catalog_repo),
+    request: Request,
+    _user: User = Depends(get_current_user_required),
+    repo: CatalogRepository = Depends(get_read_catalog_repo),
 ):
+    """Справочник целиком. Доступен всем пользователям: формы ссылаются на справочники как id@version
+    (см. current-form?catalog_refs=true), клиент загружает и кэширует их сам."""
+    version = (await repo.get_versions([catalog_id])).get(catalog_id)
+    if version is not None:
+        not_modified = _not_modified(request, catalog_etag(catalog_id, version))
+        if not_modified is not None:
+            return not_modified
     catalog = await repo.get_by_id(catalog_id)
     if not catalog:
         raise HTTPException(status_code=404, detail="Catalog not found")
-    return _catalog_to_response(catalog)
+    # Справочник может содержать тысячи элементов: отдаём dict напрямую, без повторной валидации по CatalogResponse
+    return FastJSONResponse(
+        _catalog_to_dict(catalog),
+        headers={"ETag": catalog_etag(catalog_id, catalog.version), "Cache-Control": _CACHE_CONTROL},
+    )
 
 
 @router.patch("/{catalog_id}", response_model=CatalogResponse)
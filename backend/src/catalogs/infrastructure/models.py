@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text
+from sqlalchemy import DDL, Index, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.identity.infrastructure.models import Base, gen_uuid
@@ -10,4 +10,40 @@ class CatalogModel(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=gen_uuid)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
-    items_schema: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+
+class CatalogItemModel(Base):
+    """Элемент справочника. position — порядок в справочнике и курсор постраничного поиска."""
+    __tablename__ = "catalog_items"
+    __table_args__ = (
+        # Поиск подстроки в названии (ILIKE '%q%'); требует расширения pg_trgm (миграция 011, для create_all —
+        # событие before_create ниже)
+        Index(
+            "ix_catalog_items_label_trgm",
+            "label",
+            postgresql_using="gin",
+            postgresql_ops={"label": "gin_trgm_ops"},
+        ),
+        # Поиск по префиксу значения (LIKE 'q%') и точное совпадение значения
+        Index(
+            "ix_catalog_items_catalog_value",
+            "catalog_id",
+            "value",
+            postgresql_ops={"value": "text_pattern_ops"},
+        ),
+    )
+
+    catalog_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+    label: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+# init_db / bpm db-init создают схему через create_all, минуя миграции: расширение для gin_trgm_ops ставится
+# перед созданием таблицы (и её индексов)
+event.listen(
+    CatalogItemModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
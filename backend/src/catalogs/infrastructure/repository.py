@@ -1,52 +1,192 @@
-import json
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.catalogs.domain import Catalog, CatalogItem
-from src.catalogs.infrastructure.models import CatalogModel
+from src.catalogs.domain import Catalog, CatalogItem, CatalogSummary
+from src.catalogs.infrastructure.models import CatalogItemModel, CatalogModel
+from src.definition_cache import KIND_CATALOG, cache_definition, definition_cache, evict_definition
+from src.observability.tracing import traced_methods
 
+# Сколько элементов справочника отдаёт поиск за один запрос
+SEARCH_LIMIT_DEFAULT = 20
+SEARCH_LIMIT_MAX = 100
 
-def _deserialize_catalog(row: CatalogModel) -> Catalog:
-    items_data = json.loads(row.items_schema) if row.items_schema else []
-    items = [
-        CatalogItem(value=str(x.get("value", "")), label=str(x.get("label", x.get("value", ""))))
-        for x in items_data
-    ]
+
+def _deserialize_catalog(row: CatalogModel, items: list[CatalogItem]) -> Catalog:
     return Catalog(
         id=UUID(row.id),
         name=row.name,
         description=row.description or "",
         items=items,
+        version=getattr(row, "version", None) or 1,
     )
 
 
+def _item_rows(catalog_id: str, items: list[dict]) -> list[dict]:
+    return [
+        {
+            "catalog_id": catalog_id,
+            "position": i,
+            "value": str(x.get("value", "")),
+            "label": str(x.get("label", x.get("value", ""))),
+        }
+        for i, x in enumerate(items, start=1)
+    ]
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@traced_methods("repository")
 class CatalogRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    async def _load_items(self, catalog_ids: list[str]) -> dict[str, list[CatalogItem]]:
+        out: dict[str, list[CatalogItem]] = {cid: [] for cid in catalog_ids}
+        if not catalog_ids:
+            return out
+        result = await self._session.execute(
+            select(CatalogItemModel.catalog_id, CatalogItemModel.value, CatalogItemModel.label)
+            .where(CatalogItemModel.catalog_id.in_(catalog_ids))
+            .order_by(CatalogItemModel.catalog_id, CatalogItemModel.position)
+        )
+        for r in result.all():
+            out[r.catalog_id].append(CatalogItem(value=r.value, label=r.label))
+        return out
+
+    async def _replace_items(self, catalog_id: str, items: list[dict]) -> None:
+        await self._session.execute(delete(CatalogItemModel).where(CatalogItemModel.catalog_id == catalog_id))
+        rows = _item_rows(catalog_id, items)
+        if rows:
+            await self._session.execute(insert(CatalogItemModel), rows)
+
     async def create(self, name: str, description: str = "", items: list[dict] | None = None) -> Catalog:
-        schema = json.dumps(items or [])
-        model = CatalogModel(name=name, description=description, items_schema=schema)
+        model = CatalogModel(name=name, description=description)
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
-        return _deserialize_catalog(model)
+        await self._replace_items(model.id, items or [])
+        return _deserialize_catalog(model, (await self._load_items([model.id]))[model.id])
 
     async def get_by_id(self, catalog_id: UUID) -> Catalog | None:
+        cached = definition_cache.get(KIND_CATALOG, catalog_id)
+        if cached is not None:
+            return cached
         result = await self._session.execute(
             select(CatalogModel).where(CatalogModel.id == str(catalog_id))
         )
         row = result.scalar_one_or_none()
         if not row:
             return None
-        return _deserialize_catalog(row)
+        catalog = _deserialize_catalog(row, (await self._load_items([row.id]))[row.id])
+        cache_definition(self._session, KIND_CATALOG, catalog_id, catalog.version, catalog)
+        return catalog
+
+    async def get_versions(self, catalog_ids: list[UUID]) -> dict[UUID, int]:
+        """Текущие версии справочников (без загрузки элементов): из кэша, остальные — одним запросом IN."""
+        out: dict[UUID, int] = {}
+        missing: list[str] = []
+        for catalog_id in dict.fromkeys(catalog_ids):
+            version = definition_cache.get_version(KIND_CATALOG, catalog_id)
+            if version is not None:
+                out[catalog_id] = version
+            else:
+                missing.append(str(catalog_id))
+        if missing:
+            result = await self._session.execute(
+                select(CatalogModel.id, CatalogModel.version).where(CatalogModel.id.in_(missing))
+            )
+            for r in result.all():
+                out[UUID(r.id)] = r.version or 1
+        return out
 
-    async def list_all(self) -> list[Catalog]:
-        result = await self._session.execute(select(CatalogModel).order_by(CatalogModel.name))
-        rows = result.scalars().all()
-        return [_deserialize_catalog(r) for r in rows]
+    async def get_many(self, catalog_ids: list[UUID]) -> dict[UUID, Catalog]:
+        """Справочники по списку id: из кэша, недостающие — одним запросом IN. Несуществующие id пропускаются."""
+        out: dict[UUID, Catalog] = {}
+        missing: list[str] = []
+        for catalog_id in dict.fromkeys(catalog_ids):
+            cached = definition_cache.get(KIND_CATALOG, catalog_id)
+            if cached is not None:
+                out[catalog_id] = cached
+            else:
+                missing.append(str(catalog_id))
+        if missing:
+            result = await self._session.execute(select(CatalogModel).where(CatalogModel.id.in_(missing)))
+            rows = result.scalars().all()
+            items = await self._load_items([r.id for r in rows])
+            for row in rows:
+                catalog = _deserialize_catalog(row, items[row.id])
+                out[catalog.id] = catalog
+                cache_definition(self._session, KIND_CATALOG, catalog.id, catalog.version, catalog)
+        return out
+
+    async def list_summaries(self) -> list[CatalogSummary]:
+        """Справочники без элементов, с числом элементов."""
+        counts = (
+            select(CatalogItemModel.catalog_id, func.count().label("item_count"))
+            .group_by(CatalogItemModel.catalog_id)
+            .subquery()
+        )
+        result = await self._session.execute(
+            select(CatalogModel.id, CatalogModel.name, CatalogModel.description, counts.c.item_count)
+            .outerjoin(counts, counts.c.catalog_id == CatalogModel.id)
+            .order_by(CatalogModel.name)
+        )
+        return [
+            CatalogSummary(
+                id=UUID(r.id),
+                name=r.name,
+                description=r.description or "",
+                item_count=r.item_count or 0,
+            )
+            for r in result.all()
+        ]
+
+    async def search_items(
+        self,
+        catalog_id: UUID,
+        q: str = "",
+        limit: int = SEARCH_LIMIT_DEFAULT,
+        cursor: int | None = None,
+    ) -> tuple[list[CatalogItem], int | None]:
+        """Элементы справочника, у которых название содержит q (без учёта регистра) или значение начинается с q,
+        в порядке справочника. cursor — position последнего элемента предыдущей страницы.
+        Возвращает (элементы, курсор следующей страницы или None)."""
+        limit = max(1, min(limit, SEARCH_LIMIT_MAX))
+        stmt = (
+            select(CatalogItemModel.position, CatalogItemModel.value, CatalogItemModel.label)
+            .where(CatalogItemModel.catalog_id == str(catalog_id))
+            .order_by(CatalogItemModel.position)
+            .limit(limit + 1)
+        )
+        q = q.strip()
+        if q:
+            pattern = _escape_like(q)
+            stmt = stmt.where(or_(
+                CatalogItemModel.label.ilike(f"%{pattern}%", escape="\\"),
+                CatalogItemModel.value.like(f"{pattern}%", escape="\\"),
+            ))
+        if cursor is not None:
+            stmt = stmt.where(CatalogItemModel.position > cursor)
+        rows = (await self._session.execute(stmt)).all()
+        next_cursor = rows[limit - 1].position if len(rows) > limit else None
+        return [CatalogItem(value=r.value, label=r.label) for r in rows[:limit]], next_cursor
+
+    async def get_items_by_values(self, catalog_id: UUID, values: list[str]) -> list[CatalogItem]:
+        """Элементы справочника с данными значениями (подписи уже сохранённых в документе значений),
+        в порядке справочника; индекс (catalog_id, value). Не больше SEARCH_LIMIT_MAX значений."""
+        values = list(dict.fromkeys(values))[:SEARCH_LIMIT_MAX]
+        if not values:
+            return []
+        result = await self._session.execute(
+            select(CatalogItemModel.value, CatalogItemModel.label)
+            .where(CatalogItemModel.catalog_id == str(catalog_id), CatalogItemModel.value.in_(values))
+            .order_by(CatalogItemModel.position)
+        )
+        return [CatalogItem(value=r.value, label=r.label) for r in result.all()]
 
     async def update(
         self,
@@ -66,10 +206,12 @@ class CatalogRepository:
         if description is not None:
             row.description = description
         if items is not None:
-            row.items_schema = json.dumps(items)
+            await self._replace_items(row.id, items)
+        row.version = (row.version or 1) + 1
+        evict_definition(self._session, KIND_CATALOG, catalog_id)
         await self._session.flush()
         await self._session.refresh(row)
-        return _deserialize_catalog(row)
+        return _deserialize_catalog(row, (await self._load_items([row.id]))[row.id])
 
     async def delete(self, catalog_id: UUID) -> bool:
         result = await self._session.execute(
@@ -78,6 +220,8 @@ class CatalogRepository:
         row = result.scalar_one_or_none()
         if not row:
             return False
+        await self._session.execute(delete(CatalogItemModel).where(CatalogItemModel.catalog_id == row.id))
         await self._session.delete(row)
+        evict_definition(self._session, KIND_CATALOG, catalog_id)
         await self._session.flush()
         return True
@@ -1,5 +1,5 @@
 """
-CLI для BPM: инициализация БД, пользователи, роли, миграции Alembic.
+CLI для BPM: инициализация и миграции БД, пользователи, роли, синтетические данные.
 Запуск: bpm <команда> или python -m src.cli <команда>
 """
 import asyncio
@@ -33,6 +33,75 @@ def db_init():
     _run(_init())
 
 
+@app.command()
+def db_upgrade():
+    """Применить миграции Alembic, создать недостающие таблицы и роль admin. Выполняется один раз на деплой
+    перед запуском воркеров (с DB_STARTUP_MODE=check воркеры только сверяют ревизию схемы)."""
+    from src.migrations import upgrade_schema
+
+    revision = upgrade_schema()
+    typer.echo(f"Схема БД обновлена до ревизии {revision}.")
+
+
+@app.command()
+def db_check():
+    """Сверить ревизию схемы в БД с head миграций этой сборки (код выхода 1 при расхождении)."""
+    from src.migrations import SchemaRevisionMismatch, check_schema_revision
+
+    try:
+        revision = _run(check_schema_revision())
+    except SchemaRevisionMismatch as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(1)
+    typer.echo(f"Схема БД актуальна (ревизия {revision}).")
+
+
+@app.command()
+def seed(
+    projects: int = typer.Option(2, help="Проектов"),
+    processes: int = typer.Option(3, help="Процессов на проект"),
+    forms: int = typer.Option(4, help="Форм на проект"),
+    fields: int = typer.Option(20, help="Полей в форме (не меньше 2)"),
+    steps: int = typer.Option(6, help="Шагов в основной ветке процесса"),
+    shape: str = typer.Option("mixed", help="Форма графа: linear, branching, loop, mixed"),
+    instances: int = typer.Option(10_000, help="Документов (экземпляров процессов) всего"),
+    completed_share: float = typer.Option(0.6, help="Доля завершённых документов"),
+    text_size: int = typer.Option(120, help="Средняя длина текстовых значений"),
+    seed_value: int = typer.Option(1, "--seed", help="Seed генератора: одинаковый seed — одинаковые данные"),
+    batch_size: int = typer.Option(5_000, help="Документов в одной пачке COPY"),
+):
+    """Засеять БД синтетическими данными для проверок на объёме (списки, индексы, миграции)."""
+    from src.config import settings
+    from src.seeding import SeedConflict, SeedSpec, seed_database
+
+    try:
+        spec = SeedSpec(
+            projects=projects,
+            processes=processes,
+            forms=forms,
+            fields=fields,
+            steps=steps,
+            shape=shape,
+            instances=instances,
+            completed_share=completed_share,
+            text_size=text_size,
+            seed=seed_value,
+            batch_size=batch_size,
+        )
+
+        def progress(report):
+            typer.echo(f"  документов: {report.instances}/{instances}, отправок форм: {report.submissions}")
+
+        report = _run(seed_database(spec, settings.database_url, progress))
+    except (SeedConflict, ValueError) as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(1)
+    typer.echo(
+        f"Засеяно: проектов {report.projects}, форм {report.forms}, процессов {report.processes}, "
+        f"документов {report.instances}, отправок форм {report.submissions}."
+    )
+
+
 user_app = typer.Typer(help="Пользователи")
 app.add_typer(user_app, name="user")
 
@@ -148,5 +217,34 @@ def migration(
         raise typer.Exit(code)
 
 
+@app.command()
+def import_time(top: int = typer.Option(15, help="Сколько самых медленных модулей показать")):
+    """Время импорта приложения (src.main) в чистом процессе — часть холодного старта воркера до lifespan.
+    Замер через python -X importtime; время самого lifespan воркер пишет в лог при старте."""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = backend_dir
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=backend_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        typer.echo(result.stderr, err=True)
+        raise typer.Exit(result.returncode)
+    # Строки вида "import time:   self [us] | cumulative | imported package"
+    modules = []
+    for line in result.stderr.splitlines():
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) == 3 and parts[0].strip().isdigit():
+            modules.append((int(parts[0]), int(parts[1]), parts[2].strip()))
+    total = next((cumulative for _, cumulative, name in modules if name == "src.main"), 0)
+    typer.echo(f"Импорт src.main: {total / 1000:.0f} ms")
+    for self_us, cumulative, name in sorted(modules, reverse=True)[:top]:
+        typer.echo(f"{self_us / 1000:8.1f} ms  (всего {cumulative / 1000:8.1f} ms)  {name}")
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,178 @@
+"""
+Сжатие ответов (ASGI-middleware): brotli, если установлен пакет brotli и клиент его принимает, иначе gzip.
+Ответы меньше minimum_size, уже сжатые (Content-Encoding или сжатый формат: изображения, архивы,
+octet-stream) и потоки событий не трогаются. Сильный ETag при сжатии становится
+слабым (W/"..."): байты ответа зависят от кодировки, а сравнение If-None-Match — слабое (см. catalogs api).
+"""
+from __future__ import annotations
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - зависит от окружения
+    brotli = None
+
+
+# Форматы, которые уже сжаты сами по себе: повторное сжатие тратит CPU без выигрыша в размере
+_INCOMPRESSIBLE_PREFIXES = ("image/", "audio/", "video/", "font/woff")
+_INCOMPRESSIBLE_TYPES = {
+    "application/octet-stream",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+    "application/pdf",
+}
+_COMPRESSIBLE_IMAGES = {"image/svg+xml", "image/x-icon", "image/bmp"}
+
+
+def is_compressible(content_type: str) -> bool:
+    """Стоит ли сжимать тело с этим Content-Type (параметры вроде charset не учитываются)."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == "text/event-stream" or media_type in _INCOMPRESSIBLE_TYPES:
+        return False
+    return media_type in _COMPRESSIBLE_IMAGES or not media_type.startswith(_INCOMPRESSIBLE_PREFIXES)
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._c = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: заголовок и CRC gzip
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.compress(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._c.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._c = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.process(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush()
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Кодировки из Accept-Encoding с q > 0."""
+    out = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name and q > 0:
+            out.add(name.strip().lower())
+    return out
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose(self, scope: Scope) -> str | None:
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = self._choose(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self._middleware = middleware
+        self._encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._compressor: _GzipCompressor | _BrotliCompressor | None = None
+        self._passthrough = False
+
+    def _new_compressor(self):
+        if self._encoding == "br":
+            return _BrotliCompressor(self._middleware.brotli_quality)
+        return _GzipCompressor(self._middleware.gzip_level)
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Заголовки отправляются вместе с первым куском тела: от него зависит, сжимать ли ответ
+            self._start = {**message, "headers": list(message.get("headers", []))}
+            headers = Headers(raw=self._start["headers"])
+            self._passthrough = "content-encoding" in headers or not is_compressible(headers.get("content-type", ""))
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._compressor is None:
+            if not more_body and len(body) < self._middleware.minimum_size:
+                await self._flush_start()
+                await self._send(message)
+                self._passthrough = True
+                return
+            self._compressor = self._new_compressor()
+            headers = MutableHeaders(raw=self._start["headers"])
+            self._set_encoding_headers(headers)
+            if more_body:
+                del headers["Content-Length"]
+                chunk = self._compressor.compress(body) + self._compressor.flush()
+            else:
+                chunk = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(chunk))
+            await self._flush_start()
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+        if more_body:
+            chunk = self._compressor.compress(body) + self._compressor.flush()
+        else:
+            chunk = self._compressor.compress(body) + self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
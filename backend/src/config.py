@@ -1,11 +1,61 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     database_url: str  # обязательна, в Docker задаётся через DATABASE_URL (PostgreSQL)
+    # Реплика для GET-эндпоинтов (DATABASE_READ_URL); не задана — всё читается с primary
+    database_read_url: str | None = None
+    # Сколько секунд после записи клиент читает с primary (read-your-writes); должно превышать лаг реплики
+    database_read_fallback_seconds: float = 5.0
     secret_key: str = "change-me-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # Кэш пользователя и ролей по sub токена (сек); 0 — каждый запрос читает пользователя из БД
+    principal_cache_ttl: float = 60.0
+    # Хэширование паролей: стоимость bcrypt (влияет только на новые хэши), потоки пула и длина очереди
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 64
+    # Пул соединений с БД (на воркер): всего до db_pool_size + db_max_overflow соединений
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # сек ожидания свободного соединения
+    db_pool_recycle: int = -1  # сек жизни соединения; -1 — без ограничения
+    db_pool_pre_ping: bool = False
+    # asyncpg: кэш подготовленных выражений самого asyncpg и SQLAlchemy-адаптера (0 — выключить, нужно за PgBouncer
+    # в режиме transaction)
+    db_statement_cache_size: int = 100
+    db_prepared_statement_cache_size: int = 100
+    # Схема БД при старте воркера: create — create_all и роль admin (локальная разработка);
+    # check — только сверка ревизии Alembic (схему меняет `bpm db-upgrade`); none — ничего не делать
+    db_startup_mode: Literal["create", "check", "none"] = "create"
+    # GET /metrics (Prometheus): по умолчанию только с loopback (агент на той же машине / в том же поде);
+    # metrics_enabled=false отключает только метрики: корневой спан трассы, учёт SQL-запросов запроса,
+    # Server-Timing и предупреждение о N+1 работают по своим настройкам
+    metrics_enabled: bool = True
+    metrics_allow_remote: bool = False
+    # Режим разработки: предупреждение в лог, если запрос выполнил одну форму SQL больше
+    # sql_repeat_warning_threshold раз (типичный N+1)
+    dev_mode: bool = False
+    sql_repeat_warning_threshold: int = 10
+    # Заголовок Server-Timing (время SQL-запросов и обработки) в каждом ответе
+    server_timing_enabled: bool = True
+    # Сжатие ответов больше compression_minimum_size байт: brotli (если установлен и принимается клиентом) или gzip
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4  # 0..11; выше — медленнее, для динамических ответов 4–5
+    # Трассировка запросов (спаны обработчиков, сервисов, репозиториев, валидаторов, SQL): последние
+    # tracing_buffer_size трасс в памяти воркера (GET /internal/traces); tracing_jsonl_path — дописывать трассы в файл
+    tracing_enabled: bool = True
+    tracing_buffer_size: int = 200
+    tracing_max_spans: int = 500
+    tracing_jsonl_path: str | None = None
+    # Кэш определений: LISTEN/NOTIFY между воркерами + периодическая сверка версий (сек)
+    definition_listener_enabled: bool = True
+    definition_cache_check_interval: float = 30.0
 
     class Config:
         env_file = ".env"
@@ -1,19 +1,60 @@
+import time
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from src.config import settings
+from src.definition_cache import REPLICA_LAG_KEY, evict_pending, pending_evictions
+from src.definition_listener import CHANNEL as DEFINITIONS_CHANNEL, notification_payload
 from src.identity.infrastructure.models import Base
+from src.observability.db_pool import InstrumentedAsyncQueuePool
+from src.observability.query_stats import record_query
+from src.observability.tracing import tracer
+from src.read_your_writes import mark_write, wrote_recently
 from src.form_builder.infrastructure.models import FormDefinitionModel  # noqa: F401 - register table
 from src.projects.infrastructure.models import ProjectModel  # noqa: F401 - register table
 from src.process_design.infrastructure.models import ProcessDefinitionModel  # noqa: F401 - register table
 from src.runtime.infrastructure.models import ProcessInstanceModel, FormSubmissionModel  # noqa: F401 - register tables
-from src.catalogs.infrastructure.models import CatalogModel  # noqa: F401 - register table
+from src.catalogs.infrastructure.models import CatalogModel, CatalogItemModel  # noqa: F401 - register tables
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_query_started", None)
+    if started is not None:
+        duration = time.perf_counter() - started
+        record_query(statement, duration)
+        tracer.record("sql", "db", started, duration, statement=statement[:300])
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    created = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
+    )
+    # Число и время SQL-запросов на HTTP-запрос (Server-Timing, метрики, предупреждение о N+1)
+    event.listen(created.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(created.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return created
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-)
+
+engine = _create_engine(settings.database_url)
 
 async_session_factory = async_sessionmaker(
     engine,
@@ -23,12 +64,58 @@ async_session_factory = async_sessionmaker(
     autoflush=False,
 )
 
+# Реплика только для чтения (GET-эндпоинты через get_read_session)
+read_engine = _create_engine(settings.database_read_url) if settings.database_read_url else None
+read_session_factory = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    if read_engine is not None
+    else None
+)
+
+_HAS_WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_writes(session: Session, _flush_context) -> None:
+    session.info[_HAS_WRITES_KEY] = True
+
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml_writes(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_changed_definitions(session: Session) -> None:
+    """NOTIFY остальным воркерам об изменённых определениях; PostgreSQL доставит уведомления только после commit."""
+    keys = pending_evictions(session.info)
+    if not keys or session.get_bind().dialect.name != "postgresql":
+        return
+    for kind, key in keys:
+        session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": DEFINITIONS_CHANNEL, "payload": notification_payload(kind, key)},
+        )
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _evict_changed_definitions(session: Session) -> None:
+    """Повторно сбрасывает кэш определений, изменённых в транзакции (см. src.definition_cache)."""
+    evict_pending(session.info)
+
+
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия для изменяющих эндпоинтов. Подключать как Depends(get_session, scope="function"): тогда commit
+    и отметка записи (src.read_your_writes) выполняются до отправки ответа — клиент получает ответ уже после
+    фиксации транзакции, а cookie с временем записи попадает в этот же ответ."""
     async with async_session_factory() as session:
         try:
             yield session
             await session.commit()
+            if session.info.get(_HAS_WRITES_KEY) and read_engine is not None:
+                mark_write(request)
         except Exception:
             await session.rollback()
             raise
@@ -36,6 +123,25 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия для GET-эндпоинтов: реплика, если задана DATABASE_READ_URL. Клиент, недавно писавший
+    (cookie из src.read_your_writes, database_read_fallback_seconds), читает с primary — чтобы видеть свои изменения.
+    Сессия не коммитится: в обработчиках чтения записей быть не должно. Подключается тоже со scope="function" —
+    соединение возвращается в пул до отправки тела ответа."""
+    if read_session_factory is None or wrote_recently(request):
+        factory = async_session_factory
+    else:
+        factory = read_session_factory
+    async with factory() as session:
+        if factory is read_session_factory:
+            # Реплика может отставать: не кэшировать определения, которые только что сбросили (см. cache_definition)
+            session.info[REPLICA_LAG_KEY] = settings.database_read_fallback_seconds
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,150 @@
+"""
+Кэш десериализованных определений (процессы, формы, проекты, справочники) на уровне процесса-воркера.
+Определения меняются редко, а читаются на каждом запросе runtime — чтение из кэша вместо БД и разбора JSON.
+Записи хранятся по (kind, id) вместе с версией строки; методы update/delete репозиториев вызывают evict_definition.
+Объекты из кэша общие для всех запросов — вызывающий код не должен их изменять.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Hashable
+
+KIND_PROCESS = "process"
+KIND_FORM = "form"
+KIND_PROJECT = "project"
+KIND_CATALOG = "catalog"
+# Только валидаторы проекта (для runtime), ключ — id проекта; сбрасываются вместе с проектом
+KIND_PROJECT_VALIDATORS = "project_validators"
+# Только колонки списка документов / только поля проекта — так же, как валидаторы
+KIND_PROJECT_LIST_COLUMNS = "project_list_columns"
+KIND_PROJECT_FIELDS = "project_fields"
+# Неизменяемые версии процессов: ключ (process_id, version), не инвалидируются
+KIND_PROCESS_VERSION = "process_version"
+# Пакеты исполнения (src.runtime.application.execution_bundle): сбрасываются вместе с формами/проектом, от которых зависят
+KIND_BUNDLE = "bundle"
+
+# Проекции определения под тем же ключом: сброс определения сбрасывает и их
+# (репозитории и NOTIFY оперируют только основным kind)
+DERIVED_KINDS: dict[str, tuple[str, ...]] = {
+    KIND_PROJECT: (KIND_PROJECT_VALIDATORS, KIND_PROJECT_LIST_COLUMNS, KIND_PROJECT_FIELDS),
+}
+
+_EVICT_ON_COMMIT_KEY = "definition_cache_evict"
+# session.info сессии реплики: допустимое отставание (сек), см. cache_definition
+REPLICA_LAG_KEY = "replica_lag"
+
+
+class DefinitionCache:
+    """Потокобезопасный словарь (kind, id) -> (version, value).
+    Запись может зависеть от других записей: при их сбросе она сбрасывается тоже."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, Hashable], tuple[Any, Any]] = {}
+        self._dependents: dict[tuple[str, Hashable], set[tuple[str, Hashable]]] = {}
+        self._invalidated_at: dict[tuple[str, Hashable], float] = {}
+        self._cleared_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, key: Hashable) -> Any | None:
+        entry = self._entries.get((kind, key))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def get_version(self, kind: str, key: Hashable) -> Any | None:
+        entry = self._entries.get((kind, key))
+        return entry[0] if entry is not None else None
+
+    def put(
+        self,
+        kind: str,
+        key: Hashable,
+        version: Any,
+        value: Any,
+        depends_on: dict[tuple[str, Hashable], Any] | None = None,
+    ) -> bool:
+        """Кладёт значение; более старая версия не вытесняет более новую (гонка параллельных чтений).
+        depends_on — {(kind, id): version} записей, из которых собрано значение: если какая-то из них
+        уже сброшена или сменила версию, значение устарело и не кэшируется. Возвращает True, если записано."""
+        with self._lock:
+            current = self._entries.get((kind, key))
+            if current is not None and version is not None and current[0] is not None and current[0] > version:
+                return False
+            for dep, dep_version in (depends_on or {}).items():
+                entry = self._entries.get(dep)
+                if entry is None or entry[0] != dep_version:
+                    return False
+            self._entries[(kind, key)] = (version, value)
+            for dep in depends_on or ():
+                self._dependents.setdefault(dep, set()).add((kind, key))
+            return True
+
+    def invalidate(self, kind: str, key: Hashable) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stack = [(kind, key)]
+            while stack:
+                k = stack.pop()
+                self._entries.pop(k, None)
+                self._invalidated_at[k] = now
+                stack.extend(self._dependents.pop(k, ()))
+                stack.extend((derived, k[1]) for derived in DERIVED_KINDS.get(k[0], ()))
+
+    def keys(self, kind: str | None = None) -> list[tuple[str, Hashable]]:
+        return [k for k in list(self._entries) if kind is None or k[0] == kind]
+
+    def invalidated_within(self, kind: str, key: Hashable, seconds: float) -> bool:
+        """Запись сбрасывалась (или кэш очищался) не раньше чем seconds назад."""
+        since = time.monotonic() - seconds
+        return self._cleared_at >= since or self._invalidated_at.get((kind, key), 0.0) >= since
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dependents.clear()
+            self._invalidated_at.clear()
+            self._cleared_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+definition_cache = DefinitionCache()
+
+
+def evict_definition(session, kind: str, key: Hashable) -> None:
+    """Сбрасывает запись сразу и ещё раз после commit сессии (см. src.database):
+    иначе параллельный запрос может успеть закэшировать старую, ещё не перезаписанную строку."""
+    definition_cache.invalidate(kind, key)
+    pending = session.info.setdefault(_EVICT_ON_COMMIT_KEY, set())
+    pending.add((kind, key))
+
+
+def cache_definition(session, kind: str, key: Hashable, version: Any, value: Any) -> None:
+    """Кладёт прочитанное определение в кэш, если оно не изменено в текущей (ещё не закоммиченной) транзакции."""
+    pending = session.info.get(_EVICT_ON_COMMIT_KEY, ())
+    if (kind, key) in pending:
+        return
+    if any((base, key) in pending for base, derived in DERIVED_KINDS.items() if kind in derived):
+        return
+    # Прочитано с реплики вскоре после изменения — строка может быть ещё старой
+    lag = session.info.get(REPLICA_LAG_KEY)
+    if lag and definition_cache.invalidated_within(kind, key, lag):
+        return
+    definition_cache.put(kind, key, version, value)
+
+
+def pending_evictions(info: dict) -> set[tuple[str, Hashable]]:
+    """Ключи определений, изменённых в текущей транзакции."""
+    return info.get(_EVICT_ON_COMMIT_KEY, set())
+
+
+def evict_pending(info: dict) -> None:
+    """Вызывается после commit: сбрасывает все записи, изменённые в транзакции."""
+    for kind, key in info.pop(_EVICT_ON_COMMIT_KEY, ()):
+        definition_cache.invalidate(kind, key)
@@ -0,0 +1,118 @@
+"""
+Согласованность кэша определений между воркерами/контейнерами.
+Репозитории при изменении определения отправляют NOTIFY bpm_definitions, '<kind>:<id>' (см. src.database);
+каждый воркер держит отдельное asyncpg-соединение с LISTEN и сбрасывает соответствующие записи кэша.
+Резервный механизм — периодическая сверка версий закэшированных записей с БД (на случай потерянных уведомлений).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.definition_cache import (
+    KIND_CATALOG,
+    KIND_FORM,
+    KIND_PROCESS,
+    KIND_PROJECT,
+    KIND_PROJECT_FIELDS,
+    KIND_PROJECT_LIST_COLUMNS,
+    KIND_PROJECT_VALIDATORS,
+    definition_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "bpm_definitions"
+
+# kind -> таблица с колонками id, version (для периодической сверки)
+VERSIONED_TABLES: dict[str, str] = {
+    KIND_PROCESS: "process_definitions",
+    KIND_FORM: "form_definitions",
+    KIND_PROJECT: "projects",
+    KIND_PROJECT_VALIDATORS: "projects",
+    KIND_PROJECT_LIST_COLUMNS: "projects",
+    KIND_PROJECT_FIELDS: "projects",
+    KIND_CATALOG: "catalogs",
+}
+
+_RECONNECT_DELAY_SEC = 5
+
+
+def notification_payload(kind: str, key) -> str:
+    return f"{kind}:{key}"
+
+
+def _parse_payload(payload: str) -> tuple[str, UUID | str] | None:
+    kind, sep, raw = payload.partition(":")
+    if not sep or not kind or not raw:
+        return None
+    try:
+        return kind, UUID(raw)
+    except ValueError:
+        return kind, raw
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    """postgresql+asyncpg://... -> postgresql://... для прямого подключения asyncpg."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class DefinitionInvalidationListener:
+    """Фоновая задача воркера: LISTEN на канал инвалидации + периодическая сверка версий."""
+
+    def __init__(self, database_url: str, check_interval: float = 30.0):
+        self._dsn = _asyncpg_dsn(database_url)
+        self._check_interval = check_interval
+
+    def _on_notification(self, _conn, _pid: int, _channel: str, payload: str) -> None:
+        parsed = _parse_payload(payload)
+        if parsed is None:
+            logger.warning("Unexpected %s payload: %r", CHANNEL, payload)
+            return
+        definition_cache.invalidate(*parsed)
+
+    async def check_versions(self, conn) -> int:
+        """Сбрасывает записи, версия которых в БД отличается (или строка удалена). Возвращает число сброшенных."""
+        evicted = 0
+        for kind, table in VERSIONED_TABLES.items():
+            keys = [key for _, key in definition_cache.keys(kind)]
+            if not keys:
+                continue
+            rows = await conn.fetch(
+                f"SELECT id, version FROM {table} WHERE id = ANY($1::varchar[])",
+                [str(k) for k in keys],
+            )
+            db_versions = {r["id"]: r["version"] for r in rows}
+            for key in keys:
+                if db_versions.get(str(key)) != definition_cache.get_version(kind, key):
+                    definition_cache.invalidate(kind, key)
+                    evicted += 1
+        return evicted
+
+    async def _listen_once(self) -> None:
+        conn = await asyncpg.connect(self._dsn)
+        try:
+            await conn.add_listener(CHANNEL, self._on_notification)
+            # Пока соединения не было, уведомления могли потеряться — начинаем с пустого кэша
+            definition_cache.clear()
+            while not conn.is_closed():
+                await asyncio.sleep(self._check_interval)
+                evicted = await self.check_versions(conn)
+                if evicted:
+                    logger.info("Definition cache: %d stale entries evicted by version check", evicted)
+        finally:
+            await conn.close()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Definition listener connection lost: %s; reconnecting", e)
+            await asyncio.sleep(_RECONNECT_DELAY_SEC)
@@ -1,8 +1,10 @@
 from uuid import UUID
 
+from src.observability.tracing import traced_methods
 from src.form_builder.domain import FormDefinition, FieldDefinition
 
 
+@traced_methods("service")
 class FormService:
     def __init__(self, form_repository):
         self._repo = form_repository
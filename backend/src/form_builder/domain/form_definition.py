@@ -37,6 +37,7 @@ class FieldDefinition:
     required: bool = False
     options: list[dict[str, Any]] | None = None  # для select/multiselect: [{"value": "a", "label": "A"}]
     catalog_id: str | None = None  # если задан — варианты берутся из справочника (options игнорируются при отдаче)
+    catalog_remote: bool = False  # варианты справочника не отдаются с формой — клиент ищет их через /api/catalogs/{id}/items
     validations: dict[str, Any] | None = None  # e.g. {"min": 0, "max": 100}
     access_rules: list[FieldAccessRule] = field(default_factory=list)  # правила видимости/редактирования
     width: int | None = None  # колонок из 12 (1-12), 12 = вся строка, 6 = половина, 4 = треть
@@ -48,6 +49,7 @@ class FormDefinition:
     name: str
     description: str
     fields: list[FieldDefinition] = field(default_factory=list)
+    version: int = 1  # увеличивается при каждом изменении (ключ кэша определений)
 
     def add_field(self, field: FieldDefinition) -> None:
         self.fields.append(field)
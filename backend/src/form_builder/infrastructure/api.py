@@ -3,14 +3,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from src.database import get_session
+from src.database import get_read_session, get_session
 from src.form_builder.application.form_service import FormService
 from src.form_builder.infrastructure.repository import FormDefinitionRepository
+from src.observability.routing import TracedRoute
 from src.projects.infrastructure.repository import ProjectRepository
 from src.identity.domain import User
 from src.identity.infrastructure.deps import require_admin
 
-router = APIRouter(prefix="/api/forms", tags=["forms"])
+router = APIRouter(prefix="/api/forms", tags=["forms"], route_class=TracedRoute)
 
 
 class FieldAccessRuleSchema(BaseModel):
@@ -26,6 +27,7 @@ class FieldSchema(BaseModel):
     required: bool = False
     options: list[dict] | None = None
     catalog_id: str | None = None
+    catalog_remote: bool = False  # варианты справочника ищутся на сервере, а не отдаются с формой
     validations: dict | None = None
     access_rules: list[FieldAccessRuleSchema] | None = None
     width: int | None = None  # колонок из 12 (1-12)
@@ -62,6 +64,7 @@ def _form_to_response(form, project_fields_map: dict[str, dict] | None = None) -
             "required": f.required,
             "options": f.options,
             "catalog_id": f.catalog_id,
+            "catalog_remote": f.catalog_remote,
             "validations": f.validations,
             "access_rules": [
                 {"role_id": r.role_id, "expression": r.expression, "permission": r.permission.value}
@@ -88,7 +91,7 @@ def _form_to_response(form, project_fields_map: dict[str, dict] | None = None) -
     )
 
 
-def get_form_repo(session=Depends(get_session)) -> FormDefinitionRepository:
+def get_form_repo(session=Depends(get_session, scope="function")) -> FormDefinitionRepository:
     return FormDefinitionRepository(session)
 
 
@@ -96,7 +99,12 @@ def get_form_service(repo: FormDefinitionRepository = Depends(get_form_repo)) ->
     return FormService(repo)
 
 
-def get_project_repo(session=Depends(get_session)) -> ProjectRepository:
+def get_read_form_service(session=Depends(get_read_session, scope="function")) -> FormService:
+    """Для GET-обработчиков: чтение с реплики, если она настроена."""
+    return FormService(FormDefinitionRepository(session))
+
+
+def get_read_project_repo(session=Depends(get_read_session, scope="function")) -> ProjectRepository:
     return ProjectRepository(session)
 
 
@@ -114,7 +122,7 @@ async def create_form(
 @router.get("", response_model=list[FormResponse])
 async def list_forms(
     _admin: User = Depends(require_admin),
-    service: FormService = Depends(get_form_service),
+    service: FormService = Depends(get_read_form_service),
 ):
     forms = await service.list_forms()
     return [_form_to_response(f) for f in forms]
@@ -125,8 +133,8 @@ async def get_form(
     form_id: UUID,
     project_id: UUID | None = Query(None, description="Опциональный ID проекта для синхронизации типов полей"),
     _admin: User = Depends(require_admin),
-    service: FormService = Depends(get_form_service),
-    project_repo: ProjectRepository = Depends(get_project_repo),
+    service: FormService = Depends(get_read_form_service),
+    project_repo: ProjectRepository = Depends(get_read_project_repo),
 ):
     form = await service.get_form(form_id)
     if not form:
@@ -134,14 +142,14 @@ async def get_form(
     
     project_fields_map = None
     if project_id:
-        project = await project_repo.get_by_id(project_id)
-        if project:
+        project_fields = await project_repo.get_fields(project_id)
+        if project_fields is not None:
             # Создаем словарь полей проекта для быстрого поиска
             project_fields_map = {pf.key: {
                 "field_type": pf.field_type,
                 "options": pf.options,
                 "catalog_id": pf.catalog_id,
-            } for pf in project.fields}
+            } for pf in project_fields}
     
     return _form_to_response(form, project_fields_map)
 
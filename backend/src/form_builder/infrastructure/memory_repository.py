@@ -0,0 +1,62 @@
+"""FormDefinitionRepository без БД: формы в словаре (бенчмарки, встроенный движок)."""
+from dataclasses import replace
+from uuid import UUID, uuid4
+
+from src.definition_cache import KIND_FORM, definition_cache
+from src.form_builder.domain import FormDefinition
+from src.form_builder.infrastructure.repository import _deserialize_field
+from src.observability.tracing import traced_methods
+
+
+@traced_methods("repository")
+class InMemoryFormDefinitionRepository:
+    """Тот же интерфейс, что у FormDefinitionRepository; поля разбираются из того же формата fields_schema.
+    Возвращаемые определения общие (как объекты из definition_cache) — вызывающий код их не изменяет."""
+
+    def __init__(self) -> None:
+        self._forms: dict[str, FormDefinition] = {}
+
+    async def create(self, name: str, description: str = "", fields: list[dict] | None = None) -> FormDefinition:
+        form = FormDefinition(
+            id=uuid4(),
+            name=name,
+            description=description,
+            fields=[_deserialize_field(f) for f in fields or []],
+            version=1,
+        )
+        self._forms[str(form.id)] = form
+        return form
+
+    async def get_by_id(self, form_id: UUID) -> FormDefinition | None:
+        return self._forms.get(str(form_id))
+
+    async def list_all(self) -> list[FormDefinition]:
+        return sorted(self._forms.values(), key=lambda f: f.name)
+
+    async def update(
+        self,
+        form_id: UUID,
+        name: str | None = None,
+        description: str | None = None,
+        fields: list[dict] | None = None,
+    ) -> FormDefinition | None:
+        current = self._forms.get(str(form_id))
+        if not current:
+            return None
+        form = replace(
+            current,
+            name=name if name is not None else current.name,
+            description=description if description is not None else current.description,
+            fields=[_deserialize_field(f) for f in fields] if fields is not None else current.fields,
+            version=current.version + 1,
+        )
+        self._forms[str(form_id)] = form
+        definition_cache.invalidate(KIND_FORM, form.id)
+        return form
+
+    async def delete(self, form_id: UUID) -> bool:
+        form = self._forms.pop(str(form_id), None)
+        if form is None:
+            return False
+        definition_cache.invalidate(KIND_FORM, form.id)
+        return True
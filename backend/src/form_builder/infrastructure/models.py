@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.identity.infrastructure.models import Base, gen_uuid
@@ -12,3 +12,4 @@ class FormDefinitionModel(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
     # fields + access rules stored as JSON for flexibility
     fields_schema: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
@@ -1,11 +1,13 @@
-import json
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src import json_codec
+from src.definition_cache import KIND_FORM, cache_definition, definition_cache, evict_definition
 from src.form_builder.domain import FormDefinition, FieldDefinition, FieldAccessRule, FieldType, AccessPermission
 from src.form_builder.infrastructure.models import FormDefinitionModel
+from src.observability.tracing import traced_methods
 
 
 def _serialize_field(f: FieldDefinition) -> dict:
@@ -16,6 +18,7 @@ def _serialize_field(f: FieldDefinition) -> dict:
         "required": f.required,
         "options": f.options,
         "catalog_id": f.catalog_id,
+        "catalog_remote": f.catalog_remote,
         "validations": f.validations,
         "access_rules": [
             {"role_id": r.role_id, "expression": r.expression, "permission": r.permission.value}
@@ -41,6 +44,7 @@ def _deserialize_field(d: dict) -> FieldDefinition:
         required=d.get("required", False),
         options=d.get("options"),
         catalog_id=d.get("catalog_id"),
+        catalog_remote=bool(d.get("catalog_remote", False)),
         validations=d.get("validations"),
         access_rules=access_rules,
         width=d.get("width"),
@@ -48,22 +52,24 @@ def _deserialize_field(d: dict) -> FieldDefinition:
 
 
 def _deserialize_form(row: FormDefinitionModel) -> FormDefinition:
-    fields_data = json.loads(row.fields_schema) if row.fields_schema else []
+    fields_data = json_codec.loads(row.fields_schema) if row.fields_schema else []
     fields = [_deserialize_field(f) for f in fields_data]
     return FormDefinition(
         id=UUID(row.id),
         name=row.name,
         description=row.description or "",
         fields=fields,
+        version=row.version or 1,
     )
 
 
+@traced_methods("repository")
 class FormDefinitionRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
     async def create(self, name: str, description: str = "", fields: list[dict] | None = None) -> FormDefinition:
-        schema = json.dumps(fields or [])
+        schema = json_codec.dumps(fields or [])
         model = FormDefinitionModel(name=name, description=description, fields_schema=schema)
         self._session.add(model)
         await self._session.flush()
@@ -71,13 +77,18 @@ class FormDefinitionRepository:
         return _deserialize_form(model)
 
     async def get_by_id(self, form_id: UUID) -> FormDefinition | None:
+        cached = definition_cache.get(KIND_FORM, form_id)
+        if cached is not None:
+            return cached
         result = await self._session.execute(
             select(FormDefinitionModel).where(FormDefinitionModel.id == str(form_id))
         )
         row = result.scalar_one_or_none()
         if not row:
             return None
-        return _deserialize_form(row)
+        form = _deserialize_form(row)
+        cache_definition(self._session, KIND_FORM, form_id, form.version, form)
+        return form
 
     async def list_all(self) -> list[FormDefinition]:
         result = await self._session.execute(select(FormDefinitionModel).order_by(FormDefinitionModel.name))
@@ -102,7 +113,9 @@ class FormDefinitionRepository:
         if description is not None:
             row.description = description
         if fields is not None:
-            row.fields_schema = json.dumps(fields)
+            row.fields_schema = json_codec.dumps(fields)
+        row.version = (row.version or 1) + 1
+        evict_definition(self._session, KIND_FORM, form_id)
         await self._session.flush()
         await self._session.refresh(row)
         return _deserialize_form(row)
@@ -115,5 +128,6 @@ class FormDefinitionRepository:
         if not row:
             return False
         await self._session.delete(row)
+        evict_definition(self._session, KIND_FORM, form_id)
         await self._session.flush()
         return True
@@ -6,7 +6,9 @@ import bcrypt
 from jose import JWTError, jwt
 
 from src.config import settings
+from src.identity.application.password_hasher import password_hasher
 from src.identity.domain import User, Role
+from src.observability.tracing import traced_methods
 
 # Предварительный SHA256 избегает лимита 72 байт у bcrypt и убирает зависимость от passlib
 def _password_digest(password: str) -> bytes:
@@ -21,7 +23,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def hash_password(password: str) -> str:
     digest = _password_digest(password)
-    return bcrypt.hashpw(digest, bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(digest, bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("utf-8")
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password в пуле хэширования — для async-обработчиков (не блокирует event loop)."""
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
 
 
 def create_access_token(subject: str | UUID) -> str:
@@ -38,6 +49,7 @@ def decode_access_token(token: str) -> str | None:
         return None
 
 
+@traced_methods("service")
 class AuthService:
     def __init__(self, get_user_by_email, get_user_roles):
         self._get_user_by_email = get_user_by_email
@@ -45,7 +57,7 @@ class AuthService:
 
     async def authenticate(self, email: str, password: str) -> User | None:
         user = await self._get_user_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             return None
         return user
 
@@ -0,0 +1,112 @@
+"""
+Хэширование паролей вне event loop. bcrypt занимает ~100–300 мс CPU на вызов (освобождая GIL),
+поэтому выполняется в отдельном ограниченном пуле потоков: вход множества пользователей одновременно
+не блокирует обработку остальных запросов воркера. Если очередь переполнена — PasswordHasherBusy (503).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from src.config import settings
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """Очередь хэширования паролей переполнена — запрос стоит повторить позже."""
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordHasherStats:
+    workers: int
+    max_queue: int
+    in_flight: int  # выполняются сейчас
+    queued: int  # ждут свободного потока
+    completed: int
+    rejected: int
+    wait_seconds_total: float  # суммарное ожидание в очереди
+    wait_seconds_max: float
+    run_seconds_total: float  # суммарное время bcrypt
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self._workers = max(1, workers)
+        self._max_queue = max(0, max_queue)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0  # в очереди + выполняются
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    def _timed(self, fn: Callable[..., T], submitted_at: float, *args) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            wait = started - submitted_at
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._run_total += time.perf_counter() - started
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Выполняет fn(*args) в пуле хэширования; PasswordHasherBusy, если очередь заполнена."""
+        with self._lock:
+            if self._pending >= self._workers + self._max_queue:
+                self._rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(self._timed, fn, time.perf_counter(), *args)
+        except BaseException:
+            self._release()
+            raise
+        # Место в очереди освобождается, когда задача в пуле завершилась или отменена до запуска, а не когда
+        # отменён ожидающий её запрос (клиент отключился): уже запущенный bcrypt продолжает занимать поток
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def stats(self) -> PasswordHasherStats:
+        with self._lock:
+            return PasswordHasherStats(
+                workers=self._workers,
+                max_queue=self._max_queue,
+                in_flight=self._running,
+                queued=self._pending - self._running,
+                completed=self._completed,
+                rejected=self._rejected,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+                run_seconds_total=self._run_total,
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_max_queue)
@@ -1,14 +1,18 @@
+from dataclasses import asdict
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, EmailStr  # requires pydantic[email]
 
-from src.identity.application.auth_service import AuthService, hash_password, decode_access_token
+from src.identity.application.auth_service import AuthService, hash_password_async
+from src.identity.application.password_hasher import PasswordHasherBusy, password_hasher
 from src.identity.domain import User
-from src.identity.infrastructure.deps import get_identity_repo, get_current_user_required, require_admin
+from src.identity.infrastructure.deps import get_identity_repo, get_current_principal, require_admin
+from src.identity.infrastructure.principal_cache import Principal
 from src.identity.infrastructure.repository import IdentityRepository
+from src.observability.routing import TracedRoute
 
-router = APIRouter(prefix="/api/identity", tags=["identity"])
+router = APIRouter(prefix="/api/identity", tags=["identity"], route_class=TracedRoute)
 
 
 class LoginRequest(BaseModel):
@@ -58,7 +62,12 @@ async def login(
     body: LoginRequest,
     auth: AuthService = Depends(get_auth_service),
 ):
-    user = await auth.authenticate(body.email, body.password)
+    try:
+        user = await auth.authenticate(body.email, body.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503, detail="Too many concurrent logins, retry later", headers={"Retry-After": "1"}
+        )
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     token = auth.create_token_for_user(user)
@@ -81,21 +90,23 @@ async def create_user(
     repo: IdentityRepository = Depends(get_identity_repo),
 ):
     role_ids = [UUID(r) for r in (body.role_ids or [])]
+    try:
+        hashed_password = await hash_password_async(body.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503, detail="Password hashing is busy, retry later", headers={"Retry-After": "1"}
+        )
     user = await repo.create_user(
         email=body.email,
-        hashed_password=hash_password(body.password),
+        hashed_password=hashed_password,
         role_ids=role_ids if role_ids else None,
     )
     return UserResponse.from_user(user)
 
 
 @router.get("/users/me", response_model=UserResponse)
-async def get_current_user(
-    user: User = Depends(get_current_user_required),
-    repo: IdentityRepository = Depends(get_identity_repo),
-):
-    roles = await repo.get_roles_for_user(user.id)
-    return UserResponse.from_user(user, role_names=[r.name for r in roles])
+async def get_current_user(principal: Principal = Depends(get_current_principal)):
+    return UserResponse.from_user(principal.user, role_names=sorted(principal.role_names))
 
 
 @router.post("/roles", response_model=RoleResponse)
@@ -115,3 +126,21 @@ async def list_roles(
 ):
     roles = await repo.list_roles()
     return [RoleResponse(id=str(r.id), name=r.name) for r in roles]
+
+
+class PasswordHashingStatsResponse(BaseModel):
+    workers: int
+    max_queue: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    run_seconds_total: float
+
+
+@router.get("/password-hashing/stats", response_model=PasswordHashingStatsResponse)
+async def password_hashing_stats(_admin: User = Depends(require_admin)):
+    """Очередь пула хэширования паролей этого воркера (ожидание в очереди, отказы при переполнении)."""
+    return PasswordHashingStatsResponse(**asdict(password_hasher.stats()))
@@ -8,38 +8,51 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.database import get_session
 from src.identity.application.auth_service import decode_access_token
 from src.identity.domain import User
+from src.identity.infrastructure.principal_cache import Principal, principal_cache
 from src.identity.infrastructure.repository import IdentityRepository
 
 ADMIN_ROLE_NAME = "admin"
 
 
-def get_identity_repo(session: AsyncSession = Depends(get_session)) -> IdentityRepository:
+def get_identity_repo(session: AsyncSession = Depends(get_session, scope="function")) -> IdentityRepository:
     return IdentityRepository(session)
 
 
-async def get_current_user_required(
+async def get_current_principal(
     authorization: str | None = Header(None),
     repo: IdentityRepository = Depends(get_identity_repo),
-) -> User:
-    """Возвращает текущего пользователя по JWT или 401."""
+) -> Principal:
+    """Пользователь и имена его ролей по JWT или 401. Берётся из кэша принципалов;
+    при промахе — один запрос (пользователь + роли). В пределах запроса FastAPI вызывает её один раз."""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid token")
     token = authorization.removeprefix("Bearer ").strip()
     sub = decode_access_token(token)
     if not sub:
         raise HTTPException(status_code=401, detail="Invalid token")
-    user = await repo.get_user_by_id(UUID(sub))
-    if not user:
+    try:
+        user_id = UUID(sub)
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    loaded = await repo.get_user_with_roles(user_id)
+    if not loaded:
         raise HTTPException(status_code=401, detail="User not found")
-    return user
+    user, roles = loaded
+    principal = Principal(user=user, role_names=frozenset(r.name for r in roles))
+    principal_cache.put(principal)
+    return principal
 
 
-async def require_admin(
-    user: User = Depends(get_current_user_required),
-    repo: IdentityRepository = Depends(get_identity_repo),
-) -> User:
+async def get_current_user_required(principal: Principal = Depends(get_current_principal)) -> User:
+    """Возвращает текущего пользователя по JWT или 401."""
+    return principal.user
+
+
+async def require_admin(principal: Principal = Depends(get_current_principal)) -> User:
     """Требует роль admin; иначе 403."""
-    roles = await repo.get_roles_for_user(user.id)
-    if not any(r.name == ADMIN_ROLE_NAME for r in roles):
+    if not principal.has_role(ADMIN_ROLE_NAME):
         raise HTTPException(status_code=403, detail="Admin role required")
-    return user
+    return principal.user
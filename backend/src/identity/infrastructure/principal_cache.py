@@ -0,0 +1,69 @@
+"""
+Кэш принципалов (пользователь + имена ролей) по sub из JWT — чтобы авторизация не ходила в БД на каждый запрос.
+Запись живёт principal_cache_ttl секунд и ничем другим не сбрасывается: изменения пользователя и его ролей
+в БД (в любом воркере) вступают в силу не позже чем через TTL. principal_cache_ttl=0 отключает кэш.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.config import settings
+from src.identity.domain import User
+
+_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    user: User
+    role_names: frozenset[str]
+
+    def has_role(self, name: str) -> bool:
+        return name in self.role_names
+
+
+class PrincipalCache:
+    def __init__(self, ttl: float, max_entries: int = _MAX_ENTRIES) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: dict[UUID, tuple[float, Principal]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID) -> Principal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        return principal
+
+    def put(self, principal: Principal) -> None:
+        if self._ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                # Сначала выбрасываем истёкшие; если не помогло — самые старые записи
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                while len(self._entries) >= self._max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[principal.user.id] = (now + self._ttl, principal)
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(settings.principal_cache_ttl)
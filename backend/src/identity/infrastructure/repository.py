@@ -6,8 +6,10 @@ from sqlalchemy.orm import selectinload
 
 from src.identity.domain import User, Role
 from src.identity.infrastructure.models import UserModel, RoleModel, user_roles
+from src.observability.tracing import traced_methods
 
 
+@traced_methods("repository")
 class IdentityRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -42,6 +44,22 @@ class IdentityRepository:
             role_ids=tuple(role_ids),
         )
 
+    async def get_user_with_roles(self, user_id: UUID) -> tuple[User, list[Role]] | None:
+        """Пользователь и его роли (с именами) — одним запросом с selectinload."""
+        result = await self._session.execute(
+            select(UserModel).options(selectinload(UserModel.roles)).where(UserModel.id == str(user_id))
+        )
+        row = result.scalar_one_or_none()
+        if not row:
+            return None
+        user = User(
+            id=UUID(row.id),
+            email=row.email,
+            hashed_password=row.hashed_password,
+            role_ids=tuple(UUID(r.id) for r in row.roles),
+        )
+        return user, [Role(id=UUID(r.id), name=r.name) for r in row.roles]
+
     async def get_roles_for_user(self, user_id: UUID) -> list[Role]:
         result = await self._session.execute(
             select(RoleModel).join(user_roles, RoleModel.id == user_roles.c.role_id).where(
@@ -0,0 +1,87 @@
+"""
+Единый JSON-кодек: схемы и контексты в БД (репозитории) и тела HTTP-ответов (FastJSONResponse).
+Если установлен orjson — он (в разы быстрее stdlib на больших контекстах и списках), иначе stdlib json.
+Формат совместим в обе стороны: orjson пишет компактный UTF-8 без пробелов, что читает и stdlib;
+значения, которые orjson не принимает (NaN из старых записей, int вне 64 бит), обрабатываются через stdlib.
+NaN и ±Infinity orjson пишет как null без ошибки, поэтому для хранения такие объекты сериализуются stdlib
+(NaN, Infinity), и значение переживает чтение и повторную запись, как было до orjson. Для ответов и внешних
+файлов (strict=True) нечисловые значения становятся null: NaN/Infinity — не JSON, JSON.parse в браузере их не читает.
+"""
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - зависит от окружения
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# Ошибка разбора loads в обоих вариантах
+JSONDecodeError = json.JSONDecodeError
+
+
+def _stdlib_dumps(obj: Any, strict: bool) -> bytes:
+    if strict:
+        obj = _finite_only(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=not strict).encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _finite_only(obj: Any) -> Any:
+    """Копия с null вместо NaN/±Infinity (только если они есть — иначе сам объект)."""
+    if not _has_non_finite(obj):
+        return obj
+    if isinstance(obj, float):
+        return None
+    if isinstance(obj, dict):
+        return {k: _finite_only(v) for k, v in obj.items()}
+    return [_finite_only(v) for v in obj]
+
+
+if orjson is not None:
+    # Нестроковые ключи dict (int и т.п.) — строками, как в stdlib
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj: Any, *, strict: bool = False) -> bytes:
+        """strict=True — только валидный JSON (NaN/Infinity -> null): тела ответов, внешние файлы."""
+        try:
+            out = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return _stdlib_dumps(obj, strict)
+        # NaN/Infinity у orjson становятся null: обход объекта только если null в выводе вообще есть
+        if not strict and b"null" in out and _has_non_finite(obj):
+            return _stdlib_dumps(obj, strict)
+        return out
+
+    def loads(data: str | bytes | bytearray) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+else:
+
+    def dumps_bytes(obj: Any, *, strict: bool = False) -> bytes:
+        """strict=True — только валидный JSON (NaN/Infinity -> null): тела ответов, внешние файлы."""
+        return _stdlib_dumps(obj, strict)
+
+    def loads(data: str | bytes | bytearray) -> Any:
+        return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Строка для текстовых колонок (*_schema, context, data)."""
+    return dumps_bytes(obj).decode("utf-8")
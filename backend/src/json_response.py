@@ -0,0 +1,13 @@
+"""Класс ответа FastAPI поверх json_codec (orjson, если установлен). Ответ по умолчанию для всего приложения;
+большие списки возвращают его напрямую — FastAPI тогда не валидирует данные повторно по response_model."""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from src.json_codec import dumps_bytes
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        # NaN/Infinity из контекстов документов — null: клиенту только валидный JSON
+        return dumps_bytes(content, strict=True)
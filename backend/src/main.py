@@ -1,29 +1,94 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import logging
+import time
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from src.database import init_db
+from src.compression import CompressionMiddleware
+from src.config import settings
+from src.definition_listener import DefinitionInvalidationListener
+from src.identity.application.password_hasher import password_hasher
+from src.json_response import FastJSONResponse
 from src.identity.infrastructure.api import router as identity_router
 from src.form_builder.infrastructure.api import router as forms_router
 from src.process_design.infrastructure.api import router as processes_router
 from src.projects.infrastructure.api import router as projects_router
 from src.runtime.infrastructure.api import router as runtime_router
 from src.catalogs.infrastructure.api import router as catalogs_router
+from src.observability.api import router as observability_router
+from src.observability.http_metrics import http_metrics
+from src.observability.middleware import HttpMetricsMiddleware
+from src.observability.tracing import tracer
+from src.read_your_writes import ReadYourWritesMiddleware
 
+logger = logging.getLogger(__name__)
 
-async def lifespan(app: FastAPI):
-    from src.database import ensure_admin_role
+tracer.configure(
+    enabled=settings.tracing_enabled,
+    buffer_size=settings.tracing_buffer_size,
+    max_spans=settings.tracing_max_spans,
+    jsonl_path=settings.tracing_jsonl_path,
+)
+
+
+async def _prepare_schema() -> None:
+    """Схема БД по db_startup_mode. В check воркер не меняет схему: её готовит `bpm db-upgrade` один раз на деплой."""
+    if settings.db_startup_mode == "create":
+        from src.database import ensure_admin_role, init_db
+
+        await init_db()
+        await ensure_admin_role()
+    elif settings.db_startup_mode == "check":
+        from src.migrations import check_schema_revision
+
+        await check_schema_revision()
 
-    await init_db()
-    await ensure_admin_role()
+
+async def lifespan(app: FastAPI):
+    lifespan_started = time.perf_counter()
+    await _prepare_schema()
+    listener_task = None
+    if settings.definition_listener_enabled:
+        listener = DefinitionInvalidationListener(settings.database_url, settings.definition_cache_check_interval)
+        listener_task = asyncio.create_task(listener.run())
+    # Время импорта приложения — `bpm import-time`
+    app.state.startup_timings = {
+        "lifespan_seconds": time.perf_counter() - lifespan_started,
+        "db_startup_mode": settings.db_startup_mode,
+    }
+    logger.info(
+        "Worker ready: lifespan %.0f ms (db_startup_mode=%s)",
+        app.state.startup_timings["lifespan_seconds"] * 1000,
+        settings.db_startup_mode,
+    )
     yield
-    # shutdown if needed
+    if listener_task is not None:
+        listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener_task
+    password_hasher.shutdown()
 
 
 app = FastAPI(
     title="BPM API",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
+if settings.compression_enabled:
+    # Внутри CORS и метрик: метрики видят ответ после сжатия, Server-Timing добавляется к заголовкам сжатого ответа
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+if settings.database_read_url:
+    # Cookie с временем записи: следующие чтения клиента идут на primary в любом воркере (см. src.read_your_writes)
+    app.add_middleware(ReadYourWritesMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -36,14 +101,39 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.metrics_enabled or settings.tracing_enabled or settings.server_timing_enabled or settings.dev_mode:
+    # Снаружи CORS: время и статус считаются для ответа, который уходит клиенту. Без метрик middleware
+    # всё равно нужен: он открывает корневой спан трассы и учёт SQL-запросов запроса
+    app.add_middleware(
+        HttpMetricsMiddleware,
+        metrics=http_metrics if settings.metrics_enabled else None,
+        exclude_paths=("/metrics",),
+        server_timing=settings.server_timing_enabled,
+    )
 app.include_router(identity_router)
 app.include_router(forms_router)
 app.include_router(processes_router)
 app.include_router(projects_router)
 app.include_router(runtime_router)
 app.include_router(catalogs_router)
+app.include_router(observability_router)
 
 
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+_LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """Метрики этого воркера в формате Prometheus. Без авторизации, поэтому по умолчанию только с loopback
+    (METRICS_ALLOW_REMOTE=true — для сборщика в соседнем контейнере)."""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    client_host = request.client.host if request.client else None
+    if not settings.metrics_allow_remote and client_host not in _LOOPBACK_HOSTS:
+        raise HTTPException(status_code=403, detail="Metrics are available from loopback only")
+    return PlainTextResponse(http_metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,76 @@
+"""
+Управление схемой БД вне воркеров: миграции Alembic и проверка ревизии при старте.
+Схему меняет только `bpm db-upgrade` (один раз на деплой); воркер с db_startup_mode=check лишь сверяет
+ревизию в alembic_version с head и не трогает метаданные (без create_all и рефлексии каталога на каждом старте).
+"""
+import asyncio
+import os
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.config import settings
+
+# Каталог backend (содержит alembic.ini и alembic/)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SchemaRevisionMismatch(RuntimeError):
+    """Ревизия схемы в БД не совпадает с head миграций этой сборки."""
+
+
+def _alembic_config():
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    # '%' в URL экранируется: значение проходит через ConfigParser
+    config.set_main_option("sqlalchemy.url", settings.database_url.replace("%", "%%"))
+    return config
+
+
+def head_revision() -> str | None:
+    """Последняя ревизия миграций в этой сборке (читается из alembic/versions, без подключения к БД)."""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(_alembic_config()).get_current_head()
+
+
+async def current_revision() -> str | None:
+    """Ревизия, до которой мигрирована БД; None — миграции ещё не применялись."""
+    from src.database import engine
+
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except DBAPIError:
+            return None
+        return result.scalar_one_or_none()
+
+
+async def check_schema_revision() -> str:
+    """Проверка при старте воркера (db_startup_mode=check): один SELECT вместо create_all."""
+    expected = head_revision()
+    actual = await current_revision()
+    if actual != expected:
+        raise SchemaRevisionMismatch(
+            f"Database schema is at revision {actual or 'none'}, this build expects {expected}. "
+            "Run `bpm db-upgrade` (python -m src.cli db-upgrade) before starting workers."
+        )
+    return actual
+
+
+def upgrade_schema() -> str | None:
+    """Миграции до head, затем недостающие таблицы по моделям и роль admin — то, что раньше делал каждый
+    воркер при старте. Вызывается из CLI вне работающего event loop (env.py Alembic сам запускает asyncio.run)."""
+    from alembic import command
+
+    from src.database import ensure_admin_role, init_db
+
+    command.upgrade(_alembic_config(), "head")
+
+    async def _finish():
+        await init_db()
+        await ensure_admin_role()
+
+    asyncio.run(_finish())
+    return head_revision()
@@ -0,0 +1 @@
+"""Внутренняя диагностика воркера: пул соединений с БД и т.п. Эндпоинты — только для admin."""
@@ -0,0 +1,65 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from src.database import engine, read_engine
+from src.identity.domain import User
+from src.identity.infrastructure.deps import require_admin
+from src.observability.routing import TracedRoute
+from src.observability.tracing import tracer
+
+router = APIRouter(prefix="/internal", tags=["internal"], route_class=TracedRoute)
+
+
+class DbPoolResponse(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    waits: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+    replica: "DbPoolResponse | None" = None  # пул реплики (DATABASE_READ_URL), если она настроена
+
+
+@router.get("/db-pool", response_model=DbPoolResponse)
+async def db_pool(_admin: User = Depends(require_admin)):
+    """Состояние пула соединений этого воркера. Для подбора db_pool_size/db_max_overflow:
+    сумма по всем репликам и воркерам не должна превышать max_connections Postgres."""
+    replica = DbPoolResponse(**asdict(read_engine.sync_engine.pool.stats())) if read_engine is not None else None
+    return DbPoolResponse(**asdict(engine.sync_engine.pool.stats()), replica=replica)
+
+
+class SpanNodeResponse(BaseModel):
+    name: str
+    layer: str
+    start_ms: float  # от начала запроса
+    duration_ms: float
+    attributes: dict = {}
+    error: str | None = None
+    children: list["SpanNodeResponse"] = []
+
+
+class TraceResponse(BaseModel):
+    trace_id: str
+    name: str
+    started_at: float  # unix time
+    duration_ms: float
+    span_count: int
+    dropped_spans: int
+    root: SpanNodeResponse
+
+
+@router.get("/traces", response_model=list[TraceResponse])
+async def slowest_traces(
+    limit: int = Query(20, ge=1, le=200),
+    min_duration_ms: float = Query(0, ge=0),
+    _admin: User = Depends(require_admin),
+):
+    """Самые медленные из последних трасс этого воркера с деревом спанов (handler → service → repository → sql,
+    validator). Время корневого спана вне handler — зависимости и сериализация ответа."""
+    return [t.to_dict() for t in tracer.buffer.slowest(limit, min_duration_ms / 1000)]
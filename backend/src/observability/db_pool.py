@@ -0,0 +1,75 @@
+"""
+Пул соединений SQLAlchemy с учётом ожиданий: сколько раз запрос соединения упёрся в исчерпанный пул
+(все pool_size + max_overflow соединения выданы), сколько ждал и сколько раз не дождался (pool_timeout).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    pool_size: int
+    max_overflow: int
+    checked_out: int  # выдано сейчас
+    checked_in: int  # свободно в пуле
+    overflow: int  # соединений сверх pool_size (может быть отрицательным, пока пул не заполнен)
+    checkouts: int  # всего выдач соединений
+    waits: int  # выдачи, которым пришлось ждать освобождения соединения
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int  # не дождались за pool_timeout
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+
+    def _do_get(self):
+        # Та же проверка, что в QueuePool._do_get: свободных нет и лимит overflow выбран — будет ожидание
+        exhausted = self.checkedin() == 0 and self._max_overflow > -1 and self.overflow() >= self._max_overflow
+        if not exhausted:
+            conn = super()._do_get()
+            with self._stats_lock:
+                self._checkouts += 1
+            return conn
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        with self._stats_lock:
+            self._checkouts += 1
+            self._waits += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return conn
+
+    def stats(self) -> PoolStats:
+        with self._stats_lock:
+            return PoolStats(
+                pool_size=self.size(),
+                max_overflow=self._max_overflow,
+                checked_out=self.checkedout(),
+                checked_in=self.checkedin(),
+                overflow=self.overflow(),
+                checkouts=self._checkouts,
+                waits=self._waits,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+                timeouts=self._timeouts,
+            )
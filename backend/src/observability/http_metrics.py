@@ -0,0 +1,144 @@
+"""
+Метрики HTTP по маршрутам: число запросов по классам статусов, гистограмма длительности, запросы в обработке,
+число SQL-запросов и время в БД.
+Метка route — шаблон пути (/api/runtime/instances/{instance_id}/current-form), а не фактический URL,
+чтобы число рядов не росло с числом документов. Экспорт — текстовый формат Prometheus (GET /metrics).
+Значения — по воркеру (процессу): при нескольких воркерах Prometheus суммирует ряды по instance/pod.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+
+# Границы корзин гистограммы длительности, сек
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Метка для запросов, не совпавших ни с одним маршрутом (404 от сканеров не должны плодить ряды)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def status_class(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+@dataclass(slots=True)
+class _Histogram:
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    total: float = 0.0
+
+    def observe(self, value: float) -> None:
+        # Корзины не кумулятивные при записи; накопление — при экспорте
+        index = bisect.bisect_left(LATENCY_BUCKETS, value)
+        if index < len(LATENCY_BUCKETS):
+            self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class HttpMetrics:
+    """Реестр метрик HTTP одного воркера."""
+
+    def __init__(self) -> None:
+        self._requests: dict[tuple[str, str, str], int] = {}
+        self._latency: dict[tuple[str, str], _Histogram] = {}
+        self._in_flight: dict[tuple[str, str], int] = {}
+        self._db: dict[tuple[str, str], tuple[int, float]] = {}  # (число SQL-запросов, сек в БД)
+        self._lock = threading.Lock()
+
+    def request_started(self, method: str, route: str) -> None:
+        with self._lock:
+            key = (method, route)
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration: float,
+        db_queries: int = 0,
+        db_seconds: float = 0.0,
+    ) -> None:
+        with self._lock:
+            key = (method, route)
+            self._in_flight[key] = self._in_flight.get(key, 1) - 1
+            counter_key = (method, route, status_class(status_code))
+            self._requests[counter_key] = self._requests.get(counter_key, 0) + 1
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = _Histogram()
+            histogram.observe(duration)
+            queries, seconds = self._db.get(key, (0, 0.0))
+            self._db[key] = (queries + db_queries, seconds + db_seconds)
+
+    def render(self) -> str:
+        """Текстовый формат экспозиции Prometheus (version 0.0.4)."""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            latency = sorted((k, list(h.buckets), h.count, h.total) for k, h in self._latency.items())
+            in_flight = sorted(self._in_flight.items())
+            db = sorted(self._db.items())
+        lines = [
+            "# HELP bpm_http_requests_total HTTP requests by route template and status class.",
+            "# TYPE bpm_http_requests_total counter",
+        ]
+        for (method, route, status), value in requests:
+            lines.append(f"bpm_http_requests_total{_labels(method=method, route=route, status=status)} {value}")
+        lines += [
+            "# HELP bpm_http_request_duration_seconds HTTP request latency by route template.",
+            "# TYPE bpm_http_request_duration_seconds histogram",
+        ]
+        for (method, route), buckets, count, total in latency:
+            cumulative = 0
+            for upper, in_bucket in zip(LATENCY_BUCKETS, buckets):
+                cumulative += in_bucket
+                labels = _labels(method=method, route=route, le=_number(upper))
+                lines.append(f"bpm_http_request_duration_seconds_bucket{labels} {cumulative}")
+            labels = _labels(method=method, route=route, le="+Inf")
+            lines.append(f"bpm_http_request_duration_seconds_bucket{labels} {count}")
+            labels = _labels(method=method, route=route)
+            lines.append(f"bpm_http_request_duration_seconds_sum{labels} {_number(total)}")
+            lines.append(f"bpm_http_request_duration_seconds_count{labels} {count}")
+        lines += [
+            "# HELP bpm_http_requests_in_flight HTTP requests being processed by route template.",
+            "# TYPE bpm_http_requests_in_flight gauge",
+        ]
+        for (method, route), value in in_flight:
+            lines.append(f"bpm_http_requests_in_flight{_labels(method=method, route=route)} {value}")
+        lines += [
+            "# HELP bpm_http_db_queries_total SQL statements executed while handling requests, by route template.",
+            "# TYPE bpm_http_db_queries_total counter",
+        ]
+        for (method, route), (queries, _) in db:
+            lines.append(f"bpm_http_db_queries_total{_labels(method=method, route=route)} {queries}")
+        lines += [
+            "# HELP bpm_http_db_seconds_total Time spent in SQL statements while handling requests, by route template.",
+            "# TYPE bpm_http_db_seconds_total counter",
+        ]
+        for (method, route), (_, seconds) in db:
+            lines.append(f"bpm_http_db_seconds_total{_labels(method=method, route=route)} {_number(seconds)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._latency.clear()
+            self._in_flight.clear()
+            self._db.clear()
+
+
+http_metrics = HttpMetrics()
@@ -0,0 +1,134 @@
+"""ASGI-middleware, записывающее метрики HTTP (см. http_metrics) по шаблону маршрута FastAPI,
+учёт SQL-запросов запроса (см. query_stats): заголовок Server-Timing и предупреждение о N+1 в dev_mode,
+и корневой спан трассы запроса (см. tracing). Ставится, если включено хоть что-то из этого; метрики — по metrics."""
+from __future__ import annotations
+
+import logging
+import time
+
+from starlette._utils import get_route_path
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.observability.http_metrics import UNMATCHED_ROUTE, HttpMetrics, http_metrics
+from src.observability.query_stats import RequestQueryStats, begin_request, end_request
+from src.observability.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+def _match_routes(routes, scope: Scope, prefix: str = "") -> tuple[str | None, str | None]:
+    """(шаблон маршрута с полным совпадением, шаблон с совпадением только по пути — 405).
+    prefix — префиксы include_router, под которыми лежат routes (входят в шаблон)."""
+    partial = None
+    for route in routes:
+        path = getattr(route, "path", None)
+        if path is None:
+            # Новые версии FastAPI хранят include_router как обёртку без path: маршруты — в исходном роутере,
+            # префикс include_router(prefix=...) — в include_context. Маршруты роутера сопоставляются с путём
+            # без префикса (как в Mount: префикс уходит в root_path)
+            nested = getattr(route, "original_router", None)
+            if nested is None:
+                continue
+            include_prefix = getattr(getattr(route, "include_context", None), "prefix", "") or ""
+            nested_scope = scope
+            if include_prefix:
+                route_path = get_route_path(scope)
+                if route_path != include_prefix and not route_path.startswith(include_prefix + "/"):
+                    continue
+                nested_scope = {**scope, "root_path": scope.get("root_path", "") + include_prefix}
+            full, nested_partial = _match_routes(nested.routes, nested_scope, prefix + include_prefix)
+            if full:
+                return full, None
+            partial = partial or nested_partial
+            continue
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return prefix + path, None
+        if match == Match.PARTIAL and partial is None:
+            partial = prefix + path
+    return None, partial
+
+
+def _route_template(scope: Scope) -> str:
+    """Шаблон пути маршрута, которому соответствует запрос. Маршрут определяется до вызова приложения,
+    чтобы запрос сразу попал в in-flight со своей меткой."""
+    router = getattr(scope.get("app"), "router", None)
+    full, partial = _match_routes(getattr(router, "routes", ()), scope)
+    return full or partial or UNMATCHED_ROUTE
+
+
+def _server_timing(stats: RequestQueryStats, elapsed: float) -> bytes:
+    return (
+        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", app;dur={elapsed * 1000:.1f}'
+    ).encode("latin-1")
+
+
+def _warn_repeated_queries(method: str, route: str, stats: RequestQueryStats, threshold: int) -> None:
+    for shape, times in stats.repeated(threshold):
+        logger.warning(
+            "%s %s executed the same SQL %d times (%d queries total), possible N+1: %s",
+            method, route, times, stats.count, shape[:300],
+        )
+
+
+class HttpMetricsMiddleware:
+    """metrics=None — без метрик HTTP (только трасса, учёт SQL-запросов и Server-Timing при server_timing)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: HttpMetrics | None = http_metrics,
+        exclude_paths: tuple[str, ...] = (),
+        server_timing: bool = True,
+    ):
+        self.app = app
+        self.metrics = metrics
+        self.exclude_paths = exclude_paths
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        route = _route_template(scope)
+        status_code = 500  # если приложение упало до начала ответа
+        started = time.perf_counter()
+        stats, token = begin_request()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    # Запросы, выполненные после начала ответа (зависимости с yield без scope="function"),
+                    # в заголовок не попадут, но учитываются в метриках
+                    headers = list(message.get("headers", ()))
+                    headers.append((b"server-timing", _server_timing(stats, time.perf_counter() - started)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        if self.metrics is not None:
+            self.metrics.request_started(method, route)
+        try:
+            with tracer.trace(f"{method} {route}", "http", path=scope["path"]) as root:
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    if root is not None:
+                        root.attributes.update(status=status_code, db_queries=stats.count)
+        finally:
+            end_request(token)
+            if self.metrics is not None:
+                self.metrics.request_finished(
+                    method,
+                    route,
+                    status_code,
+                    time.perf_counter() - started,
+                    db_queries=stats.count,
+                    db_seconds=stats.seconds,
+                )
+            if settings.dev_mode:
+                _warn_repeated_queries(method, route, stats, settings.sql_repeat_warning_threshold)
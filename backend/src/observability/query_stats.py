@@ -0,0 +1,58 @@
+"""
+Учёт SQL-запросов в рамках HTTP-запроса: число запросов к БД, суммарное время и повторы одной и той же
+формы запроса (признак N+1). Статистика живёт в contextvar, который открывает HttpMetricsMiddleware;
+хуки before/after_cursor_execute движков (src.database) пишут в неё. Вне HTTP-запроса (CLI, listener) — no-op.
+"""
+from __future__ import annotations
+
+import re
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+# Списки плейсхолдеров ($1, $2, ... у asyncpg; IN с раскрытыми параметрами) сворачиваются в один,
+# чтобы запросы одной формы с разным числом параметров считались одинаковыми
+_PLACEHOLDER_LIST = re.compile(r"(?:\$\d+|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?))*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("?", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass(slots=True)
+class RequestQueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    shapes: dict[str, int] = field(default_factory=dict)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        shape = statement_shape(statement)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Формы запросов, выполненные больше threshold раз, — по убыванию числа повторов."""
+        return sorted(
+            ((shape, n) for shape, n in self.shapes.items() if n > threshold),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+
+_current: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def begin_request() -> tuple[RequestQueryStats, Token]:
+    stats = RequestQueryStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token: Token) -> None:
+    _current.reset(token)
+
+
+def record_query(statement: str, seconds: float) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, seconds)
@@ -0,0 +1,11 @@
+"""Класс маршрута FastAPI, у которого вызов обработчика — спан трассы (layer=handler).
+Время корневого спана вне handler — зависимости (сессия, пользователь) и сериализация ответа."""
+from fastapi.routing import APIRoute
+
+from src.observability.tracing import traced
+
+
+class TracedRoute(APIRoute):
+    def __init__(self, path: str, endpoint, **kwargs):
+        # traced сохраняет сигнатуру (functools.wraps): FastAPI строит зависимости по исходной функции
+        super().__init__(path, traced(endpoint.__name__, "handler")(endpoint), **kwargs)
@@ -0,0 +1,235 @@
+"""
+Лёгкая трассировка внутри процесса, без внешнего коллектора. Корневой span открывает HttpMetricsMiddleware
+на каждый HTTP-запрос; внутри него спаны создают обработчики (TracedRoute), сервисы и репозитории
+(traced_methods), валидаторы и SQL-запросы. Вне HTTP-запроса (CLI, listener) span() ничего не делает.
+Завершённая трасса отдаётся экспортёрам: кольцевой буфер в памяти (GET /internal/traces) и, опционально,
+файл JSON lines.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Protocol
+
+from src import json_codec
+
+
+@dataclass(slots=True)
+class Span:
+    span_id: int
+    parent_id: int | None
+    name: str
+    layer: str  # http | handler | service | repository | validator | db
+    started_at: float  # time.time()
+    start: float  # time.perf_counter()
+    duration: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class Trace:
+    trace_id: str
+    spans: list[Span] = field(default_factory=list)
+    dropped_spans: int = 0  # спаны сверх max_spans не записываются
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    @property
+    def duration(self) -> float:
+        return self.root.duration or 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Трасса с деревом спанов; start_ms — смещение от начала корневого спана."""
+        root = self.root
+        children: dict[int | None, list[Span]] = {}
+        for s in self.spans[1:]:
+            children.setdefault(s.parent_id, []).append(s)
+
+        def node(s: Span) -> dict[str, Any]:
+            return {
+                "name": s.name,
+                "layer": s.layer,
+                "start_ms": round((s.start - root.start) * 1000, 3),
+                "duration_ms": round((s.duration or 0.0) * 1000, 3),
+                "attributes": s.attributes,
+                "error": s.error,
+                "children": [node(c) for c in children.get(s.span_id, ())],
+            }
+
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "started_at": root.started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            "root": node(root),
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, trace: Trace) -> None: ...
+
+
+class RingBufferExporter:
+    """Последние capacity трасс в памяти воркера."""
+
+    def __init__(self, capacity: int) -> None:
+        self._traces: deque[Trace] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces.append(trace)
+
+    def slowest(self, limit: int, min_duration: float = 0.0) -> list[Trace]:
+        with self._lock:
+            traces = [t for t in self._traces if t.duration >= min_duration]
+        return sorted(traces, key=lambda t: t.duration, reverse=True)[:limit]
+
+    def resize(self, capacity: int) -> None:
+        with self._lock:
+            self._traces = deque(self._traces, maxlen=capacity)
+
+
+class JsonLinesExporter:
+    """Трасса — одна строка JSON в файле (дописывание). Для отладки: запись синхронная, в event loop."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json_codec.dumps_bytes(trace.to_dict(), strict=True)
+        with self._lock, open(self._path, "ab") as f:
+            f.write(line + b"\n")
+
+
+_active: ContextVar[tuple[Trace, Span] | None] = ContextVar("active_span", default=None)
+
+
+class Tracer:
+    def __init__(self, buffer_size: int = 200, max_spans: int = 500) -> None:
+        self.enabled = True
+        self.max_spans = max_spans
+        self.buffer = RingBufferExporter(buffer_size)
+        self.exporters: list[SpanExporter] = [self.buffer]
+
+    def configure(
+        self,
+        enabled: bool,
+        buffer_size: int,
+        max_spans: int,
+        jsonl_path: str | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.buffer.resize(buffer_size)
+        self.exporters = [self.buffer]
+        if jsonl_path:
+            self.exporters.append(JsonLinesExporter(jsonl_path))
+
+    @contextmanager
+    def trace(self, name: str, layer: str = "http", /, **attributes: Any) -> Iterator[Span | None]:
+        """Корневой спан новой трассы; по выходе трасса уходит экспортёрам."""
+        if not self.enabled:
+            yield None
+            return
+        root = Span(0, None, name, layer, time.time(), time.perf_counter(), attributes=attributes)
+        current = Trace(trace_id=os.urandom(8).hex(), spans=[root])
+        token = _active.set((current, root))
+        try:
+            yield root
+        except BaseException as e:
+            root.error = type(e).__name__
+            raise
+        finally:
+            root.duration = time.perf_counter() - root.start
+            _active.reset(token)
+            for exporter in self.exporters:
+                exporter.export(current)
+
+    @contextmanager
+    def span(self, name: str, layer: str, /, **attributes: Any) -> Iterator[Span | None]:
+        active = _active.get()
+        if active is None:
+            yield None
+            return
+        current, parent = active
+        if len(current.spans) >= self.max_spans:
+            current.dropped_spans += 1
+            yield None
+            return
+        s = Span(len(current.spans), parent.span_id, name, layer, time.time(), time.perf_counter(), attributes=attributes)
+        current.spans.append(s)
+        token = _active.set((current, s))
+        try:
+            yield s
+        except BaseException as e:
+            s.error = f"{type(e).__name__}: {e}"[:300]
+            raise
+        finally:
+            s.duration = time.perf_counter() - s.start
+            _active.reset(token)
+
+    def record(self, name: str, layer: str, start: float, duration: float, /, **attributes: Any) -> None:
+        """Уже завершённый спан (например, SQL-запрос из хуков движка): start — time.perf_counter()."""
+        active = _active.get()
+        if active is None:
+            return
+        current, parent = active
+        if len(current.spans) >= self.max_spans:
+            current.dropped_spans += 1
+            return
+        started_at = time.time() - (time.perf_counter() - start)
+        current.spans.append(
+            Span(len(current.spans), parent.span_id, name, layer, started_at, start, duration, attributes)
+        )
+
+
+tracer = Tracer()
+
+
+def traced(name: str, layer: str) -> Callable[[Callable], Callable]:
+    """Декоратор: вызов функции (sync или async) — спан текущей трассы."""
+
+    def decorate(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.span(name, layer):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tracer.span(name, layer):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def traced_methods(layer: str) -> Callable[[type], type]:
+    """Декоратор класса: публичные методы, объявленные в классе, — спаны «Класс.метод»."""
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}", layer)(value))
+        return cls
+
+    return decorate
@@ -1,8 +1,10 @@
 from uuid import UUID
 
+from src.observability.tracing import traced_methods
 from src.process_design.domain import ProcessDefinition
 
 
+@traced_methods("service")
 class ProcessService:
     def __init__(self, process_repository):
         self._repo = process_repository
@@ -1,3 +1,13 @@
 from .process_definition import ProcessDefinition, Node, Edge, NodeType
+from .graph_analysis import GraphAnalysis, ProcessGraphError, analyze_process_graph, compute_routes
 
-__all__ = ["ProcessDefinition", "Node", "Edge", "NodeType"]
+__all__ = [
+    "ProcessDefinition",
+    "Node",
+    "Edge",
+    "NodeType",
+    "GraphAnalysis",
+    "ProcessGraphError",
+    "analyze_process_graph",
+    "compute_routes",
+]
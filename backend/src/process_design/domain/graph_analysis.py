@@ -0,0 +1,109 @@
+"""
+Анализ графа процесса при сохранении: достижимость, циклы, недостижимые END-узлы и таблица маршрутов.
+Маршрут узла без формы — узел с формой (или END), в который runtime попадёт, идя по первому исходящему ребру;
+с таблицей маршрутов runtime не обходит граф при чтении и не пишет current_node_id на GET.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+from src.process_design.domain.process_definition import Node, NodeType, ProcessDefinition
+
+
+class ProcessGraphError(ValueError):
+    """Граф процесса некорректен (рёбра на несуществующие узлы, повторяющиеся id узлов)."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+@dataclass(slots=True)
+class GraphAnalysis:
+    errors: list[str] = field(default_factory=list)  # граф нельзя исполнять
+    warnings: list[str] = field(default_factory=list)  # исполнять можно, но часть графа не работает
+    reachable: set[str] = field(default_factory=set)  # узлы, достижимые от стартового
+    routes: dict[str, str | None] = field(default_factory=dict)  # узел без формы -> узел с формой/END (None — тупик)
+
+
+def _is_stop(node: Node) -> bool:
+    """Узел, на котором runtime останавливается: шаг с формой или конец процесса."""
+    return bool(node.form_definition_id) or node.node_type == NodeType.END
+
+
+def compute_routes(process: ProcessDefinition) -> dict[str, str | None]:
+    """Для каждого узла без формы — узел с формой или END, куда ведёт цепочка первых исходящих рёбер.
+    None — цепочка обрывается или зацикливается без узла с формой."""
+    routes: dict[str, str | None] = {}
+    for node in process.nodes:
+        if _is_stop(node) or node.id in routes:
+            continue
+        path: list[str] = []
+        seen: set[str] = set()
+        current: str | None = node.id
+        target: str | None = None
+        while current is not None and current not in seen:
+            if current in routes:
+                target = routes[current]
+                break
+            n = process.get_node(current)
+            if n is None:
+                break
+            if _is_stop(n):
+                target = n.id
+                break
+            seen.add(current)
+            path.append(current)
+            edges = process.get_edges_from(current)
+            current = edges[0].target_node_id if edges else None
+        for node_id in path:
+            routes[node_id] = target
+    return routes
+
+
+def _reachable_from(process: ProcessDefinition, start_id: str) -> set[str]:
+    reachable = {start_id}
+    stack = [start_id]
+    while stack:
+        for e in process.get_edges_from(stack.pop()):
+            if e.target_node_id not in reachable and process.get_node(e.target_node_id) is not None:
+                reachable.add(e.target_node_id)
+                stack.append(e.target_node_id)
+    return reachable
+
+
+def analyze_process_graph(process: ProcessDefinition) -> GraphAnalysis:
+    analysis = GraphAnalysis()
+    for node_id, count in Counter(n.id for n in process.nodes).items():
+        if count > 1:
+            analysis.errors.append(f"Повторяющийся id узла: {node_id}")
+    for e in process.edges:
+        for end in (e.source_node_id, e.target_node_id):
+            if process.get_node(end) is None:
+                analysis.errors.append(f"Ребро {e.id} ссылается на несуществующий узел {end}")
+
+    analysis.routes = compute_routes(process)
+    if not process.nodes:
+        return analysis
+
+    start_nodes = [n for n in process.nodes if n.node_type == NodeType.START]
+    if not start_nodes:
+        analysis.warnings.append("Нет стартового узла")
+    elif len(start_nodes) > 1:
+        analysis.warnings.append("Несколько стартовых узлов; используется первый")
+    if start_nodes:
+        analysis.reachable = _reachable_from(process, start_nodes[0].id)
+        for n in process.nodes:
+            if n.id in analysis.reachable:
+                continue
+            if n.node_type == NodeType.END:
+                analysis.warnings.append(f"Конечный узел {n.id} недостижим от старта")
+            else:
+                analysis.warnings.append(f"Узел {n.id} недостижим от старта")
+        if not any(n.node_type == NodeType.END and n.id in analysis.reachable for n in process.nodes):
+            analysis.warnings.append("Ни один конечный узел не достижим от старта")
+    for node_id, target in analysis.routes.items():
+        if target is None:
+            analysis.warnings.append(f"Маршрут от узла {node_id} не ведёт ни к шагу с формой, ни к концу процесса")
+    return analysis
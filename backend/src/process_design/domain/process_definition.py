@@ -11,7 +11,7 @@ class NodeType(str, Enum):
     END = "end"
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Узел процесса. validator_keys — ключи валидаторов проекта (field_visibility), привязанных к этапу (шаг с формой)."""
     id: str
@@ -24,7 +24,7 @@ class Node:
     validator_keys: list[str] = field(default_factory=list)  # ключи валидаторов проекта (видимость полей)
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """Ребро процесса. key — системное имя для логирования; label — название перехода; transition_validator_keys — ключи валидаторов (step_access)."""
     id: str
@@ -36,8 +36,10 @@ class Edge:
     transition_validator_keys: list[str] = field(default_factory=list)  # ключи валидаторов проекта (доступ к этапу)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessDefinition:
+    """Определение процесса. Индексы графа (узел по id, исходящие рёбра, стартовый узел) строятся один раз
+    при создании объекта; после изменения nodes/edges нужно вызвать reindex()."""
     id: UUID
     name: str
     description: str
@@ -45,18 +47,47 @@ class ProcessDefinition:
     project_id: UUID | None = None
     nodes: list[Node] = field(default_factory=list)
     edges: list[Edge] = field(default_factory=list)
+    # Таблица маршрутов (см. graph_analysis.compute_routes): узел без формы -> узел с формой/END
+    routes: dict[str, str | None] = field(default_factory=dict)
+    # Предупреждения анализа графа — только у определения, которое вернули create/update репозитория
+    # (анализ выполняется при сохранении; у прочитанных определений пусто)
+    graph_warnings: list[str] = field(default_factory=list, compare=False)
+    _nodes_by_id: dict[str, Node] = field(init=False, repr=False, compare=False)
+    _edges_from: dict[str, tuple[Edge, ...]] = field(init=False, repr=False, compare=False)
+    _start_node: Node | None = field(init=False, repr=False, compare=False)
 
-    def get_node(self, node_id: str) -> Node | None:
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        nodes_by_id: dict[str, Node] = {}
+        start_node = None
         for n in self.nodes:
-            if n.id == node_id:
-                return n
-        return None
+            nodes_by_id.setdefault(n.id, n)
+            if start_node is None and n.node_type == NodeType.START:
+                start_node = n
+        edges_from: dict[str, list[Edge]] = {}
+        for e in self.edges:
+            edges_from.setdefault(e.source_node_id, []).append(e)
+        self._nodes_by_id = nodes_by_id
+        self._edges_from = {k: tuple(v) for k, v in edges_from.items()}
+        self._start_node = start_node
+
+    def get_node(self, node_id: str) -> Node | None:
+        return self._nodes_by_id.get(node_id)
 
     def get_start_node(self) -> Node | None:
-        for n in self.nodes:
-            if n.node_type == NodeType.START:
-                return n
-        return None
+        return self._start_node
+
+    def get_edges_from(self, node_id: str) -> tuple[Edge, ...]:
+        return self._edges_from.get(node_id, ())
 
-    def get_edges_from(self, node_id: str) -> list[Edge]:
-        return [e for e in self.edges if e.source_node_id == node_id]
+    def resolve_node(self, node_id: str | None) -> str | None:
+        """Узел, на котором фактически стоит процесс: сам узел, если это шаг с формой или END,
+        иначе — цель из таблицы маршрутов (None — маршрута нет)."""
+        node = self._nodes_by_id.get(node_id) if node_id else None
+        if node is None:
+            return None
+        if node.form_definition_id or node.node_type == NodeType.END:
+            return node.id
+        return self.routes.get(node.id)
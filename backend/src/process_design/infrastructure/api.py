@@ -3,13 +3,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from src.database import get_session
+from src.database import get_read_session, get_session
 from src.identity.domain import User
 from src.identity.infrastructure.deps import get_current_user_required, require_admin
+from src.observability.routing import TracedRoute
 from src.process_design.application.process_service import ProcessService
+from src.process_design.domain import ProcessGraphError
 from src.process_design.infrastructure.repository import ProcessDefinitionRepository
 
-router = APIRouter(prefix="/api/processes", tags=["processes"])
+router = APIRouter(prefix="/api/processes", tags=["processes"], route_class=TracedRoute)
 
 
 class NodeSchema(BaseModel):
@@ -57,6 +59,9 @@ class ProcessResponse(BaseModel):
     project_id: str | None = None
     nodes: list[dict]
     edges: list[dict]
+    # Результат анализа графа (недостижимые узлы, тупиковые маршруты) — только в ответах на создание и изменение:
+    # анализ выполняется репозиторием при сохранении, GET и список процессов граф не анализируют
+    graph_warnings: list[str] = []
 
 
 def _process_to_response(p) -> ProcessResponse:
@@ -93,10 +98,11 @@ def _process_to_response(p) -> ProcessResponse:
         project_id=str(p.project_id) if p.project_id else None,
         nodes=nodes,
         edges=edges,
+        graph_warnings=p.graph_warnings,
     )
 
 
-def get_process_repo(session=Depends(get_session)) -> ProcessDefinitionRepository:
+def get_process_repo(session=Depends(get_session, scope="function")) -> ProcessDefinitionRepository:
     return ProcessDefinitionRepository(session)
 
 
@@ -104,6 +110,11 @@ def get_process_service(repo: ProcessDefinitionRepository = Depends(get_process_
     return ProcessService(repo)
 
 
+def get_read_process_service(session=Depends(get_read_session, scope="function")) -> ProcessService:
+    """Для GET-обработчиков: чтение с реплики, если она настроена."""
+    return ProcessService(ProcessDefinitionRepository(session))
+
+
 @router.post("", response_model=ProcessResponse)
 async def create_process(
     body: ProcessCreate,
@@ -113,20 +124,23 @@ async def create_process(
     nodes = [n.model_dump() for n in (body.nodes or [])]
     edges = [e.model_dump() for e in (body.edges or [])]
     project_id = UUID(body.project_id) if body.project_id else None
-    process = await service.create_process(
-        name=body.name,
-        description=body.description,
-        project_id=project_id,
-        nodes=nodes,
-        edges=edges,
-    )
+    try:
+        process = await service.create_process(
+            name=body.name,
+            description=body.description,
+            project_id=project_id,
+            nodes=nodes,
+            edges=edges,
+        )
+    except ProcessGraphError as e:
+        raise HTTPException(status_code=422, detail=e.errors)
     return _process_to_response(process)
 
 
 @router.get("", response_model=list[ProcessResponse])
 async def list_processes(
     _user: User = Depends(get_current_user_required),
-    service: ProcessService = Depends(get_process_service),
+    service: ProcessService = Depends(get_read_process_service),
     project_id: UUID | None = None,
 ):
     processes = await service.list_processes(project_id=project_id)
@@ -137,7 +151,7 @@ async def list_processes(
 async def get_process(
     process_id: UUID,
     _user: User = Depends(get_current_user_required),
-    service: ProcessService = Depends(get_process_service),
+    service: ProcessService = Depends(get_read_process_service),
 ):
     process = await service.get_process(process_id)
     if not process:
@@ -155,14 +169,17 @@ async def update_process(
     nodes = [n.model_dump() for n in body.nodes] if body.nodes is not None else None
     edges = [e.model_dump() for e in body.edges] if body.edges is not None else None
     project_id = UUID(body.project_id) if body.project_id else None
-    process = await service.update_process(
-        process_id,
-        name=body.name,
-        description=body.description,
-        project_id=project_id,
-        nodes=nodes,
-        edges=edges,
-    )
+    try:
+        process = await service.update_process(
+            process_id,
+            name=body.name,
+            description=body.description,
+            project_id=project_id,
+            nodes=nodes,
+            edges=edges,
+        )
+    except ProcessGraphError as e:
+        raise HTTPException(status_code=422, detail=e.errors)
     if not process:
         raise HTTPException(status_code=404, detail="Process not found")
     return _process_to_response(process)
@@ -0,0 +1,103 @@
+"""ProcessDefinitionRepository без БД: определения и их версии в словарях (бенчмарки, встроенный движок)."""
+from dataclasses import replace
+from uuid import UUID, uuid4
+
+from src.definition_cache import KIND_PROCESS, definition_cache
+from src.observability.tracing import traced_methods
+from src.process_design.domain import ProcessDefinition, ProcessGraphError, analyze_process_graph
+from src.process_design.infrastructure.repository import _deserialize_edge, _deserialize_node
+
+
+@traced_methods("repository")
+class InMemoryProcessDefinitionRepository:
+    """Тот же интерфейс, что у ProcessDefinitionRepository. Каждое сохранение создаёт неизменяемую версию
+    с таблицей маршрутов; ошибки анализа изменённого графа — ProcessGraphError, как в БД-репозитории.
+    Возвращаемые определения общие (как объекты из definition_cache) — вызывающий код их не изменяет."""
+
+    def __init__(self) -> None:
+        self._processes: dict[str, ProcessDefinition] = {}
+        self._versions: dict[tuple[str, int], ProcessDefinition] = {}
+
+    def _save(self, process: ProcessDefinition, check_graph: bool) -> ProcessDefinition:
+        version = ProcessDefinition(
+            id=process.id,
+            name=process.name,
+            description=process.description,
+            version=process.version,
+            project_id=process.project_id,
+            nodes=process.nodes,
+            edges=process.edges,
+        )
+        analysis = analyze_process_graph(version)
+        if check_graph and analysis.errors:
+            raise ProcessGraphError(analysis.errors)
+        version.routes = analysis.routes
+        self._versions[(str(process.id), process.version)] = version
+        self._processes[str(process.id)] = process
+        return replace(process, graph_warnings=analysis.warnings)
+
+    async def create(
+        self,
+        name: str,
+        description: str = "",
+        project_id: UUID | None = None,
+        nodes: list[dict] | None = None,
+        edges: list[dict] | None = None,
+    ) -> ProcessDefinition:
+        process = ProcessDefinition(
+            id=uuid4(),
+            name=name,
+            description=description,
+            version=1,
+            project_id=project_id,
+            nodes=[_deserialize_node(n) for n in nodes or []],
+            edges=[_deserialize_edge(e) for e in edges or []],
+        )
+        return self._save(process, check_graph=True)
+
+    async def get_by_id(self, process_id: UUID) -> ProcessDefinition | None:
+        return self._processes.get(str(process_id))
+
+    async def get_version(self, process_id: UUID, version: int) -> ProcessDefinition | None:
+        return self._versions.get((str(process_id), version))
+
+    async def list_all(self, project_id: UUID | None = None) -> list[ProcessDefinition]:
+        out = [
+            p for p in self._processes.values()
+            if project_id is None or str(p.project_id) == str(project_id)
+        ]
+        return sorted(out, key=lambda p: p.name)
+
+    async def update(
+        self,
+        process_id: UUID,
+        name: str | None = None,
+        description: str | None = None,
+        project_id: UUID | None = None,
+        nodes: list[dict] | None = None,
+        edges: list[dict] | None = None,
+    ) -> ProcessDefinition | None:
+        current = self._processes.get(str(process_id))
+        if not current:
+            return None
+        process = ProcessDefinition(
+            id=current.id,
+            name=name if name is not None else current.name,
+            description=description if description is not None else current.description,
+            version=current.version + 1,
+            project_id=(project_id or None) if project_id is not None else current.project_id,
+            nodes=[_deserialize_node(n) for n in nodes] if nodes is not None else current.nodes,
+            edges=[_deserialize_edge(e) for e in edges] if edges is not None else current.edges,
+        )
+        saved = self._save(process, check_graph=nodes is not None or edges is not None)
+        definition_cache.invalidate(KIND_PROCESS, process.id)
+        return saved
+
+    async def delete(self, process_id: UUID) -> bool:
+        process = self._processes.pop(str(process_id), None)
+        if process is None:
+            return False
+        for key in [k for k in self._versions if k[0] == str(process_id)]:
+            del self._versions[key]
+        definition_cache.invalidate(KIND_PROCESS, process.id)
+        return True
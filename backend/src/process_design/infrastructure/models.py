@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.identity.infrastructure.models import Base, gen_uuid
@@ -10,7 +12,27 @@ class ProcessDefinitionModel(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=gen_uuid)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
-    version: Mapped[int] = mapped_column(Integer, default=1)
+    version: Mapped[int] = mapped_column(Integer, default=1)  # текущая (последняя) версия
     project_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
     nodes_schema: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
     edges_schema: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+
+
+class ProcessDefinitionVersionModel(Base):
+    """Неизменяемый снимок процесса: создаётся при каждом сохранении, экземпляры закреплены за версией."""
+    __tablename__ = "process_definition_versions"
+    __table_args__ = (
+        UniqueConstraint("process_definition_id", "version", name="uq_process_definition_versions_process_version"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=gen_uuid)
+    process_definition_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    project_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    nodes_schema: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    edges_schema: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    # Таблица маршрутов, рассчитанная при сохранении (graph_analysis.compute_routes); NULL — не рассчитана
+    routes_schema: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,11 +1,29 @@
-import json
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.process_design.domain import ProcessDefinition, Node, Edge, NodeType
-from src.process_design.infrastructure.models import ProcessDefinitionModel
+from src import json_codec
+from src.definition_cache import (
+    KIND_PROCESS,
+    KIND_PROCESS_VERSION,
+    cache_definition,
+    definition_cache,
+    evict_definition,
+    pending_evictions,
+)
+from src.observability.tracing import traced_methods
+from src.process_design.domain import (
+    ProcessDefinition,
+    Node,
+    Edge,
+    NodeType,
+    GraphAnalysis,
+    ProcessGraphError,
+    analyze_process_graph,
+    compute_routes,
+)
+from src.process_design.infrastructure.models import ProcessDefinitionModel, ProcessDefinitionVersionModel
 
 
 def _validator_keys_from_node_dict(d: dict) -> list[str]:
@@ -84,14 +102,15 @@ def _deserialize_edge(d: dict) -> Edge:
     )
 
 
-def _deserialize_process(row: ProcessDefinitionModel) -> ProcessDefinition:
-    nodes_data = json.loads(row.nodes_schema) if row.nodes_schema else []
-    edges_data = json.loads(row.edges_schema) if row.edges_schema else []
+def _deserialize_process(row: ProcessDefinitionModel | ProcessDefinitionVersionModel) -> ProcessDefinition:
+    nodes_data = json_codec.loads(row.nodes_schema) if row.nodes_schema else []
+    edges_data = json_codec.loads(row.edges_schema) if row.edges_schema else []
     nodes = [_deserialize_node(n) for n in nodes_data]
     edges = [_deserialize_edge(e) for e in edges_data]
     project_id = UUID(row.project_id) if getattr(row, "project_id", None) else None
-    return ProcessDefinition(
-        id=UUID(row.id),
+    is_version = isinstance(row, ProcessDefinitionVersionModel)
+    process = ProcessDefinition(
+        id=UUID(row.process_definition_id if is_version else row.id),
         name=row.name,
         description=row.description or "",
         version=row.version or 1,
@@ -99,8 +118,35 @@ def _deserialize_process(row: ProcessDefinitionModel) -> ProcessDefinition:
         nodes=nodes,
         edges=edges,
     )
+    if is_version:
+        # Версии, созданные до появления таблицы маршрутов, рассчитываем при загрузке
+        process.routes = json_codec.loads(row.routes_schema) if row.routes_schema else compute_routes(process)
+    return process
 
 
+def _version_snapshot(
+    row: ProcessDefinitionModel, check_graph: bool
+) -> tuple[ProcessDefinitionVersionModel, GraphAnalysis]:
+    """Неизменяемый снимок текущего состояния определения (row.version — номер снимка) с таблицей маршрутов
+    и результат анализа графа. check_graph — граф изменён в этом сохранении: ошибки анализа (ProcessGraphError)
+    отклоняют сохранение."""
+    analysis = analyze_process_graph(_deserialize_process(row))
+    if check_graph and analysis.errors:
+        raise ProcessGraphError(analysis.errors)
+    snapshot = ProcessDefinitionVersionModel(
+        process_definition_id=row.id,
+        version=row.version or 1,
+        name=row.name,
+        description=row.description or "",
+        project_id=row.project_id,
+        nodes_schema=row.nodes_schema,
+        edges_schema=row.edges_schema,
+        routes_schema=json_codec.dumps(analysis.routes),
+    )
+    return snapshot, analysis
+
+
+@traced_methods("repository")
 class ProcessDefinitionRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -113,28 +159,60 @@ class ProcessDefinitionRepository:
         nodes: list[dict] | None = None,
         edges: list[dict] | None = None,
     ) -> ProcessDefinition:
-        nodes_json = json.dumps(nodes or [])
-        edges_json = json.dumps(edges or [])
+        nodes_json = json_codec.dumps(nodes or [])
+        edges_json = json_codec.dumps(edges or [])
         model = ProcessDefinitionModel(
             name=name,
             description=description,
             project_id=str(project_id) if project_id else None,
             nodes_schema=nodes_json,
             edges_schema=edges_json,
+            version=1,
         )
         self._session.add(model)
         await self._session.flush()
+        snapshot, analysis = _version_snapshot(model, check_graph=True)
+        self._session.add(snapshot)
+        await self._session.flush()
         await self._session.refresh(model)
-        return _deserialize_process(model)
+        process = _deserialize_process(model)
+        process.graph_warnings = analysis.warnings
+        return process
 
     async def get_by_id(self, process_id: UUID) -> ProcessDefinition | None:
+        cached = definition_cache.get(KIND_PROCESS, process_id)
+        if cached is not None:
+            return cached
         result = await self._session.execute(
             select(ProcessDefinitionModel).where(ProcessDefinitionModel.id == str(process_id))
         )
         row = result.scalar_one_or_none()
         if not row:
             return None
-        return _deserialize_process(row)
+        process = _deserialize_process(row)
+        cache_definition(self._session, KIND_PROCESS, process_id, process.version, process)
+        return process
+
+    async def get_version(self, process_id: UUID, version: int) -> ProcessDefinition | None:
+        """Неизменяемая версия процесса, за которой закреплён экземпляр. Кэшируется навсегда — без инвалидации."""
+        key = (process_id, version)
+        cached = definition_cache.get(KIND_PROCESS_VERSION, key)
+        if cached is not None:
+            return cached
+        result = await self._session.execute(
+            select(ProcessDefinitionVersionModel).where(
+                ProcessDefinitionVersionModel.process_definition_id == str(process_id),
+                ProcessDefinitionVersionModel.version == version,
+            )
+        )
+        row = result.scalar_one_or_none()
+        if not row:
+            return None
+        process = _deserialize_process(row)
+        # Версия, созданная в ещё не закоммиченной транзакции, может быть откатана
+        if (KIND_PROCESS, process_id) not in pending_evictions(self._session.info):
+            definition_cache.put(KIND_PROCESS_VERSION, key, version, process)
+        return process
 
     async def list_all(self, project_id: UUID | None = None) -> list[ProcessDefinition]:
         q = select(ProcessDefinitionModel).order_by(ProcessDefinitionModel.name)
@@ -166,12 +244,18 @@ class ProcessDefinitionRepository:
         if project_id is not None:
             row.project_id = str(project_id) if project_id else None
         if nodes is not None:
-            row.nodes_schema = json.dumps(nodes)
+            row.nodes_schema = json_codec.dumps(nodes)
         if edges is not None:
-            row.edges_schema = json.dumps(edges)
+            row.edges_schema = json_codec.dumps(edges)
+        row.version = (row.version or 1) + 1
+        snapshot, analysis = _version_snapshot(row, check_graph=nodes is not None or edges is not None)
+        self._session.add(snapshot)
+        evict_definition(self._session, KIND_PROCESS, process_id)
         await self._session.flush()
         await self._session.refresh(row)
-        return _deserialize_process(row)
+        process = _deserialize_process(row)
+        process.graph_warnings = analysis.warnings
+        return process
 
     async def delete(self, process_id: UUID) -> bool:
         result = await self._session.execute(
@@ -181,5 +265,11 @@ class ProcessDefinitionRepository:
         if not row:
             return False
         await self._session.delete(row)
+        await self._session.execute(
+            delete(ProcessDefinitionVersionModel).where(
+                ProcessDefinitionVersionModel.process_definition_id == str(process_id)
+            )
+        )
+        evict_definition(self._session, KIND_PROCESS, process_id)
         await self._session.flush()
         return True
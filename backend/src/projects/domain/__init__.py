@@ -1,3 +1,3 @@
-from src.projects.domain.project import Project, ProjectField, Validator
+from src.projects.domain.project import Project, ProjectField, ProjectSummary, Validator
 
-__all__ = ["Project", "ProjectField", "Validator"]
+__all__ = ["Project", "ProjectField", "ProjectSummary", "Validator"]
@@ -32,3 +32,13 @@ class Project:
     list_columns: list[str] = field(default_factory=lambda: ["process_name", "status"])
     fields: list[ProjectField] = field(default_factory=list)
     validators: list[Validator] = field(default_factory=list)
+    version: int = 1  # увеличивается при каждом изменении (ключ кэша определений)
+
+
+@dataclass
+class ProjectSummary:
+    """Проект для списков и навигации — без полей, колонок и кода валидаторов."""
+    id: UUID
+    name: str
+    description: str = ""
+    sort_order: int = 0
@@ -3,13 +3,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from src.database import get_session
+from src.database import get_read_session, get_session
 from src.identity.domain import User
 from src.identity.infrastructure.deps import get_current_user_required, require_admin
+from src.observability.routing import TracedRoute
 from src.projects.domain import ProjectField, Validator
 from src.projects.infrastructure.repository import ProjectRepository
 
-router = APIRouter(prefix="/api/projects", tags=["projects"])
+router = APIRouter(prefix="/api/projects", tags=["projects"], route_class=TracedRoute)
 
 
 class ProjectFieldSchema(BaseModel):
@@ -55,7 +56,19 @@ class ProjectResponse(BaseModel):
     validators: list[ValidatorSchema] = []
 
 
-def get_project_repo(session=Depends(get_session)) -> ProjectRepository:
+class ProjectSummaryResponse(BaseModel):
+    id: str
+    name: str
+    description: str
+    sort_order: int
+
+
+def get_project_repo(session=Depends(get_session, scope="function")) -> ProjectRepository:
+    return ProjectRepository(session)
+
+
+def get_read_project_repo(session=Depends(get_read_session, scope="function")) -> ProjectRepository:
+    """Для GET-обработчиков: чтение с реплики, если она настроена."""
     return ProjectRepository(session)
 
 
@@ -136,20 +149,24 @@ async def create_project(
     return _to_response(project)
 
 
-@router.get("", response_model=list[ProjectResponse])
+@router.get("", response_model=list[ProjectSummaryResponse])
 async def list_projects(
     _user: User = Depends(get_current_user_required),
-    repo: ProjectRepository = Depends(get_project_repo),
+    repo: ProjectRepository = Depends(get_read_project_repo),
 ):
-    projects = await repo.list_all()
-    return [_to_response(p) for p in projects]
+    """Список для навигации: без полей, колонок и кода валидаторов (полный проект — GET /{project_id})."""
+    projects = await repo.list_summaries()
+    return [
+        ProjectSummaryResponse(id=str(p.id), name=p.name, description=p.description, sort_order=p.sort_order)
+        for p in projects
+    ]
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
     _user: User = Depends(get_current_user_required),
-    repo: ProjectRepository = Depends(get_project_repo),
+    repo: ProjectRepository = Depends(get_read_project_repo),
 ):
     project = await repo.get_by_id(project_id)
     if not project:
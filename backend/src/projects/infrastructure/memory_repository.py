@@ -0,0 +1,94 @@
+"""ProjectRepository без БД: проекты в словаре (бенчмарки, встроенный движок)."""
+from dataclasses import replace
+from uuid import UUID, uuid4
+
+from src.definition_cache import KIND_PROJECT, definition_cache
+from src.observability.tracing import traced_methods
+from src.projects.domain import Project, ProjectField, ProjectSummary, Validator
+
+
+@traced_methods("repository")
+class InMemoryProjectRepository:
+    """Тот же интерфейс, что у ProjectRepository. Возвращаемые проекты общие — вызывающий код их не изменяет."""
+
+    def __init__(self) -> None:
+        self._projects: dict[str, Project] = {}
+
+    async def create(
+        self,
+        name: str,
+        description: str = "",
+        sort_order: int = 0,
+        list_columns: list[str] | None = None,
+        fields: list[ProjectField] | None = None,
+        validators: list[Validator] | None = None,
+    ) -> Project:
+        project = Project(
+            id=uuid4(),
+            name=name,
+            description=description,
+            sort_order=sort_order,
+            list_columns=list(list_columns) if list_columns is not None else ["process_name", "status"],
+            fields=list(fields or []),
+            validators=list(validators or []),
+        )
+        self._projects[str(project.id)] = project
+        return project
+
+    async def get_by_id(self, project_id: UUID) -> Project | None:
+        return self._projects.get(str(project_id))
+
+    async def get_validators(self, project_id: UUID) -> tuple[list[Validator], int] | None:
+        project = self._projects.get(str(project_id))
+        return (project.validators, project.version) if project else None
+
+    async def get_list_columns(self, project_id: UUID) -> list[str] | None:
+        project = self._projects.get(str(project_id))
+        return project.list_columns if project else None
+
+    async def get_fields(self, project_id: UUID) -> list[ProjectField] | None:
+        project = self._projects.get(str(project_id))
+        return project.fields if project else None
+
+    async def list_summaries(self) -> list[ProjectSummary]:
+        return [
+            ProjectSummary(id=p.id, name=p.name, description=p.description, sort_order=p.sort_order)
+            for p in await self.list_all()
+        ]
+
+    async def list_all(self) -> list[Project]:
+        return sorted(self._projects.values(), key=lambda p: (p.sort_order, p.name))
+
+    async def update(
+        self,
+        project_id: UUID,
+        name: str | None = None,
+        description: str | None = None,
+        sort_order: int | None = None,
+        list_columns: list[str] | None = None,
+        fields: list[ProjectField] | None = None,
+        validators: list[Validator] | None = None,
+    ) -> Project | None:
+        current = self._projects.get(str(project_id))
+        if not current:
+            return None
+        project = replace(
+            current,
+            name=name if name is not None else current.name,
+            description=description if description is not None else current.description,
+            sort_order=sort_order if sort_order is not None else current.sort_order,
+            list_columns=list(list_columns) if list_columns is not None else current.list_columns,
+            fields=list(fields) if fields is not None else current.fields,
+            validators=list(validators) if validators is not None else current.validators,
+            version=current.version + 1,
+        )
+        self._projects[str(project_id)] = project
+        definition_cache.invalidate(KIND_PROJECT, project.id)
+        return project
+
+    async def delete(self, project_id: UUID) -> bool:
+        project = self._projects.pop(str(project_id), None)
+        if project is None:
+            return False
+        definition_cache.invalidate(KIND_PROJECT, project.id)
+        return True
@@ -18,3 +18,4 @@ class ProjectModel(Base):
     list_columns: Mapped[str] = mapped_column(Text, nullable=False, default=_DEFAULT_LIST_COLUMNS)
     fields_schema: Mapped[str] = mapped_column(Text, nullable=False, default=_DEFAULT_FIELDS_SCHEMA)
     validators_schema: Mapped[str] = mapped_column(Text, nullable=False, default=_DEFAULT_VALIDATORS_SCHEMA)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
@@ -1,10 +1,21 @@
-import json
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.projects.domain import Project, ProjectField, Validator
+from src import json_codec
+from src.definition_cache import (
+    KIND_PROJECT,
+    KIND_PROJECT_FIELDS,
+    KIND_PROJECT_LIST_COLUMNS,
+    KIND_PROJECT_VALIDATORS,
+    cache_definition,
+    definition_cache,
+    evict_definition,
+)
+from src.observability.tracing import traced_methods
+from src.projects.domain import Project, ProjectField, ProjectSummary, Validator
 from src.projects.infrastructure.models import ProjectModel
 
 
@@ -12,9 +23,9 @@ def _parse_list_columns(raw: str | None) -> list[str]:
     if not raw:
         return ["process_name", "status"]
     try:
-        parsed = json.loads(raw)
+        parsed = json_codec.loads(raw)
         return parsed if isinstance(parsed, list) else ["process_name", "status"]
-    except (json.JSONDecodeError, TypeError):
+    except (json_codec.JSONDecodeError, TypeError):
         return ["process_name", "status"]
 
 
@@ -22,7 +33,7 @@ def _parse_fields_schema(raw: str | None) -> list[ProjectField]:
     if not raw:
         return []
     try:
-        parsed = json.loads(raw)
+        parsed = json_codec.loads(raw)
         if not isinstance(parsed, list):
             return []
         out = []
@@ -36,7 +47,7 @@ def _parse_fields_schema(raw: str | None) -> list[ProjectField]:
                     options=item.get("options") if isinstance(item.get("options"), list) else None,
                 ))
         return out
-    except (json.JSONDecodeError, TypeError):
+    except (json_codec.JSONDecodeError, TypeError):
         return []
 
 
@@ -51,7 +62,7 @@ def _serialize_fields(fields: list[ProjectField]) -> str:
         }
         for f in fields
     ]
-    return json.dumps(arr)
+    return json_codec.dumps(arr)
 
 
 def _validator_key_from_item(item: dict, index: int) -> str:
@@ -67,7 +78,7 @@ def _parse_validators_schema(raw: str | None) -> list[Validator]:
     if not raw:
         return []
     try:
-        parsed = json.loads(raw)
+        parsed = json_codec.loads(raw)
         if not isinstance(parsed, list):
             return []
         out = []
@@ -81,15 +92,29 @@ def _parse_validators_schema(raw: str | None) -> list[Validator]:
                     code=str(item["code"]),
                 ))
         return out
-    except (json.JSONDecodeError, TypeError):
+    except (json_codec.JSONDecodeError, TypeError):
         return []
 
 
 def _serialize_validators(validators: list[Validator]) -> str:
     arr = [{"key": v.key, "name": v.name, "type": v.type, "code": v.code} for v in validators]
-    return json.dumps(arr)
+    return json_codec.dumps(arr)
 
 
+def _deserialize_project(row: ProjectModel) -> Project:
+    return Project(
+        id=UUID(row.id),
+        name=row.name,
+        description=row.description or "",
+        sort_order=row.sort_order or 0,
+        list_columns=_parse_list_columns(getattr(row, "list_columns", None)),
+        fields=_parse_fields_schema(getattr(row, "fields_schema", None)),
+        validators=_parse_validators_schema(getattr(row, "validators_schema", None)),
+        version=getattr(row, "version", None) or 1,
+    )
+
+
+@traced_methods("repository")
 class ProjectRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -108,58 +133,94 @@ class ProjectRepository:
             name=name,
             description=description,
             sort_order=sort_order,
-            list_columns=json.dumps(cols),
+            list_columns=json_codec.dumps(cols),
             fields_schema=_serialize_fields(fields or []),
             validators_schema=_serialize_validators(validators or []),
         )
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
-        return Project(
-            id=UUID(model.id),
-            name=model.name,
-            description=model.description or "",
-            sort_order=model.sort_order or 0,
-            list_columns=_parse_list_columns(model.list_columns),
-            fields=_parse_fields_schema(getattr(model, "fields_schema", None)),
-            validators=_parse_validators_schema(getattr(model, "validators_schema", None)),
-        )
+        return _deserialize_project(model)
 
     async def get_by_id(self, project_id: UUID) -> Project | None:
+        cached = definition_cache.get(KIND_PROJECT, project_id)
+        if cached is not None:
+            return cached
         result = await self._session.execute(
             select(ProjectModel).where(ProjectModel.id == str(project_id))
         )
         row = result.scalar_one_or_none()
         if not row:
             return None
-        return Project(
-            id=UUID(row.id),
-            name=row.name,
-            description=row.description or "",
-            sort_order=row.sort_order or 0,
-            list_columns=_parse_list_columns(getattr(row, "list_columns", None)),
-            fields=_parse_fields_schema(getattr(row, "fields_schema", None)),
-            validators=_parse_validators_schema(getattr(row, "validators_schema", None)),
+        project = _deserialize_project(row)
+        cache_definition(self._session, KIND_PROJECT, project_id, project.version, project)
+        return project
+
+    async def _projection(self, kind: str, project_id: UUID, column, attribute: str, parse) -> tuple[Any, int] | None:
+        """(значение, версия строки) одной колонки проекта: из кэша проекции, из полного проекта в кэше
+        или запросом только этой колонки с разбором только её JSON."""
+        cached = definition_cache.get(kind, project_id)
+        if cached is not None:
+            return cached
+        project = definition_cache.get(KIND_PROJECT, project_id)
+        if project is not None:
+            out = (getattr(project, attribute), project.version)
+            cache_definition(self._session, kind, project_id, project.version, out)
+            return out
+        result = await self._session.execute(
+            select(ProjectModel.version, column).where(ProjectModel.id == str(project_id))
+        )
+        row = result.one_or_none()
+        if not row:
+            return None
+        version = row.version or 1
+        out = (parse(row[1]), version)
+        cache_definition(self._session, kind, project_id, version, out)
+        return out
+
+    async def get_validators(self, project_id: UUID) -> tuple[list[Validator], int] | None:
+        """Валидаторы проекта и версия строки — для runtime. Читает и разбирает только validators_schema."""
+        return await self._projection(
+            KIND_PROJECT_VALIDATORS, project_id, ProjectModel.validators_schema, "validators", _parse_validators_schema
         )
 
-    async def list_all(self) -> list[Project]:
+    async def get_list_columns(self, project_id: UUID) -> list[str] | None:
+        """Колонки списка документов — читает и разбирает только list_columns."""
+        out = await self._projection(
+            KIND_PROJECT_LIST_COLUMNS, project_id, ProjectModel.list_columns, "list_columns", _parse_list_columns
+        )
+        return out[0] if out else None
+
+    async def get_fields(self, project_id: UUID) -> list[ProjectField] | None:
+        """Поля проекта (конструктор форм) — читает и разбирает только fields_schema."""
+        out = await self._projection(
+            KIND_PROJECT_FIELDS, project_id, ProjectModel.fields_schema, "fields", _parse_fields_schema
+        )
+        return out[0] if out else None
+
+    async def list_summaries(self) -> list[ProjectSummary]:
+        """Список проектов без полей, колонок и валидаторов (навигация, выбор проекта)."""
         result = await self._session.execute(
-            select(ProjectModel).order_by(ProjectModel.sort_order, ProjectModel.name)
+            select(ProjectModel.id, ProjectModel.name, ProjectModel.description, ProjectModel.sort_order)
+            .order_by(ProjectModel.sort_order, ProjectModel.name)
         )
-        rows = result.scalars().all()
         return [
-            Project(
+            ProjectSummary(
                 id=UUID(r.id),
                 name=r.name,
                 description=r.description or "",
                 sort_order=r.sort_order or 0,
-                list_columns=_parse_list_columns(getattr(r, "list_columns", None)),
-                fields=_parse_fields_schema(getattr(r, "fields_schema", None)),
-                validators=_parse_validators_schema(getattr(r, "validators_schema", None)),
             )
-            for r in rows
+            for r in result.all()
         ]
 
+    async def list_all(self) -> list[Project]:
+        result = await self._session.execute(
+            select(ProjectModel).order_by(ProjectModel.sort_order, ProjectModel.name)
+        )
+        rows = result.scalars().all()
+        return [_deserialize_project(r) for r in rows]
+
     async def update(
         self,
         project_id: UUID,
@@ -183,22 +244,16 @@ class ProjectRepository:
         if sort_order is not None:
             row.sort_order = sort_order
         if list_columns is not None:
-            row.list_columns = json.dumps(list_columns)
+            row.list_columns = json_codec.dumps(list_columns)
         if fields is not None:
             row.fields_schema = _serialize_fields(fields)
         if validators is not None:
             row.validators_schema = _serialize_validators(validators)
+        row.version = (row.version or 1) + 1
+        evict_definition(self._session, KIND_PROJECT, project_id)
         await self._session.flush()
         await self._session.refresh(row)
-        return Project(
-            id=UUID(row.id),
-            name=row.name,
-            description=row.description or "",
-            sort_order=row.sort_order or 0,
-            list_columns=_parse_list_columns(getattr(row, "list_columns", None)),
-            fields=_parse_fields_schema(getattr(row, "fields_schema", None)),
-            validators=_parse_validators_schema(getattr(row, "validators_schema", None)),
-        )
+        return _deserialize_project(row)
 
     async def delete(self, project_id: UUID) -> bool:
         result = await self._session.execute(
@@ -208,5 +263,6 @@ class ProjectRepository:
         if not row:
             return False
         await self._session.delete(row)
+        evict_definition(self._session, KIND_PROJECT, project_id)
         await self._session.flush()
         return True
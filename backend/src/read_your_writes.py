@@ -0,0 +1,65 @@
+"""
+Чтение своих записей при реплике (DATABASE_READ_URL): клиент, который только что писал, читает с primary.
+Время записи хранится у клиента в короткой cookie, поэтому признак виден любому воркеру, а не только принявшему запись.
+get_session отмечает запись в request.state после commit (до отправки ответа), ReadYourWritesMiddleware
+выставляет по отметке cookie, get_read_session по cookie выбирает primary.
+"""
+from __future__ import annotations
+
+import math
+import time
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+
+WROTE_AT_COOKIE = "bpm_wrote_at"
+_STATE_KEY = "wrote_at"
+
+
+def mark_write(request: Request) -> None:
+    """Запись закоммичена: ответ на этот запрос выставит cookie со временем записи."""
+    request.state.wrote_at = time.time()
+
+
+def wrote_recently(request: Request) -> bool:
+    """Клиент писал не раньше чем database_read_fallback_seconds назад (по cookie; часы сравниваются серверные)."""
+    raw = request.cookies.get(WROTE_AT_COOKIE)
+    if not raw:
+        return False
+    try:
+        wrote_at = float(raw)
+    except ValueError:
+        return False
+    return time.time() - wrote_at < settings.database_read_fallback_seconds
+
+
+def _set_cookie_header(wrote_at: float) -> bytes:
+    max_age = math.ceil(settings.database_read_fallback_seconds)
+    return f"{WROTE_AT_COOKIE}={wrote_at:.3f}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax".encode("latin-1")
+
+
+class ReadYourWritesMiddleware:
+    """Добавляет Set-Cookie с временем записи к ответу, если обработчик закоммитил изменения (см. mark_write)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # Общий словарь состояния: request.state внутри обработчика пишет в него же
+        state = scope.setdefault("state", {})
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                wrote_at = state.get(_STATE_KEY)
+                if wrote_at is not None:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"set-cookie", _set_cookie_header(wrote_at)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -159,6 +159,31 @@ def _parse_or(tokens: list[str], pos: int, context: dict[str, Any]) -> tuple[Any
     return left, pos
 
 
+class CompiledExpression:
+    """Выражение, разобранное на токены один раз; вычисляется многократно на разных контекстах."""
+
+    __slots__ = ("source", "_tokens")
+
+    def __init__(self, expression: str | None):
+        self.source = expression or ""
+        self._tokens = _tokenize(self.source.strip()) if self.source.strip() else []
+
+    def evaluate(self, context: dict[str, Any]) -> bool:
+        if not self._tokens:
+            return True
+        try:
+            result, pos = _parse_or(self._tokens, 0, context)
+            if pos != len(self._tokens):
+                return False
+            return bool(result)
+        except (ValueError, KeyError, TypeError):
+            return False
+
+
+def compile_expression(expression: str | None) -> CompiledExpression:
+    return CompiledExpression(expression)
+
+
 def evaluate_expression(expression: str, context: dict[str, Any]) -> bool:
     """
     Вычисляет выражение в контексте. Возвращает bool.
@@ -166,16 +191,7 @@ def evaluate_expression(expression: str, context: dict[str, Any]) -> bool:
     """
     if not expression or not expression.strip():
         return True
-    tokens = _tokenize(expression.strip())
-    if not tokens:
-        return True
-    try:
-        result, pos = _parse_or(tokens, 0, context)
-        if pos != len(tokens):
-            return False
-        return bool(result)
-    except (ValueError, KeyError, TypeError):
-        return False
+    return CompiledExpression(expression).evaluate(context)
 
 
 def evaluate_field_access(
@@ -6,10 +6,11 @@ from __future__ import annotations
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import cache
+from types import CodeType
 from typing import Any
 
-from RestrictedPython import compile_restricted_exec, safe_globals
-from RestrictedPython.Eval import default_guarded_getiter
+from src.observability.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -20,29 +21,53 @@ FIELD_VISIBILITY_TYPE = "field_visibility"
 STEP_ACCESS_TYPE = "step_access"
 
 
+@cache
+def _restricted_python():
+    """RestrictedPython импортируется при первой компиляции валидатора, а не при импорте приложения
+    (заметная доля холодного старта воркера)."""
+    import RestrictedPython
+    import RestrictedPython.Eval
+
+    return RestrictedPython, RestrictedPython.Eval
+
+
 def _get_restricted_globals(context: dict[str, Any], node_id: str | None) -> dict[str, Any]:
     """Globals для выполнения кода: только context, node_id и безопасные builtins."""
+    restricted, restricted_eval = _restricted_python()
+    safe_globals = restricted.safe_globals
     g = dict(safe_globals)
     g["context"] = context
     g["node_id"] = node_id
     g["__builtins__"] = safe_globals.get("__builtins__", {})
-    g["_getiter_"] = default_guarded_getiter
+    g["_getiter_"] = restricted_eval.default_guarded_getiter
     g["__name__"] = "validator"
     return g
 
 
-def _run_code(code: str, context: dict[str, Any], node_id: str | None) -> dict[str, Any]:
-    """Компилирует и выполняет код в ограниченном globals. Возвращает globals после exec."""
-    g = _get_restricted_globals(context, node_id)
-    result = compile_restricted_exec(code, filename="<validator>")
+def compile_validator(code: str) -> CodeType:
+    """Компилирует код валидатора в песочнице RestrictedPython. SyntaxError при ошибке компиляции."""
+    restricted, _ = _restricted_python()
+    result = restricted.compile_restricted_exec(code, filename="<validator>")
     if result.errors:
         raise SyntaxError("; ".join(str(err) for err in result.errors))
     if result.code is None:
         raise SyntaxError("Compilation failed")
-    exec(result.code, g)
+    return result.code
+
+
+def _run_code(code: str | CodeType, context: dict[str, Any], node_id: str | None) -> dict[str, Any]:
+    """Выполняет код (исходник или заранее скомпилированный) в ограниченном globals. Возвращает globals после exec."""
+    g = _get_restricted_globals(context, node_id)
+    compiled = code if isinstance(code, CodeType) else compile_validator(code)
+    exec(compiled, g)
     return g
 
 
+def _validator_code(v: Any) -> str | CodeType:
+    """Скомпилированный код валидатора (если есть, см. ExecutionBundle) или исходник."""
+    return getattr(v, "compiled", None) or getattr(v, "code", "") or ""
+
+
 def run_field_visibility_validators(
     validators: list[Any],
     context: dict[str, Any],
@@ -61,27 +86,28 @@ def run_field_visibility_validators(
     for v in validators or []:
         if getattr(v, "type", None) != FIELD_VISIBILITY_TYPE:
             continue
-        code = getattr(v, "code", "") or ""
-        if not code.strip():
+        if not (getattr(v, "code", "") or "").strip():
             continue
-        try:
-            out = _EXECUTOR.submit(
-                _run_code,
-                code,
-                flat_ctx,
-                None,
-            ).result(timeout=_TIMEOUT_SEC)
-            validate_fn = out.get("validate")
-            if callable(validate_fn):
-                perm_map = validate_fn(flat_ctx)
-                if isinstance(perm_map, dict):
-                    for key, val in perm_map.items():
-                        if isinstance(val, str) and val in ("hidden", "read", "write"):
-                            result[str(key)] = val
-        except FuturesTimeoutError:
-            logger.warning("Validator field_visibility timed out: %s", getattr(v, "name", "?"))
-        except Exception as e:
-            logger.warning("Validator field_visibility error: %s", e, exc_info=True)
+        code = _validator_code(v)
+        with tracer.span("validator", "validator", type=FIELD_VISIBILITY_TYPE, name=getattr(v, "name", "?")):
+            try:
+                out = _EXECUTOR.submit(
+                    _run_code,
+                    code,
+                    flat_ctx,
+                    None,
+                ).result(timeout=_TIMEOUT_SEC)
+                validate_fn = out.get("validate")
+                if callable(validate_fn):
+                    perm_map = validate_fn(flat_ctx)
+                    if isinstance(perm_map, dict):
+                        for key, val in perm_map.items():
+                            if isinstance(val, str) and val in ("hidden", "read", "write"):
+                                result[str(key)] = val
+            except FuturesTimeoutError:
+                logger.warning("Validator field_visibility timed out: %s", getattr(v, "name", "?"))
+            except Exception as e:
+                logger.warning("Validator field_visibility error: %s", e, exc_info=True)
     return result
 
 
@@ -102,28 +128,29 @@ def run_step_access_validators(
     for v in validators or []:
         if getattr(v, "type", None) != STEP_ACCESS_TYPE:
             continue
-        code = getattr(v, "code", "") or ""
-        if not code.strip():
+        if not (getattr(v, "code", "") or "").strip():
             continue
-        try:
-            out = _EXECUTOR.submit(
-                _run_code,
-                code,
-                flat_ctx,
-                node_id,
-            ).result(timeout=_TIMEOUT_SEC)
-            validate_fn = out.get("validate")
-            if callable(validate_fn):
-                if not validate_fn(flat_ctx, node_id):
-                    return False
-            else:
-                allowed = out.get("result", out.get("allowed", True))
-                if not bool(allowed):
-                    return False
-        except FuturesTimeoutError:
-            logger.warning("Validator step_access timed out: %s", getattr(v, "name", "?"))
-            return False
-        except Exception as e:
-            logger.warning("Validator step_access error: %s", e, exc_info=True)
-            return False
+        code = _validator_code(v)
+        with tracer.span("validator", "validator", type=STEP_ACCESS_TYPE, name=getattr(v, "name", "?")):
+            try:
+                out = _EXECUTOR.submit(
+                    _run_code,
+                    code,
+                    flat_ctx,
+                    node_id,
+                ).result(timeout=_TIMEOUT_SEC)
+                validate_fn = out.get("validate")
+                if callable(validate_fn):
+                    if not validate_fn(flat_ctx, node_id):
+                        return False
+                else:
+                    allowed = out.get("result", out.get("allowed", True))
+                    if not bool(allowed):
+                        return False
+            except FuturesTimeoutError:
+                logger.warning("Validator step_access timed out: %s", getattr(v, "name", "?"))
+                return False
+            except Exception as e:
+                logger.warning("Validator step_access error: %s", e, exc_info=True)
+                return False
     return True
@@ -0,0 +1,116 @@
+"""
+Пакет исполнения процесса: всё, что нужно runtime для версии процесса, собранное и скомпилированное один раз —
+индексированный граф, скомпилированные условия рёбер, скомпилированные валидаторы проекта по узлам и рёбрам,
+формы узлов. Справочники в пакет не входят: они меняются независимо и берутся из кэша определений.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Any
+from uuid import UUID
+
+from src.form_builder.domain import FormDefinition
+from src.process_design.domain import Edge, Node, ProcessDefinition
+from src.rules.evaluator import CompiledExpression, compile_expression
+from src.rules.validator_runner import (
+    FIELD_VISIBILITY_TYPE,
+    STEP_ACCESS_TYPE,
+    compile_validator,
+    run_step_access_validators,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledValidator:
+    """Валидатор проекта с заранее скомпилированным кодом (compiled=None — код не компилируется,
+    ошибка всплывёт при выполнении и будет обработана validator_runner как раньше)."""
+    key: str
+    name: str
+    type: str
+    code: str
+    compiled: CodeType | None
+
+
+@dataclass(slots=True)
+class ExecutionBundle:
+    process: ProcessDefinition
+    edge_conditions: dict[str, CompiledExpression] = field(default_factory=dict)  # edge.id -> условие
+    field_visibility: dict[str, tuple[CompiledValidator, ...]] = field(default_factory=dict)  # node.id -> валидаторы
+    step_access: dict[str, tuple[CompiledValidator, ...]] = field(default_factory=dict)  # edge.id -> валидаторы
+    forms: dict[str, FormDefinition] = field(default_factory=dict)  # form_definition_id -> форма
+
+    def form_for_node(self, node: Node) -> FormDefinition | None:
+        if not node.form_definition_id:
+            return None
+        return self.forms.get(node.form_definition_id)
+
+    def condition_holds(self, edge: Edge, context: dict[str, Any]) -> bool:
+        condition = self.edge_conditions.get(edge.id)
+        return condition is None or condition.evaluate(context)
+
+    def transition_allowed(self, edge: Edge, context: dict[str, Any]) -> bool:
+        """Валидаторы step_access, привязанные к ребру (нет валидаторов — переход разрешён)."""
+        validators = self.step_access.get(edge.id)
+        if not validators:
+            return True
+        return run_step_access_validators(list(validators), context, edge.target_node_id)
+
+
+def _compile_validator(v: Any) -> CompiledValidator:
+    code = getattr(v, "code", "") or ""
+    compiled = None
+    if code.strip():
+        try:
+            compiled = compile_validator(code)
+        except SyntaxError as e:
+            logger.warning("Validator %s does not compile: %s", getattr(v, "key", "?"), e)
+    return CompiledValidator(key=v.key, name=v.name, type=v.type, code=code, compiled=compiled)
+
+
+def _select(validators: list[CompiledValidator], validator_type: str, keys: list[str] | None) -> tuple[CompiledValidator, ...]:
+    """Валидаторы нужного типа с ключами из keys — в порядке их объявления в проекте."""
+    if not keys:
+        return ()
+    key_set = set(keys)
+    return tuple(v for v in validators if v.type == validator_type and v.key in key_set)
+
+
+def form_ids_of(process: ProcessDefinition) -> list[str]:
+    """Уникальные form_definition_id узлов процесса (в порядке узлов)."""
+    seen: dict[str, None] = {}
+    for n in process.nodes:
+        if n.form_definition_id:
+            seen.setdefault(n.form_definition_id, None)
+    return list(seen)
+
+
+def parse_uuid(value: str | None) -> UUID | None:
+    """UUID из строкового id в схемах (form_definition_id узла, catalog_id поля); None — пусто или не UUID."""
+    try:
+        return UUID(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def build_execution_bundle(
+    process: ProcessDefinition,
+    project_validators: list[Any],
+    forms: dict[str, FormDefinition],
+) -> ExecutionBundle:
+    validators = [_compile_validator(v) for v in project_validators or []]
+    bundle = ExecutionBundle(process=process, forms=dict(forms))
+    for e in process.edges:
+        if e.condition_expression and e.condition_expression.strip():
+            bundle.edge_conditions[e.id] = compile_expression(e.condition_expression)
+        selected = _select(validators, STEP_ACCESS_TYPE, getattr(e, "transition_validator_keys", None))
+        if selected:
+            bundle.step_access[e.id] = selected
+    for n in process.nodes:
+        selected = _select(validators, FIELD_VISIBILITY_TYPE, getattr(n, "validator_keys", None))
+        if selected:
+            bundle.field_visibility[n.id] = selected
+    return bundle
@@ -1,10 +1,18 @@
 from uuid import UUID
 
+from src.definition_cache import KIND_BUNDLE, KIND_FORM, KIND_PROJECT_VALIDATORS, definition_cache
+from src.observability.tracing import traced_methods
+from src.process_design.domain import Edge, NodeType
+from src.runtime.application.execution_bundle import (
+    ExecutionBundle,
+    build_execution_bundle,
+    form_ids_of,
+    parse_uuid,
+)
 from src.runtime.domain import ProcessInstance, FormSubmission, InstanceStatus
-from src.rules.evaluator import evaluate_expression
-from src.rules.validator_runner import run_step_access_validators
 
 
+@traced_methods("service")
 class RuntimeService:
     def __init__(self, instance_repo, submission_repo, process_repo, form_repo, project_repo=None):
         self._instance_repo = instance_repo
@@ -14,20 +22,56 @@ class RuntimeService:
         self._project_repo = project_repo
 
     async def start_process(self, process_definition_id: UUID) -> ProcessInstance | None:
-        process = await self._process_repo.get_by_id(process_definition_id)
-        if not process:
+        bundle = await self.get_bundle(process_definition_id)
+        if not bundle:
             return None
+        process = bundle.process
         start_node = process.get_start_node()
         if not start_node:
             return None
+        # Экземпляр сразу встаёт на первый шаг с формой по таблице маршрутов — GET current-form ничего не пишет
         instance = await self._instance_repo.create(
             process_definition_id=process_definition_id,
-            current_node_id=start_node.id,
+            current_node_id=process.resolve_node(start_node.id) or start_node.id,
             status=InstanceStatus.ACTIVE,
             context={},
+            process_version=process.version,
         )
         return instance
 
+    async def get_bundle(self, process_id: UUID, version: int | None = None) -> ExecutionBundle | None:
+        """Пакет исполнения версии процесса (по умолчанию — текущей). Собирается один раз и кэшируется
+        по (process_id, version); сбрасывается при изменении входящих в него форм или валидаторов проекта."""
+        if version is None:
+            latest = await self._process_repo.get_by_id(process_id)
+            if not latest:
+                return None
+            version = latest.version
+        key = (process_id, version)
+        cached = definition_cache.get(KIND_BUNDLE, key)
+        if cached is not None:
+            return cached
+        process = await self._process_repo.get_version(process_id, version)
+        if not process:
+            return None
+        depends_on = {}
+        validators = []
+        if process.project_id and self._project_repo:
+            loaded = await self._project_repo.get_validators(process.project_id)
+            if loaded:
+                validators, project_version = loaded
+                depends_on[(KIND_PROJECT_VALIDATORS, process.project_id)] = project_version
+        forms = {}
+        for form_id in form_ids_of(process):
+            form_uuid = parse_uuid(form_id)
+            form = await self._form_repo.get_by_id(form_uuid) if form_uuid else None
+            if form:
+                forms[form_id] = form
+                depends_on[(KIND_FORM, form_uuid)] = form.version
+        bundle = build_execution_bundle(process, validators, forms)
+        definition_cache.put(KIND_BUNDLE, key, version, bundle, depends_on=depends_on)
+        return bundle
+
     async def get_instance(self, instance_id: UUID) -> ProcessInstance | None:
         return await self._instance_repo.get_by_id(instance_id)
 
@@ -41,19 +85,41 @@ class RuntimeService:
                 flat.update(v)
         return flat
 
-    async def list_documents(self, project_id: UUID | None = None) -> list[dict]:
-        """Список документов (экземпляров процессов). Если задан project_id — только из этого подпроекта."""
+    async def _list_columns(self, project_id: UUID | None, cache: dict) -> list[str]:
+        if project_id not in cache:
+            columns = await self._project_repo.get_list_columns(project_id) if project_id and self._project_repo else None
+            cache[project_id] = columns or []
+        return cache[project_id]
+
+    async def list_documents(
+        self,
+        project_id: UUID | None = None,
+        fields: list[str] | None = None,
+        full_context: bool = False,
+    ) -> list[dict]:
+        """Список документов (экземпляров процессов). Если задан project_id — только из этого подпроекта.
+        context каждого документа сокращается до fields, а без fields — до колонок списка (list_columns)
+        его проекта; full_context=True — context целиком."""
         instances = await self._instance_repo.list_all()
         if project_id is not None:
             processes_in_project = await self._process_repo.list_all(project_id=project_id)
             pid_set = {p.id for p in processes_in_project}
             instances = [i for i in instances if i.process_definition_id in pid_set]
+        processes: dict = {}
+        columns_by_project: dict = {}
         out = []
         for inst in instances:
-            process = await self._process_repo.get_by_id(inst.process_definition_id)
+            if inst.process_definition_id not in processes:
+                processes[inst.process_definition_id] = await self._process_repo.get_by_id(inst.process_definition_id)
+            process = processes[inst.process_definition_id]
             # В списке отдаём «плоский» context: данные форм по шагам хранятся как context[node_id],
             # для колонок нужны значения по ключам полей
             flat_ctx = self._flatten_context(inst.context or {})
+            if not full_context:
+                keys = fields if fields is not None else await self._list_columns(
+                    process.project_id if process else None, columns_by_project
+                )
+                flat_ctx = {k: flat_ctx[k] for k in keys if k in flat_ctx}
             out.append({
                 "id": str(inst.id),
                 "document_number": inst.document_number,
@@ -68,32 +134,43 @@ class RuntimeService:
 
     async def get_current_form(self, instance_id: UUID, role_ids: list[str] | None = None):
         """Возвращает (form_definition, node_id, instance) для текущего шага или None если процесс завершён.
-        Если текущий узел без формы (например start) — переходим по рёбрам к первому узлу с формой."""
+        Если текущий узел без формы (например start, у старых экземпляров) — шаг с формой берётся из таблицы
+        маршрутов версии процесса; экземпляр при этом не изменяется."""
         instance = await self._instance_repo.get_by_id(instance_id)
         if not instance or not instance.is_active or not instance.current_node_id:
             return None
-        process = await self._process_repo.get_by_id(instance.process_definition_id)
-        if not process:
+        bundle = await self.get_bundle(instance.process_definition_id, instance.process_version)
+        if not bundle:
             return None
-        node_id = instance.current_node_id
-        visited = set()
-        while node_id and node_id not in visited:
-            visited.add(node_id)
-            node = process.get_node(node_id)
-            if not node:
-                return None
-            if node.form_definition_id:
-                form = await self._form_repo.get_by_id(UUID(node.form_definition_id))
-                if form:
-                    if node_id != instance.current_node_id:
-                        await self._instance_repo.update(instance_id, current_node_id=node_id)
-                        instance = await self._instance_repo.get_by_id(instance_id)
-                    return {"form": form, "node_id": node.id, "instance": instance, "role_ids": role_ids or []}
-            edges = process.get_edges_from(node_id)
-            if not edges:
-                return None
-            node_id = edges[0].target_node_id
-        return None
+        node_id = bundle.process.resolve_node(instance.current_node_id)
+        node = bundle.process.get_node(node_id) if node_id else None
+        form = bundle.form_for_node(node) if node else None
+        if not form:
+            return None
+        return {
+            "form": form,
+            "node_id": node.id,
+            "instance": instance,
+            "role_ids": role_ids or [],
+            "bundle": bundle,
+        }
+
+    async def _is_current_node(self, instance: ProcessInstance, node_id: str) -> bool:
+        """node_id — текущий шаг активного экземпляра (с учётом таблицы маршрутов)."""
+        if not instance.is_active or not instance.current_node_id:
+            return False
+        if instance.current_node_id == node_id:
+            return True
+        bundle = await self.get_bundle(instance.process_definition_id, instance.process_version)
+        return bool(bundle) and bundle.process.resolve_node(instance.current_node_id) == node_id
+
+    def get_available_transitions(self, bundle: ExecutionBundle, node_id: str, flat_ctx: dict) -> list[Edge]:
+        """Исходящие рёбра узла, чьё условие выполнено и валидаторы step_access разрешают переход."""
+        return [
+            e
+            for e in bundle.process.get_edges_from(node_id)
+            if bundle.condition_holds(e, flat_ctx) and bundle.transition_allowed(e, flat_ctx)
+        ]
 
     async def get_submission_data(self, instance_id: UUID, node_id: str) -> dict | None:
         """Данные формы для узла (уже сохранённые)."""
@@ -109,7 +186,7 @@ class RuntimeService:
     ) -> bool:
         """Сохраняет данные формы текущего шага без перехода. Возвращает True при успехе."""
         instance = await self._instance_repo.get_by_id(instance_id)
-        if not instance or not instance.is_active or instance.current_node_id != node_id:
+        if not instance or not await self._is_current_node(instance, node_id):
             return False
         updated = await self._submission_repo.update_data(instance_id, node_id, data)
         if not updated:
@@ -138,11 +215,12 @@ class RuntimeService:
         chosen_edge_key: str | None = None,
     ) -> ProcessInstance | None:
         instance = await self._instance_repo.get_by_id(instance_id)
-        if not instance or not instance.is_active or instance.current_node_id != node_id:
+        if not instance or not await self._is_current_node(instance, node_id):
             return None
-        process = await self._process_repo.get_by_id(instance.process_definition_id)
-        if not process:
+        bundle = await self.get_bundle(instance.process_definition_id, instance.process_version)
+        if not bundle:
             return None
+        process = bundle.process
         node = process.get_node(node_id)
         if not node or str(node.form_definition_id) != str(form_definition_id):
             return None
@@ -159,35 +237,30 @@ class RuntimeService:
         if chosen_edge is None:
             if len(edges) == 1:
                 e = edges[0]
-                if not e.condition_expression or evaluate_expression(e.condition_expression, flat_ctx):
+                if bundle.condition_holds(e, flat_ctx):
                     chosen_edge = e
             elif len(edges) > 1:
                 for e in edges:
-                    if e.condition_expression and not evaluate_expression(e.condition_expression, flat_ctx):
+                    if not bundle.condition_holds(e, flat_ctx):
                         continue
                     chosen_edge = e
                     break
                 if not chosen_edge and edges:
                     chosen_edge = edges[0]
         next_node_id = chosen_edge.target_node_id if chosen_edge else None
-        if chosen_edge:
-            keys = getattr(chosen_edge, "transition_validator_keys", None) or []
-            if keys and process.project_id and self._project_repo:
-                project = await self._project_repo.get_by_id(process.project_id)
-                if project and getattr(project, "validators", None):
-                    key_set = set(keys)
-                    transition_validators = [v for v in project.validators if getattr(v, "type", None) == "step_access" and getattr(v, "key", None) in key_set]
-                    if transition_validators:
-                        if not run_step_access_validators(transition_validators, flat_ctx, chosen_edge.target_node_id):
-                            return None
+        if chosen_edge and not bundle.transition_allowed(chosen_edge, flat_ctx):
+            return None
         next_node = process.get_node(next_node_id) if next_node_id else None
+        # Узел без формы (шлюз и т.п.) сразу разрешаем по таблице маршрутов до шага с формой или END
+        target_id = process.resolve_node(next_node.id) if next_node else None
+        target = process.get_node(target_id) if target_id else None
         await self._submission_repo.create(
             process_instance_id=instance_id,
             node_id=node_id,
             form_definition_id=form_definition_id,
             data=data,
         )
-        if not next_node:
+        if not next_node or (target and target.node_type == NodeType.END):
             await self._instance_repo.update(
                 instance_id,
                 current_node_id=None,
@@ -195,17 +268,9 @@ class RuntimeService:
                 context=new_context,
             )
         else:
-            if next_node.node_type.value == "end":
-                await self._instance_repo.update(
-                    instance_id,
-                    current_node_id=None,
-                    status=InstanceStatus.COMPLETED,
-                    context=new_context,
-                )
-            else:
-                await self._instance_repo.update(
-                    instance_id,
-                    current_node_id=next_node.id,
-                    context=new_context,
-                )
+            await self._instance_repo.update(
+                instance_id,
+                current_node_id=target.id if target else next_node.id,
+                context=new_context,
+            )
         return await self._instance_repo.get_by_id(instance_id)
@@ -19,6 +19,7 @@ class ProcessInstance:
     current_node_id: str | None
     status: InstanceStatus
     context: dict[str, Any]  # данные, накопленные по шагам (form submissions)
+    process_version: int = 1  # версия определения процесса, за которой закреплён экземпляр
 
     @property
     def is_active(self) -> bool:
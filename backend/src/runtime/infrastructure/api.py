@@ -1,21 +1,23 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from src.database import get_session
+from src.database import get_read_session, get_session
 from src.identity.domain import User
 from src.identity.infrastructure.deps import get_current_user_required
+from src.json_response import FastJSONResponse
+from src.observability.routing import TracedRoute
+from src.runtime.application.execution_bundle import parse_uuid
 from src.runtime.application.runtime_service import RuntimeService
 from src.runtime.infrastructure.repository import ProcessInstanceRepository, FormSubmissionRepository
 from src.process_design.infrastructure.repository import ProcessDefinitionRepository
 from src.form_builder.infrastructure.repository import FormDefinitionRepository
 from src.catalogs.infrastructure.repository import CatalogRepository
 from src.projects.infrastructure.repository import ProjectRepository
-from src.rules.validator_runner import run_field_visibility_validators, run_step_access_validators
-from src.rules.evaluator import evaluate_expression
+from src.rules.validator_runner import run_field_visibility_validators
 
-router = APIRouter(prefix="/api/runtime", tags=["runtime"])
+router = APIRouter(prefix="/api/runtime", tags=["runtime"], route_class=TracedRoute)
 
 
 class StartProcessResponse(BaseModel):
@@ -52,6 +54,7 @@ class InstanceResponse(BaseModel):
     id: str
     document_number: int
     process_definition_id: str
+    process_version: int
     current_node_id: str | None
     status: str
     context: dict
@@ -62,32 +65,29 @@ class DocumentListItem(BaseModel):
     document_number: int
     process_definition_id: str
     process_name: str
+    process_project_id: str | None = None
     status: str
     current_node_id: str | None
     context: dict = {}
 
 
-def get_instance_repo(session=Depends(get_session)) -> ProcessInstanceRepository:
+def get_instance_repo(session=Depends(get_session, scope="function")) -> ProcessInstanceRepository:
     return ProcessInstanceRepository(session)
 
 
-def get_submission_repo(session=Depends(get_session)) -> FormSubmissionRepository:
+def get_submission_repo(session=Depends(get_session, scope="function")) -> FormSubmissionRepository:
     return FormSubmissionRepository(session)
 
 
-def get_process_repo(session=Depends(get_session)) -> ProcessDefinitionRepository:
+def get_process_repo(session=Depends(get_session, scope="function")) -> ProcessDefinitionRepository:
     return ProcessDefinitionRepository(session)
 
 
-def get_form_repo(session=Depends(get_session)) -> FormDefinitionRepository:
+def get_form_repo(session=Depends(get_session, scope="function")) -> FormDefinitionRepository:
     return FormDefinitionRepository(session)
 
 
-def get_catalog_repo(session=Depends(get_session)) -> CatalogRepository:
-    return CatalogRepository(session)
-
-
-def get_project_repo(session=Depends(get_session)) -> ProjectRepository:
+def get_project_repo(session=Depends(get_session, scope="function")) -> ProjectRepository:
     return ProjectRepository(session)
 
 
@@ -107,38 +107,77 @@ def get_runtime_service(
     )
 
 
+def get_read_runtime_service(session=Depends(get_read_session, scope="function")) -> RuntimeService:
+    """Для GET-обработчиков: чтение с реплики, если она настроена (get_current_form ничего не пишет)."""
+    return RuntimeService(
+        instance_repo=ProcessInstanceRepository(session),
+        submission_repo=FormSubmissionRepository(session),
+        process_repo=ProcessDefinitionRepository(session),
+        form_repo=FormDefinitionRepository(session),
+        project_repo=ProjectRepository(session),
+    )
+
+
+def get_read_catalog_repo(session=Depends(get_read_session, scope="function")) -> CatalogRepository:
+    return CatalogRepository(session)
+
+
 async def _form_to_dict(
     form,
     context: dict | None = None,
     catalog_repo: CatalogRepository | None = None,
     validators=None,
+    catalog_refs: bool = False,
 ):
-    """validators — список валидаторов этапа (узла процесса), для видимости полей."""
+    """validators — список валидаторов этапа (узла процесса), для видимости полей.
+    catalog_refs — вместо вариантов справочника отдавать ссылку catalog_ref = "<id>@<version>"
+    (клиент берёт справочник из своего кэша или GET /api/catalogs/{id})."""
     role_ids = (context or {}).get("role_ids", [])
     ctx = {**(context or {}), "role_ids": role_ids}
     validator_overrides = {}
     if validators:
         flat_ctx = _flatten_context_for_validators(ctx)
         validator_overrides = run_field_visibility_validators(validators, flat_ctx)
+    visible = [f for f in form.fields if validator_overrides.get(f.name, "hidden") != "hidden"]
+    # Справочники всех видимых полей — одним запросом (и из общего кэша), а не по запросу на поле
+    catalogs = {}
+    catalog_versions = {}
+    if catalog_repo:
+        catalog_ids = [
+            cid
+            for cid in (parse_uuid(f.catalog_id) for f in visible if f.catalog_id and not f.catalog_remote)
+            if cid
+        ]
+        if catalog_ids and catalog_refs:
+            catalog_versions = await catalog_repo.get_versions(catalog_ids)
+        elif catalog_ids:
+            catalogs = await catalog_repo.get_many(catalog_ids)
     fields_out = []
-    for f in form.fields:
+    for f in visible:
         permission = validator_overrides.get(f.name, "hidden")
-        if permission == "hidden":
-            continue
         options = f.options
-        if f.catalog_id and catalog_repo:
-            try:
-                catalog = await catalog_repo.get_by_id(UUID(f.catalog_id))
-                if catalog:
-                    options = [{"value": i.value, "label": i.label} for i in catalog.items]
-            except (ValueError, TypeError):
-                pass
+        catalog_ref = None
+        if f.catalog_id and f.catalog_remote:
+            # Крупный справочник: с формой уходит только его id, варианты клиент ищет через /api/catalogs/{id}/items
+            options = None
+        elif f.catalog_id and catalog_refs:
+            catalog_id = parse_uuid(f.catalog_id)
+            if catalog_id in catalog_versions:
+                options = None
+                catalog_ref = f"{catalog_id}@{catalog_versions[catalog_id]}"
+        elif f.catalog_id:
+            catalog = catalogs.get(parse_uuid(f.catalog_id))
+            if catalog:
+                options = [{"value": i.value, "label": i.label} for i in catalog.items]
         fields_out.append({
             "name": f.name,
             "label": f.label,
             "field_type": f.field_type.value,
             "required": f.required,
             "options": options,
+            "catalog_id": f.catalog_id if f.catalog_remote else None,
+            "catalog_remote": bool(f.catalog_id and f.catalog_remote),
+            "catalog_ref": catalog_ref,
             "validations": f.validations,
             "read_only": permission == "read",
             "width": f.width,
@@ -154,10 +193,19 @@ async def _form_to_dict(
 @router.get("/documents", response_model=list[DocumentListItem])
 async def list_documents(
     _user: User = Depends(get_current_user_required),
-    service: RuntimeService = Depends(get_runtime_service),
+    service: RuntimeService = Depends(get_read_runtime_service),
     project_id: UUID | None = None,
+    fields: str | None = Query(
+        None,
+        description="Ключи context через запятую; по умолчанию — колонки списка проекта документа, * — context целиком",
+    ),
 ):
-    return await service.list_documents(project_id=project_id)
+    full_context = fields is not None and fields.strip() == "*"
+    field_keys = None if fields is None or full_context else [f.strip() for f in fields.split(",") if f.strip()]
+    documents = await service.list_documents(project_id=project_id, fields=field_keys, full_context=full_context)
+    # Список строит сервис из уже JSON-совместимых dict: отдаём напрямую, без валидации каждой строки
+    # по DocumentListItem (response_model остаётся для схемы OpenAPI)
+    return FastJSONResponse(documents)
 
 
 @router.post("/processes/{process_definition_id}/start", response_model=StartProcessResponse)
@@ -192,11 +240,10 @@ def _flatten_context_for_validators(ctx: dict) -> dict:
 @router.get("/instances/{instance_id}/current-form", response_model=CurrentFormResponse)
 async def get_current_form(
     instance_id: UUID,
+    catalog_refs: bool = Query(False, description="Справочники ссылкой id@version вместо списка вариантов"),
     user: User = Depends(get_current_user_required),
-    service: RuntimeService = Depends(get_runtime_service),
-    catalog_repo: CatalogRepository = Depends(get_catalog_repo),
-    process_repo: ProcessDefinitionRepository = Depends(get_process_repo),
-    project_repo: ProjectRepository = Depends(get_project_repo),
+    service: RuntimeService = Depends(get_read_runtime_service),
+    catalog_repo: CatalogRepository = Depends(get_read_catalog_repo),
 ):
     role_ids = [str(r) for r in user.role_ids]
     result = await service.get_current_form(instance_id, role_ids=role_ids)
@@ -208,32 +255,20 @@ async def get_current_form(
     submission_data = await service.get_submission_data(instance_id, node_id)
     context = {**(instance.context or {}), node_id: submission_data or {}, "role_ids": role_ids}
     flat_ctx = _flatten_context_for_validators(context)
-    process_def = await process_repo.get_by_id(instance.process_definition_id)
-    node_validators = []
-    available_transitions: list[AvailableTransition] = []
-    if process_def:
-        current_node = process_def.get_node(node_id)
-        keys = getattr(current_node, "validator_keys", None) or [] if current_node else []
-        project = await project_repo.get_by_id(process_def.project_id) if process_def.project_id else None
-        if keys and project and getattr(project, "validators", None):
-            key_set = set(keys)
-            node_validators = [v for v in project.validators if getattr(v, "type", None) == "field_visibility" and getattr(v, "key", None) in key_set]
-        for edge in process_def.get_edges_from(node_id):
-            if edge.condition_expression and not evaluate_expression(edge.condition_expression, flat_ctx):
-                continue
-            transition_keys = getattr(edge, "transition_validator_keys", None) or []
-            if transition_keys and project and getattr(project, "validators", None):
-                key_set = set(transition_keys)
-                transition_validators = [v for v in project.validators if getattr(v, "type", None) == "step_access" and getattr(v, "key", None) in key_set]
-                if transition_validators and not run_step_access_validators(transition_validators, flat_ctx, edge.target_node_id):
-                    continue
-            available_transitions.append(AvailableTransition(
-                edge_id=edge.id,
-                key=getattr(edge, "key", "") or edge.id,
-                label=getattr(edge, "label", "") or "",
-                target_node_id=edge.target_node_id,
-            ))
-    form_def = await _form_to_dict(form, context, catalog_repo, validators=node_validators)
+    bundle = result["bundle"]
+    node_validators = list(bundle.field_visibility.get(node_id, ()))
+    available_transitions = [
+        AvailableTransition(
+            edge_id=edge.id,
+            key=getattr(edge, "key", "") or edge.id,
+            label=getattr(edge, "label", "") or "",
+            target_node_id=edge.target_node_id,
+        )
+        for edge in service.get_available_transitions(bundle, node_id, flat_ctx)
+    ]
+    form_def = await _form_to_dict(
+        form, context, catalog_repo, validators=node_validators, catalog_refs=catalog_refs
+    )
     return CurrentFormResponse(
         instance_id=str(instance.id),
         node_id=node_id,
@@ -292,7 +327,7 @@ async def submit_form(
 async def get_instance(
     instance_id: UUID,
     _user: User = Depends(get_current_user_required),
-    service: RuntimeService = Depends(get_runtime_service),
+    service: RuntimeService = Depends(get_read_runtime_service),
 ):
     instance = await service.get_instance(instance_id)
     if not instance:
@@ -301,6 +336,7 @@ async def get_instance(
         id=str(instance.id),
         document_number=instance.document_number,
         process_definition_id=str(instance.process_definition_id),
+        process_version=instance.process_version,
         current_node_id=instance.current_node_id,
         status=instance.status.value,
         context=instance.context,
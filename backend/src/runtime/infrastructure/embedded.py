@@ -0,0 +1,57 @@
+"""
+Встроенный движок: RuntimeService на репозиториях в памяти, без БД и HTTP. Определения создаются теми же
+методами репозиториев, что и через API, документы проводятся теми же методами сервиса — замеряется и
+профилируется только работа движка (маршрутизация, условия, слияние контекста, валидаторы).
+Используется в bench.micro (группа runtime) и для симуляций процессов.
+"""
+from typing import Any, Callable
+from uuid import UUID
+
+from src.form_builder.infrastructure.memory_repository import InMemoryFormDefinitionRepository
+from src.process_design.infrastructure.memory_repository import InMemoryProcessDefinitionRepository
+from src.projects.infrastructure.memory_repository import InMemoryProjectRepository
+from src.runtime.application.runtime_service import RuntimeService
+from src.runtime.domain import ProcessInstance
+from src.runtime.infrastructure.memory_repository import (
+    InMemoryFormSubmissionRepository,
+    InMemoryProcessInstanceRepository,
+)
+
+
+class EmbeddedEngine:
+    def __init__(self) -> None:
+        self.projects = InMemoryProjectRepository()
+        self.forms = InMemoryFormDefinitionRepository()
+        self.processes = InMemoryProcessDefinitionRepository()
+        self.instances = InMemoryProcessInstanceRepository()
+        self.submissions = InMemoryFormSubmissionRepository()
+        self.runtime = RuntimeService(self.instances, self.submissions, self.processes, self.forms, self.projects)
+
+    async def run_document(
+        self,
+        process_id: UUID,
+        data_for_step: Callable[[str, dict], dict],
+        role_ids: list[str] | None = None,
+        max_steps: int = 1000,
+    ) -> ProcessInstance | None:
+        """Проводит новый документ по процессу: на каждом шаге data_for_step(node_id, context) даёт данные формы.
+        Останавливается на завершении, на шаге, где отправка отклонена, или через max_steps отправок."""
+        instance = await self.runtime.start_process(process_id)
+        if not instance:
+            return None
+        for _ in range(max_steps):
+            current: dict[str, Any] | None = await self.runtime.get_current_form(instance.id, role_ids)
+            if not current:
+                break
+            node_id = current["node_id"]
+            submitted = await self.runtime.submit_form(
+                instance.id,
+                node_id,
+                current["form"].id,
+                data_for_step(node_id, current["instance"].context),
+                role_ids=role_ids,
+            )
+            if not submitted:
+                break
+            instance = submitted
+        return await self.runtime.get_instance(instance.id)
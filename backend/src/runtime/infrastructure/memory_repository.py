@@ -0,0 +1,109 @@
+"""Репозитории экземпляров и отправок форм без БД (бенчмарки, встроенный движок)."""
+from dataclasses import replace
+from uuid import UUID, uuid4
+
+from src.observability.tracing import traced_methods
+from src.runtime.domain import FormSubmission, InstanceStatus, ProcessInstance
+
+
+@traced_methods("repository")
+class InMemoryProcessInstanceRepository:
+    """Тот же интерфейс, что у ProcessInstanceRepository. Методы возвращают копии экземпляров:
+    как и строки из БД, изменение полученного объекта не меняет хранимый."""
+
+    def __init__(self) -> None:
+        self._instances: dict[str, ProcessInstance] = {}
+        self._last_document_number = 0
+
+    async def create(
+        self,
+        process_definition_id: UUID,
+        current_node_id: str,
+        status: InstanceStatus = InstanceStatus.ACTIVE,
+        context: dict | None = None,
+        process_version: int = 1,
+    ) -> ProcessInstance:
+        self._last_document_number += 1
+        instance = ProcessInstance(
+            id=uuid4(),
+            document_number=self._last_document_number,
+            process_definition_id=UUID(str(process_definition_id)),
+            current_node_id=current_node_id,
+            status=status,
+            context=dict(context or {}),
+            process_version=process_version,
+        )
+        self._instances[str(instance.id)] = instance
+        return replace(instance)
+
+    async def get_by_id(self, instance_id: UUID) -> ProcessInstance | None:
+        instance = self._instances.get(str(instance_id))
+        return replace(instance) if instance else None
+
+    async def update(
+        self,
+        instance_id: UUID,
+        current_node_id: str | None = None,
+        status: InstanceStatus | None = None,
+        context: dict | None = None,
+    ) -> ProcessInstance | None:
+        instance = self._instances.get(str(instance_id))
+        if not instance:
+            return None
+        # Как и в БД-репозитории, None означает «не менять» (current_node_id сбросить нельзя)
+        instance = replace(
+            instance,
+            current_node_id=current_node_id if current_node_id is not None else instance.current_node_id,
+            status=status if status is not None else instance.status,
+            context=dict(context) if context is not None else instance.context,
+        )
+        self._instances[str(instance_id)] = instance
+        return replace(instance)
+
+    async def list_by_process(self, process_definition_id: UUID):
+        return [
+            replace(i)
+            for i in self._instances.values()
+            if str(i.process_definition_id) == str(process_definition_id)
+        ]
+
+    async def list_all(self):
+        return sorted((replace(i) for i in self._instances.values()), key=lambda i: i.document_number, reverse=True)
+
+
+@traced_methods("repository")
+class InMemoryFormSubmissionRepository:
+    """Тот же интерфейс, что у FormSubmissionRepository: все отправки по (экземпляр, узел) в порядке создания,
+    «последняя» — последняя в списке (в БД — по seq)."""
+
+    def __init__(self) -> None:
+        self._submissions: dict[tuple[str, str], list[FormSubmission]] = {}
+
+    async def create(
+        self,
+        process_instance_id: UUID,
+        node_id: str,
+        form_definition_id: UUID,
+        data: dict,
+    ) -> FormSubmission:
+        submission = FormSubmission(
+            id=uuid4(),
+            process_instance_id=UUID(str(process_instance_id)),
+            node_id=node_id,
+            form_definition_id=UUID(str(form_definition_id)),
+            data=dict(data),
+        )
+        self._submissions.setdefault((str(process_instance_id), str(node_id)), []).append(submission)
+        return replace(submission)
+
+    async def get_by_instance_and_node(self, instance_id: UUID, node_id: str) -> FormSubmission | None:
+        submissions = self._submissions.get((str(instance_id), str(node_id)))
+        return replace(submissions[-1]) if submissions else None
+
+    async def update_data(self, instance_id: UUID, node_id: str, data: dict) -> bool:
+        """Обновляет данные последней отправки для (instance_id, node_id). Возвращает True если запись найдена."""
+        submissions = self._submissions.get((str(instance_id), str(node_id)))
+        if not submissions:
+            return False
+        submissions[-1] = replace(submissions[-1], data=dict(data))
+        return True
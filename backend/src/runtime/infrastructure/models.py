@@ -1,8 +1,13 @@
-from sqlalchemy import Integer, String, Text, text
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, Sequence, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.identity.infrastructure.models import Base, gen_uuid
 
+# Монотонный порядковый номер отправки: uuid4 в id не даёт порядка, «последняя» запись берётся по seq
+FORM_SUBMISSION_SEQ = Sequence("form_submissions_seq_seq")
+
 
 class ProcessInstanceModel(Base):
     __tablename__ = "process_instances"
@@ -15,6 +20,7 @@ class ProcessInstanceModel(Base):
         server_default=text("nextval('process_instances_document_number_seq'::regclass)"),
     )
     process_definition_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    process_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     current_node_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="active")
     context: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
@@ -28,3 +34,23 @@ class FormSubmissionModel(Base):
     node_id: Mapped[str] = mapped_column(String(100), nullable=False)
     form_definition_id: Mapped[str] = mapped_column(String(36), nullable=False)
     data: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    seq: Mapped[int] = mapped_column(
+        BigInteger,
+        FORM_SUBMISSION_SEQ,
+        nullable=False,
+        server_default=FORM_SUBMISSION_SEQ.next_value(),
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+# «Последняя отправка» по (экземпляр, узел) — один проход по индексу
+Index(
+    "ix_form_submissions_instance_node_seq",
+    FormSubmissionModel.process_instance_id,
+    FormSubmissionModel.node_id,
+    FormSubmissionModel.seq.desc(),
+)
@@ -1,15 +1,16 @@
-import json
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src import json_codec
+from src.observability.tracing import traced_methods
 from src.runtime.domain import ProcessInstance, FormSubmission, InstanceStatus
 from src.runtime.infrastructure.models import ProcessInstanceModel, FormSubmissionModel
 
 
 def _deserialize_instance(row: ProcessInstanceModel) -> ProcessInstance:
-    context = json.loads(row.context) if row.context else {}
+    context = json_codec.loads(row.context) if row.context else {}
     return ProcessInstance(
         id=UUID(row.id),
         document_number=getattr(row, "document_number", 0) or 0,
@@ -17,9 +18,34 @@ def _deserialize_instance(row: ProcessInstanceModel) -> ProcessInstance:
         current_node_id=row.current_node_id,
         status=InstanceStatus(row.status) if row.status else InstanceStatus.ACTIVE,
         context=context,
+        process_version=getattr(row, "process_version", None) or 1,
     )
 
 
+def _deserialize_submission(row: FormSubmissionModel) -> FormSubmission:
+    return FormSubmission(
+        id=UUID(row.id),
+        process_instance_id=UUID(row.process_instance_id),
+        node_id=row.node_id,
+        form_definition_id=UUID(row.form_definition_id),
+        data=json_codec.loads(row.data) if row.data else {},
+    )
+
+
+def _latest_submission_query(instance_id: UUID, node_id: str):
+    """Последняя отправка по (instance_id, node_id): порядок по монотонному seq (индекс ix_form_submissions_instance_node_seq)."""
+    return (
+        select(FormSubmissionModel)
+        .where(
+            FormSubmissionModel.process_instance_id == str(instance_id),
+            FormSubmissionModel.node_id == str(node_id),
+        )
+        .order_by(FormSubmissionModel.seq.desc())
+        .limit(1)
+    )
+
+
+@traced_methods("repository")
 class ProcessInstanceRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -30,12 +56,14 @@ class ProcessInstanceRepository:
         current_node_id: str,
         status: InstanceStatus = InstanceStatus.ACTIVE,
         context: dict | None = None,
+        process_version: int = 1,
     ) -> ProcessInstance:
         model = ProcessInstanceModel(
             process_definition_id=str(process_definition_id),
+            process_version=process_version,
             current_node_id=current_node_id,
             status=status.value,
-            context=json.dumps(context or {}),
+            context=json_codec.dumps(context or {}),
         )
         self._session.add(model)
         await self._session.flush()
@@ -69,7 +97,7 @@ class ProcessInstanceRepository:
         if status is not None:
             row.status = status.value
         if context is not None:
-            row.context = json.dumps(context)
+            row.context = json_codec.dumps(context)
         await self._session.flush()
         await self._session.refresh(row)
         return _deserialize_instance(row)
@@ -91,6 +119,7 @@ class ProcessInstanceRepository:
         return [_deserialize_instance(r) for r in rows]
 
 
+@traced_methods("repository")
 class FormSubmissionRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -106,55 +135,27 @@ class FormSubmissionRepository:
             process_instance_id=str(process_instance_id),
             node_id=node_id,
             form_definition_id=str(form_definition_id),
-            data=json.dumps(data),
+            data=json_codec.dumps(data),
         )
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
-        return FormSubmission(
-            id=UUID(model.id),
-            process_instance_id=UUID(model.process_instance_id),
-            node_id=model.node_id,
-            form_definition_id=UUID(model.form_definition_id),
-            data=json.loads(model.data),
-        )
+        return _deserialize_submission(model)
 
     async def get_by_instance_and_node(self, instance_id: UUID, node_id: str) -> FormSubmission | None:
-        result = await self._session.execute(
-            select(FormSubmissionModel)
-            .where(
-                FormSubmissionModel.process_instance_id == str(instance_id),
-                FormSubmissionModel.node_id == node_id,
-            )
-            .order_by(FormSubmissionModel.id.desc())
-            .limit(1)
-        )
+        result = await self._session.execute(_latest_submission_query(instance_id, node_id))
         row = result.scalar_one_or_none()
         if not row:
             return None
-        return FormSubmission(
-            id=UUID(row.id),
-            process_instance_id=UUID(row.process_instance_id),
-            node_id=row.node_id,
-            form_definition_id=UUID(row.form_definition_id),
-            data=json.loads(row.data) if row.data else {},
-        )
+        return _deserialize_submission(row)
 
     async def update_data(self, instance_id: UUID, node_id: str, data: dict) -> bool:
         """Обновляет данные последней отправки для (instance_id, node_id). Возвращает True если запись найдена."""
-        result = await self._session.execute(
-            select(FormSubmissionModel)
-            .where(
-                FormSubmissionModel.process_instance_id == str(instance_id),
-                FormSubmissionModel.node_id == str(node_id),
-            )
-            .order_by(FormSubmissionModel.id.desc())
-            .limit(1)
-        )
+        result = await self._session.execute(_latest_submission_query(instance_id, node_id))
         row = result.scalar_one_or_none()
         if not row:
             return False
-        row.data = json.dumps(data)
+        row.data = json_codec.dumps(data)
         await self._session.flush()
         await self._session.refresh(row)
         return True
@@ -0,0 +1,418 @@
+"""
+Синтетические данные для проверок на объёмах, близких к продакшену (`bpm seed`): проекты с полями, формы,
+процессы заданной формы графа (с версиями и таблицей маршрутов) и экземпляры с отправками форм.
+Всё генерируется из random.Random(seed): одинаковые параметры дают одинаковые id и данные. Запись — COPY
+(asyncpg copy_records_to_table) пачками по batch_size экземпляров, каждая пачка в своей транзакции.
+Экземпляры проходят граф так же, как runtime: по первому ребру, чьё условие выполнено на данных формы.
+"""
+from __future__ import annotations
+
+import random
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Iterator
+
+from src import json_codec
+from src.process_design.domain import Edge, Node, NodeType, ProcessDefinition, analyze_process_graph
+from src.rules.evaluator import CompiledExpression, compile_expression
+
+GRAPH_SHAPES = ("linear", "branching", "loop", "mixed")
+STATUSES = ["draft", "review", "approved", "rejected", "archived"]
+FIELD_TYPES = ["number", "select", "text", "textarea", "date", "boolean"]
+WORDS = (
+    "договор поставка оплата счёт акт заявка согласование бюджет контрагент склад доставка услуга "
+    "аванс проект отдел договорённость сумма срок приложение изменение"
+).split()
+# Условия на рёбрах ссылаются на поля, которые есть в каждой форме (см. _pick_form_fields)
+AMOUNT_KEY = "field_0"
+STATE_KEY = "field_1"
+SEEDED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class SeedConflict(RuntimeError):
+    """Данные с этим seed уже есть в БД (совпали первичные ключи)."""
+
+
+@dataclass(frozen=True)
+class SeedSpec:
+    projects: int = 2
+    processes: int = 3  # на проект
+    forms: int = 4  # на проект
+    fields: int = 20  # полей в форме
+    steps: int = 6  # шагов с формой в основной ветке процесса
+    shape: str = "mixed"  # linear | branching | loop | mixed
+    instances: int = 10_000  # всего, распределяются по процессам
+    completed_share: float = 0.6  # доля завершённых документов
+    text_size: int = 120  # средняя длина текстовых значений, символов
+    seed: int = 1
+    batch_size: int = 5_000
+
+
+@dataclass
+class ProcessPlan:
+    """Процесс, по которому генерируются экземпляры: граф, формы шагов и поля этих форм."""
+    process: ProcessDefinition
+    form_fields: dict[str, list[dict]]  # form_definition_id -> поля (формат fields_schema)
+    conditions: dict[str, CompiledExpression] = field(default_factory=dict)  # edge.id -> условие
+
+
+@dataclass
+class SeedDefinitions:
+    projects: list[tuple] = field(default_factory=list)
+    forms: list[tuple] = field(default_factory=list)
+    processes: list[tuple] = field(default_factory=list)
+    versions: list[tuple] = field(default_factory=list)
+    plans: list[ProcessPlan] = field(default_factory=list)
+
+
+@dataclass
+class SeedBatch:
+    instances: list[tuple] = field(default_factory=list)
+    submissions: list[tuple] = field(default_factory=list)
+
+
+# Колонки COPY; не указанные (document_number, seq, created_at версий) заполняются значениями по умолчанию
+PROJECT_COLUMNS = ("id", "name", "description", "sort_order", "list_columns", "fields_schema", "validators_schema", "version")
+FORM_COLUMNS = ("id", "name", "description", "fields_schema", "version")
+PROCESS_COLUMNS = ("id", "name", "description", "version", "project_id", "nodes_schema", "edges_schema")
+VERSION_COLUMNS = (
+    "id", "process_definition_id", "version", "name", "description", "project_id",
+    "nodes_schema", "edges_schema", "routes_schema",
+)
+INSTANCE_COLUMNS = ("id", "process_definition_id", "process_version", "current_node_id", "status", "context")
+SUBMISSION_COLUMNS = ("id", "process_instance_id", "node_id", "form_definition_id", "data", "created_at")
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+# Тексты — срезы заранее собранной строки: генерация слов по одному занимала большую часть времени засева
+_TEXT_CORPUS = " ".join(random.Random(0).choices(WORDS, k=50_000))
+
+
+def _text(rng: random.Random, size: int) -> str:
+    length = min(max(1, int(rng.expovariate(1 / size))), 5_000) if size else 0
+    start = rng.randrange(len(_TEXT_CORPUS) - length)
+    return _TEXT_CORPUS[start:start + length].strip()
+
+
+def _project_fields(count: int) -> list[dict]:
+    """Пул полей проекта (формат fields_schema проекта): типы по кругу, field_0 — число, field_1 — статус."""
+    out = []
+    for i in range(count):
+        field_type = FIELD_TYPES[i % len(FIELD_TYPES)]
+        out.append(
+            {
+                "key": f"field_{i}",
+                "label": f"Поле {i}",
+                "field_type": field_type,
+                "catalog_id": None,
+                "options": [{"value": s, "label": s} for s in STATUSES] if field_type == "select" else None,
+            }
+        )
+    return out
+
+
+def _pick_form_fields(rng: random.Random, pool: list[dict], count: int) -> list[dict]:
+    rest = rng.sample(pool[2:], min(max(count - 2, 0), len(pool) - 2))
+    return pool[:2] + rest
+
+
+def _form_fields(rng: random.Random, project_fields: list[dict]) -> list[dict]:
+    """Поля формы в формате fields_schema FormDefinitionRepository."""
+    return [
+        {
+            "name": f["key"],
+            "label": f["label"],
+            "field_type": f["field_type"],
+            "required": rng.random() < 0.3,
+            "options": f["options"],
+            "catalog_id": None,
+            "catalog_remote": False,
+            "validations": None,
+            "access_rules": [],
+            "width": rng.choice([None, 6, 12]),
+        }
+        for f in project_fields
+    ]
+
+
+def _step(node_id: str, form_id: str, x: float, y: float = 0.0) -> Node:
+    return Node(id=node_id, node_type=NodeType.STEP, label=node_id, form_definition_id=form_id, position_x=x, position_y=y)
+
+
+def build_graph(rng: random.Random, shape: str, steps: int, form_ids: list[str]) -> tuple[list[Node], list[Edge]]:
+    """Граф процесса: linear — цепочка шагов; branching — у части шагов условная ветка на доп. проверку
+    (крупная сумма) с возвратом в основную цепочку; loop — у части шагов ребро «на доработку» к предыдущему шагу."""
+    nodes = [Node(id="start", node_type=NodeType.START, label="Старт")]
+    edges: list[Edge] = []
+    prev = "start"
+    for i in range(steps):
+        node_id = f"step_{i}"
+        nodes.append(_step(node_id, rng.choice(form_ids), 200.0 * (i + 1)))
+        edges.append(Edge(id=f"e_{prev}_{node_id}", source_node_id=prev, target_node_id=node_id, key=f"to_{node_id}"))
+        prev = node_id
+    nodes.append(Node(id="end", node_type=NodeType.END, label="Конец", position_x=200.0 * (steps + 1)))
+    edges.append(Edge(id=f"e_{prev}_end", source_node_id=prev, target_node_id="end", key="finish"))
+
+    extra_nodes: list[Node] = []
+    extra_edges: list[Edge] = []
+    for i in range(steps):
+        node_id = f"step_{i}"
+        next_id = f"step_{i + 1}" if i + 1 < steps else "end"
+        if shape == "branching" and rng.random() < 0.4:
+            review_id = f"review_{i}"
+            extra_nodes.append(_step(review_id, rng.choice(form_ids), 200.0 * (i + 1) + 100, 150.0))
+            # Условное ребро — первым: runtime берёт первое ребро, чьё условие выполнено
+            extra_edges.append(
+                Edge(
+                    id=f"e_{node_id}_{review_id}",
+                    source_node_id=node_id,
+                    target_node_id=review_id,
+                    key=f"to_{review_id}",
+                    label="Крупная сумма",
+                    condition_expression=f"{AMOUNT_KEY} > 50000",
+                )
+            )
+            extra_edges.append(Edge(id=f"e_{review_id}_{next_id}", source_node_id=review_id, target_node_id=next_id))
+        elif shape == "loop" and i > 0 and rng.random() < 0.4:
+            extra_edges.append(
+                Edge(
+                    id=f"e_{node_id}_rework",
+                    source_node_id=node_id,
+                    target_node_id=f"step_{i - 1}",
+                    key=f"rework_{i}",
+                    label="На доработку",
+                    condition_expression=f"{STATE_KEY} == 'rejected'",
+                )
+            )
+    return nodes + extra_nodes, extra_edges + edges
+
+
+def _serialize_node(n: Node) -> dict:
+    return {
+        "id": n.id,
+        "node_type": n.node_type.value,
+        "label": n.label,
+        "form_definition_id": n.form_definition_id,
+        "position_x": n.position_x,
+        "position_y": n.position_y,
+        "expression": n.expression,
+        "validator_keys": n.validator_keys,
+    }
+
+
+def _serialize_edge(e: Edge) -> dict:
+    return {
+        "id": e.id,
+        "source_node_id": e.source_node_id,
+        "target_node_id": e.target_node_id,
+        "key": e.key,
+        "label": e.label,
+        "condition_expression": e.condition_expression,
+        "transition_validator_keys": e.transition_validator_keys,
+    }
+
+
+def build_definitions(spec: SeedSpec) -> SeedDefinitions:
+    if spec.shape not in GRAPH_SHAPES:
+        raise ValueError(f"Неизвестная форма графа: {spec.shape} (допустимо: {', '.join(GRAPH_SHAPES)})")
+    if spec.fields < 2:
+        raise ValueError(
+            f"Полей в форме должно быть не меньше 2 ({AMOUNT_KEY} и {STATE_KEY} нужны условиям на рёбрах): {spec.fields}"
+        )
+    rng = random.Random(f"{spec.seed}:definitions")
+    out = SeedDefinitions()
+    pool = _project_fields(max(spec.fields * 2, 2))
+    for p in range(spec.projects):
+        project_id = _uuid(rng)
+        list_columns = ["document_number", "process_name", "status", *(f["key"] for f in pool[:3])]
+        out.projects.append(
+            (
+                project_id, f"Seed {spec.seed} / проект {p + 1}", "", p,
+                json_codec.dumps(list_columns), json_codec.dumps(pool), "[]", 1,
+            )
+        )
+        form_fields: dict[str, list[dict]] = {}
+        for f in range(spec.forms):
+            form_id = _uuid(rng)
+            form_fields[form_id] = _form_fields(rng, _pick_form_fields(rng, pool, spec.fields))
+            out.forms.append((form_id, f"Seed {spec.seed} / форма {p + 1}.{f + 1}", "", json_codec.dumps(form_fields[form_id]), 1))
+        for k in range(spec.processes):
+            process_id = _uuid(rng)
+            shape = rng.choice(GRAPH_SHAPES[:-1]) if spec.shape == "mixed" else spec.shape
+            nodes, edges = build_graph(rng, shape, spec.steps, list(form_fields))
+            process = ProcessDefinition(
+                id=uuid.UUID(process_id),
+                name=f"Seed {spec.seed} / процесс {p + 1}.{k + 1} ({shape})",
+                description="",
+                version=1,
+                project_id=uuid.UUID(project_id),
+                nodes=nodes,
+                edges=edges,
+            )
+            analysis = analyze_process_graph(process)
+            if analysis.errors:
+                raise ValueError(f"Сгенерирован некорректный граф: {analysis.errors}")
+            process.routes = analysis.routes
+            nodes_schema = json_codec.dumps([_serialize_node(n) for n in nodes])
+            edges_schema = json_codec.dumps([_serialize_edge(e) for e in edges])
+            out.processes.append((process_id, process.name, "", 1, project_id, nodes_schema, edges_schema))
+            out.versions.append(
+                (
+                    _uuid(rng), process_id, 1, process.name, "", project_id,
+                    nodes_schema, edges_schema, json_codec.dumps(analysis.routes),
+                )
+            )
+            conditions = {e.id: compile_expression(e.condition_expression) for e in edges if e.condition_expression}
+            out.plans.append(ProcessPlan(process=process, form_fields=form_fields, conditions=conditions))
+    return out
+
+
+def _field_value(rng: random.Random, f: dict, text_size: int) -> Any:
+    field_type = f["field_type"]
+    if field_type == "number":
+        return rng.randint(0, 100_000)
+    if field_type == "select":
+        return rng.choice(STATUSES)
+    if field_type == "boolean":
+        return rng.random() < 0.5
+    if field_type == "date":
+        return (date(2024, 1, 1) + timedelta(days=rng.randrange(730))).isoformat()
+    if field_type == "textarea":
+        return _text(rng, text_size * 3)
+    return _text(rng, text_size)
+
+
+def _form_data(rng: random.Random, fields: list[dict], text_size: int) -> dict:
+    return {f["name"]: _field_value(rng, f, text_size) for f in fields}
+
+
+def _next_node(plan: ProcessPlan, node_id: str, flat_ctx: dict) -> str | None:
+    """Как RuntimeService.submit_form: первое ребро с выполненным условием, иначе первое ребро."""
+    edges = plan.process.get_edges_from(node_id)
+    for e in edges:
+        condition = plan.conditions.get(e.id)
+        if condition is None or condition.evaluate(flat_ctx):
+            return plan.process.resolve_node(e.target_node_id)
+    return plan.process.resolve_node(edges[0].target_node_id) if edges else None
+
+
+def _walk(rng: random.Random, plan: ProcessPlan, complete: bool, spec: SeedSpec) -> tuple[list[tuple[str, dict]], str | None]:
+    """Отправки форм по шагам (узел, данные) и узел, на котором документ остановился (None — завершён)."""
+    process = plan.process
+    current = process.resolve_node(process.get_start_node().id)
+    submitted: list[tuple[str, dict]] = []
+    flat: dict = {}
+    # Незавершённый документ останавливается на случайном шаге; длина обхода ограничена из-за циклов доработки
+    stop_after = None if complete else rng.randrange(max(spec.steps, 1))
+    limit = spec.steps * 4 + 4
+    while current is not None and len(submitted) < limit:
+        node = process.get_node(current)
+        if node.node_type == NodeType.END:
+            return submitted, None
+        if stop_after is not None and len(submitted) >= stop_after:
+            return submitted, current
+        data = _form_data(rng, plan.form_fields[node.form_definition_id], spec.text_size)
+        submitted.append((current, data))
+        flat.update(data)
+        current = _next_node(plan, current, flat)
+    return submitted, current
+
+
+def iter_instance_batches(spec: SeedSpec, definitions: SeedDefinitions) -> Iterator[SeedBatch]:
+    rng = random.Random(f"{spec.seed}:instances")
+    batch = SeedBatch()
+    for n in range(spec.instances):
+        plan = definitions.plans[n % len(definitions.plans)]
+        instance_id = _uuid(rng)
+        submitted, current = _walk(rng, plan, rng.random() < spec.completed_share, spec)
+        # context экземпляра собирается из уже сериализованных данных шагов (последняя отправка по узлу)
+        context: dict[str, str] = {}
+        created_at = SEEDED_AT + timedelta(minutes=n * 7)
+        for i, (node_id, data) in enumerate(submitted):
+            data_json = json_codec.dumps(data)
+            context[node_id] = data_json
+            batch.submissions.append(
+                (
+                    _uuid(rng), instance_id, node_id, plan.process.get_node(node_id).form_definition_id,
+                    data_json, created_at + timedelta(hours=i * 5),
+                )
+            )
+        context_json = "{" + ",".join(f"{json_codec.dumps(k)}:{v}" for k, v in context.items()) + "}"
+        status = "active" if current is not None else "completed"
+        if current is None:
+            # Как в runtime: при завершении ProcessInstanceRepository.update не сбрасывает current_node_id,
+            # у завершённого документа остаётся последний отправленный шаг
+            start = plan.process.get_start_node().id
+            current = submitted[-1][0] if submitted else plan.process.resolve_node(start) or start
+        batch.instances.append(
+            (instance_id, str(plan.process.id), plan.process.version, current, status, context_json)
+        )
+        if len(batch.instances) >= spec.batch_size:
+            yield batch
+            batch = SeedBatch()
+    if batch.instances:
+        yield batch
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    """postgresql+asyncpg://... -> postgresql://... (asyncpg не понимает суффикс драйвера SQLAlchemy)."""
+    return re.sub(r"^postgresql\+\w+://", "postgresql://", database_url)
+
+
+@dataclass
+class SeedReport:
+    projects: int = 0
+    forms: int = 0
+    processes: int = 0
+    instances: int = 0
+    submissions: int = 0
+
+
+async def seed_database(
+    spec: SeedSpec,
+    database_url: str,
+    progress: Callable[[SeedReport], None] | None = None,
+) -> SeedReport:
+    """Записывает определения одной транзакцией, затем экземпляры и отправки пачками; в конце ANALYZE."""
+    import asyncpg
+
+    definitions = build_definitions(spec)
+    report = SeedReport()
+    conn = await asyncpg.connect(_asyncpg_dsn(database_url))
+    try:
+        try:
+            async with conn.transaction():
+                await conn.copy_records_to_table("projects", records=definitions.projects, columns=PROJECT_COLUMNS)
+                await conn.copy_records_to_table("form_definitions", records=definitions.forms, columns=FORM_COLUMNS)
+                await conn.copy_records_to_table(
+                    "process_definitions", records=definitions.processes, columns=PROCESS_COLUMNS
+                )
+                await conn.copy_records_to_table(
+                    "process_definition_versions", records=definitions.versions, columns=VERSION_COLUMNS
+                )
+        except asyncpg.UniqueViolationError as e:
+            raise SeedConflict(f"Данные с seed={spec.seed} уже загружены: {e}") from e
+        report.projects = len(definitions.projects)
+        report.forms = len(definitions.forms)
+        report.processes = len(definitions.processes)
+        for batch in iter_instance_batches(spec, definitions):
+            async with conn.transaction():
+                await conn.copy_records_to_table("process_instances", records=batch.instances, columns=INSTANCE_COLUMNS)
+                await conn.copy_records_to_table("form_submissions", records=batch.submissions, columns=SUBMISSION_COLUMNS)
+            report.instances += len(batch.instances)
+            report.submissions += len(batch.submissions)
+            if progress:
+                progress(report)
+        # Статистика планировщика сразу отражает новый объём (иначе планы до autovacuum — по старым данным)
+        await conn.execute(
+            "ANALYZE projects, form_definitions, process_definitions, process_definition_versions, "
+            "process_instances, form_submissions"
+        )
+    finally:
+        await conn.close()
+    return report
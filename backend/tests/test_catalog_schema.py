@@ -0,0 +1,23 @@
+from sqlalchemy import create_mock_engine
+
+from src.catalogs.infrastructure.models import CatalogItemModel
+from src.identity.infrastructure.models import Base
+
+
+def _create_all_ddl(url: str) -> list[str]:
+    statements = []
+
+    def executor(sql, *args, **kwargs):
+        statements.append(str(sql.compile(dialect=engine.dialect)))
+
+    engine = create_mock_engine(url, executor)
+    Base.metadata.create_all(engine, tables=[CatalogItemModel.__table__], checkfirst=False)
+    return statements
+
+
+def test_create_all_installs_pg_trgm_before_trigram_index():
+    statements = _create_all_ddl("postgresql+asyncpg://")
+    extension = next(i for i, s in enumerate(statements) if "CREATE EXTENSION IF NOT EXISTS pg_trgm" in s)
+    index = next(i for i, s in enumerate(statements) if "ix_catalog_items_label_trgm" in s)
+    assert extension < index
+    assert not any("pg_trgm" in s for s in _create_all_ddl("sqlite://"))
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+from src.definition_cache import (
+    REPLICA_LAG_KEY,
+    DefinitionCache,
+    cache_definition,
+    definition_cache,
+    evict_definition,
+    evict_pending,
+)
+
+
+def test_put_get_invalidate():
+    cache = DefinitionCache()
+    assert cache.get("form", "a") is None
+    cache.put("form", "a", 1, "v1")
+    assert cache.get("form", "a") == "v1"
+    cache.invalidate("form", "a")
+    assert cache.get("form", "a") is None
+
+
+def test_older_version_does_not_replace_newer():
+    cache = DefinitionCache()
+    cache.put("process", "p", 3, "v3")
+    cache.put("process", "p", 2, "v2")
+    assert cache.get("process", "p") == "v3"
+    cache.put("process", "p", 4, "v4")
+    assert cache.get("process", "p") == "v4"
+
+
+def test_changed_in_transaction_is_not_cached_until_commit():
+    definition_cache.clear()
+    session = SimpleNamespace(info={})
+    definition_cache.put("project", "x", 1, "old")
+    evict_definition(session, "project", "x")
+    assert definition_cache.get("project", "x") is None
+    cache_definition(session, "project", "x", 2, "uncommitted")
+    assert definition_cache.get("project", "x") is None
+    evict_pending(session.info)
+    cache_definition(session, "project", "x", 2, "committed")
+    assert definition_cache.get("project", "x") == "committed"
+    definition_cache.clear()
+
+
+def test_dependent_entry_invalidated_with_dependency():
+    cache = DefinitionCache()
+    cache.put("form", "f", 2, "form")
+    assert cache.put("bundle", ("p", 1), 1, "bundle", depends_on={("form", "f"): 2})
+    cache.invalidate("form", "f")
+    assert cache.get("bundle", ("p", 1)) is None
+
+
+def test_dependent_entry_not_cached_when_dependency_stale():
+    cache = DefinitionCache()
+    cache.put("form", "f", 3, "form")
+    assert not cache.put("bundle", ("p", 1), 1, "bundle", depends_on={("form", "f"): 2})
+    assert not cache.put("bundle", ("p", 1), 1, "bundle", depends_on={("project", "x"): 1})
+    assert cache.get("bundle", ("p", 1)) is None
+
+
+def test_project_validators_invalidated_with_project():
+    cache = DefinitionCache()
+    cache.put("project_validators", "x", 1, ([], 1))
+    cache.put("project_list_columns", "x", 1, (["status"], 1))
+    assert cache.put("bundle", ("p", 1), 1, "bundle", depends_on={("project_validators", "x"): 1})
+    cache.invalidate("project", "x")
+    assert cache.get("project_validators", "x") is None
+    assert cache.get("project_list_columns", "x") is None
+    assert cache.get("bundle", ("p", 1)) is None
+
+
+def test_replica_read_not_cached_right_after_invalidation():
+    definition_cache.clear()
+    replica = SimpleNamespace(info={REPLICA_LAG_KEY: 60.0})
+    primary = SimpleNamespace(info={})
+    definition_cache.invalidate("form", "f")
+    cache_definition(replica, "form", "f", 1, "maybe stale")
+    assert definition_cache.get("form", "f") is None
+    cache_definition(primary, "form", "f", 2, "fresh")
+    assert definition_cache.get("form", "f") == "fresh"
+    definition_cache.clear()
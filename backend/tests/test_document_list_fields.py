@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.runtime.application.runtime_service import RuntimeService
+from src.runtime.domain import InstanceStatus
+
+
+class _Repo:
+    def __init__(self, **methods):
+        for name, fn in methods.items():
+            setattr(self, name, fn)
+
+
+def _service():
+    project_id, process_id = uuid4(), uuid4()
+    instance = SimpleNamespace(
+        id=uuid4(),
+        document_number=1,
+        process_definition_id=process_id,
+        status=InstanceStatus.ACTIVE,
+        current_node_id="n1",
+        context={"n1": {"amount": 10, "comment": "длинный текст"}, "n2": {"customer": "ООО"}},
+    )
+    process = SimpleNamespace(id=process_id, name="Заявка", project_id=project_id)
+
+    async def list_all():
+        return [instance]
+
+    async def get_process(_):
+        return process
+
+    async def get_list_columns(_):
+        return ["document_number", "amount"]
+
+    return RuntimeService(
+        instance_repo=_Repo(list_all=list_all),
+        submission_repo=None,
+        process_repo=_Repo(get_by_id=get_process),
+        form_repo=None,
+        project_repo=_Repo(get_list_columns=get_list_columns),
+    )
+
+
+def test_context_projected_to_project_list_columns_by_default():
+    service = _service()
+    [doc] = asyncio.run(service.list_documents())
+    assert doc["context"] == {"amount": 10}
+    [doc] = asyncio.run(service.list_documents(fields=["customer"]))
+    assert doc["context"] == {"customer": "ООО"}
+    [doc] = asyncio.run(service.list_documents(full_context=True))
+    assert doc["context"] == {"amount": 10, "comment": "длинный текст", "customer": "ООО"}
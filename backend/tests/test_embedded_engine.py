@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from src.process_design.domain import ProcessGraphError
+from src.runtime.domain import InstanceStatus
+from src.runtime.infrastructure.embedded import EmbeddedEngine
+
+
+async def _define(engine):
+    form = await engine.forms.create("Заявка", fields=[{"name": "amount", "field_type": "number"}])
+    review = await engine.forms.create("Проверка", fields=[{"name": "ok", "field_type": "boolean"}])
+    process = await engine.processes.create(
+        "Закупка",
+        nodes=[
+            {"id": "start", "node_type": "start"},
+            {"id": "request", "node_type": "step", "form_definition_id": str(form.id)},
+            {"id": "review", "node_type": "step", "form_definition_id": str(review.id)},
+            {"id": "end", "node_type": "end"},
+        ],
+        edges=[
+            {"id": "e1", "source_node_id": "start", "target_node_id": "request"},
+            {"id": "e2", "source_node_id": "request", "target_node_id": "review", "condition_expression": "amount > 1000"},
+            {"id": "e3", "source_node_id": "request", "target_node_id": "end"},
+            {"id": "e4", "source_node_id": "review", "target_node_id": "end"},
+        ],
+    )
+    return process
+
+
+def test_documents_run_through_the_engine_without_database():
+    async def scenario():
+        engine = EmbeddedEngine()
+        process = await _define(engine)
+        data = {"request": {"amount": 5000}, "review": {"ok": True}}
+        big = await engine.run_document(process.id, lambda node_id, ctx: data[node_id])
+        small = await engine.run_document(process.id, lambda node_id, ctx: {"amount": 10})
+        assert big.status == InstanceStatus.COMPLETED and big.context == data
+        assert small.status == InstanceStatus.COMPLETED and set(small.context) == {"request"}
+        assert (await engine.submissions.get_by_instance_and_node(big.id, "review")).data == {"ok": True}
+
+        # Новая версия процесса не затрагивает документ, закреплённый за старой
+        pinned = await engine.runtime.start_process(process.id)
+        updated = await engine.processes.update(process.id, name="Закупка v2")
+        assert updated.version == 2 and (await engine.processes.get_version(process.id, 1)).name == "Закупка"
+        current = await engine.runtime.get_current_form(pinned.id)
+        assert current["node_id"] == "request" and current["instance"].process_version == 1
+
+        docs = await engine.runtime.list_documents(full_context=True)
+        assert [d["document_number"] for d in docs] == [3, 2, 1]
+
+        with pytest.raises(ProcessGraphError):
+            await engine.processes.update(process.id, edges=[{"id": "x", "source_node_id": "start", "target_node_id": "nowhere"}])
+        assert (await engine.processes.get_by_id(process.id)).version == 2
+
+    asyncio.run(scenario())
+
+
+def test_graph_warnings_come_from_the_save():
+    async def scenario():
+        engine = EmbeddedEngine()
+        process = await _define(engine)
+        assert process.graph_warnings == []
+        nodes = [{"id": "start", "node_type": "start"}, {"id": "orphan", "node_type": "step"}, {"id": "end", "node_type": "end"}]
+        updated = await engine.processes.update(
+            process.id, nodes=nodes, edges=[{"id": "e1", "source_node_id": "start", "target_node_id": "end"}]
+        )
+        assert any("orphan" in w for w in updated.graph_warnings)
+        assert (await engine.processes.get_by_id(process.id)).graph_warnings == []
+
+    asyncio.run(scenario())
@@ -1,5 +1,5 @@
 import pytest
-from src.rules.evaluator import evaluate_expression, evaluate_field_access
+from src.rules.evaluator import compile_expression, evaluate_expression, evaluate_field_access
 
 
 def test_evaluate_expression_simple():
@@ -36,3 +36,11 @@ def test_evaluate_field_access():
     assert evaluate_field_access(rules, {"role_ids": ["admin"]}, "read") == "write"
     assert evaluate_field_access(rules, {"role_ids": ["user"], "amount": 1500}, "read") == "read"
     assert evaluate_field_access(rules, {"role_ids": ["user"], "amount": 500}, "read") == "read"
+
+
+def test_compiled_expression_reused_across_contexts():
+    expr = compile_expression("amount > 1000 and status == 'new'")
+    assert expr.evaluate({"amount": 1500, "status": "new"}) is True
+    assert expr.evaluate({"amount": 500, "status": "new"}) is False
+    assert compile_expression("").evaluate({}) is True
+    assert compile_expression(None).evaluate({}) is True
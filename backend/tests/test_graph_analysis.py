@@ -0,0 +1,59 @@
+from uuid import uuid4
+
+from src.process_design.domain import (
+    Edge,
+    Node,
+    NodeType,
+    ProcessDefinition,
+    analyze_process_graph,
+    compute_routes,
+)
+
+
+def _process(nodes, edges):
+    return ProcessDefinition(id=uuid4(), name="p", description="", version=1, nodes=nodes, edges=edges)
+
+
+def test_routes_skip_nodes_without_form():
+    p = _process(
+        [
+            Node(id="s", node_type=NodeType.START),
+            Node(id="g", node_type=NodeType.GATEWAY),
+            Node(id="a", node_type=NodeType.STEP, form_definition_id="f"),
+            Node(id="e", node_type=NodeType.END),
+            Node(id="x", node_type=NodeType.GATEWAY),
+        ],
+        [
+            Edge(id="1", source_node_id="s", target_node_id="g"),
+            Edge(id="2", source_node_id="g", target_node_id="a"),
+            Edge(id="3", source_node_id="a", target_node_id="e"),
+        ],
+    )
+    p.routes = compute_routes(p)
+    assert p.routes == {"s": "a", "g": "a", "x": None}
+    assert p.resolve_node("s") == "a"
+    assert p.resolve_node("a") == "a"
+    assert p.resolve_node("e") == "e"
+
+    analysis = analyze_process_graph(p)
+    assert analysis.errors == []
+    assert analysis.reachable == {"s", "g", "a", "e"}
+    assert any("x" in w for w in analysis.warnings)
+
+
+def test_cycle_and_dangling_edge():
+    p = _process(
+        [
+            Node(id="s", node_type=NodeType.START),
+            Node(id="g", node_type=NodeType.GATEWAY),
+        ],
+        [
+            Edge(id="1", source_node_id="s", target_node_id="g"),
+            Edge(id="2", source_node_id="g", target_node_id="s"),
+            Edge(id="3", source_node_id="g", target_node_id="missing"),
+        ],
+    )
+    analysis = analyze_process_graph(p)
+    assert analysis.routes == {"s": None, "g": None}
+    assert len(analysis.errors) == 1
+    assert "Ни один конечный узел не достижим от старта" in analysis.warnings
@@ -0,0 +1,17 @@
+from src.observability.http_metrics import HttpMetrics
+
+
+def test_render_counts_histogram_and_in_flight():
+    metrics = HttpMetrics()
+    route = "/api/runtime/instances/{instance_id}/current-form"
+    metrics.request_started("GET", route)
+    metrics.request_started("GET", route)
+    metrics.request_finished("GET", route, 200, 0.02)
+    text = metrics.render()
+    labels = 'method="GET",route="/api/runtime/instances/{instance_id}/current-form"'
+    assert f'bpm_http_requests_total{{{labels},status="2xx"}} 1' in text
+    assert f'bpm_http_request_duration_seconds_bucket{{{labels},le="0.01"}} 0' in text
+    assert f'bpm_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+    assert f'bpm_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"bpm_http_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f"bpm_http_requests_in_flight{{{labels}}} 1" in text
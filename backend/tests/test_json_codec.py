@@ -0,0 +1,29 @@
+import json
+import math
+
+from src import json_codec
+
+
+def test_roundtrip_and_stdlib_compatibility():
+    value = {"node_1": {"name": "Заявка", "amount": 10.5, "tags": ["a", "b"]}, "role_ids": []}
+    encoded = json_codec.dumps(value)
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == value
+    assert json_codec.loads(json.dumps(value)) == value  # записи, сделанные stdlib json
+    # NaN/Infinity из старых записей читаются и при повторной записи остаются собой, а не null
+    stored = json_codec.loads(json.dumps({"x": [float("nan"), float("inf")], "y": None}))
+    restored = json_codec.loads(json_codec.dumps(stored))
+    assert math.isnan(restored["x"][0]) and restored["x"][1] == math.inf and restored["y"] is None
+    assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_strict_mode_writes_null_for_non_finite_numbers():
+    from src.json_response import FastJSONResponse
+
+    value = {"x": [float("nan"), 1.5], "y": {"z": float("-inf")}}
+    expected = {"x": [None, 1.5], "y": {"z": None}}
+    assert json.loads(json_codec.dumps_bytes(value, strict=True)) == expected
+    # Через stdlib (int вне 64 бит orjson не принимает) — тоже null, а не NaN
+    assert json.loads(json_codec.dumps_bytes({**value, "big": 2**70}, strict=True)) == {**expected, "big": 2**70}
+    body = FastJSONResponse(value).body
+    assert b"NaN" not in body and b"Infinity" not in body and json.loads(body) == expected
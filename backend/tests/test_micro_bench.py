@@ -0,0 +1,25 @@
+import random
+
+from bench.micro import compare, make_context, make_expression_corpus
+from src.rules.evaluator import _parse_or, _tokenize
+
+
+def test_corpus_is_deterministic_and_parseable():
+    corpus = make_expression_corpus(seed=3, context_size=50, terms=4, count=50)
+    assert corpus == make_expression_corpus(seed=3, context_size=50, terms=4, count=50)
+    assert corpus != make_expression_corpus(seed=4, context_size=50, terms=4, count=50)
+    # Все выражения разбираются целиком: иначе бенчмарк мерил бы ранний выход по ошибке разбора
+    ctx = make_context(random.Random(3), 50)
+    for expr in corpus:
+        tokens = _tokenize(expr)
+        assert _parse_or(tokens, 0, ctx)[1] == len(tokens), expr
+
+
+def test_compare_uses_threshold_and_spread():
+    def report(**medians):
+        return {"results": {k: {"median": v[0], "rel_spread": v[1]} for k, v in medians.items()}}
+
+    base = report(a=(10.0, 0.01), b=(10.0, 0.01), c=(10.0, 0.30), d=(10.0, 0.01))
+    new = report(a=(12.0, 0.01), b=(8.0, 0.01), c=(12.0, 0.01), e=(1.0, 0.0))
+    status = {r["name"]: r["status"] for r in compare(base, new, threshold=0.05)}
+    assert status == {"a": "slower", "b": "faster", "c": "same", "d": "removed", "e": "added"}
@@ -0,0 +1,41 @@
+from uuid import uuid4
+
+from src.process_design.domain import Edge, Node, NodeType, ProcessDefinition
+
+
+def _process(nodes, edges):
+    return ProcessDefinition(id=uuid4(), name="p", description="", version=1, nodes=nodes, edges=edges)
+
+
+def test_graph_indexes():
+    nodes = [
+        Node(id="s", node_type=NodeType.START),
+        Node(id="a", node_type=NodeType.STEP, form_definition_id="f"),
+        Node(id="e", node_type=NodeType.END),
+    ]
+    edges = [
+        Edge(id="1", source_node_id="s", target_node_id="a"),
+        Edge(id="2", source_node_id="a", target_node_id="e"),
+        Edge(id="3", source_node_id="a", target_node_id="s"),
+    ]
+    p = _process(nodes, edges)
+    assert p.get_start_node() is nodes[0]
+    assert p.get_node("a") is nodes[1]
+    assert p.get_node("missing") is None
+    assert [e.id for e in p.get_edges_from("a")] == ["2", "3"]
+    assert p.get_edges_from("e") == ()
+
+
+def test_reindex_after_mutation():
+    p = _process([Node(id="a", node_type=NodeType.STEP)], [])
+    assert p.get_start_node() is None
+    p.nodes.append(Node(id="s", node_type=NodeType.START))
+    p.edges.append(Edge(id="1", source_node_id="s", target_node_id="a"))
+    p.reindex()
+    assert p.get_start_node().id == "s"
+    assert p.get_edges_from("s")[0].target_node_id == "a"
+
+
+def test_slots():
+    n = Node(id="a", node_type=NodeType.STEP)
+    assert not hasattr(n, "__dict__")
@@ -0,0 +1,21 @@
+from src.observability.query_stats import begin_request, end_request, record_query, statement_shape
+
+
+def test_statement_shape_collapses_placeholder_lists():
+    a = statement_shape("SELECT * FROM catalogs\n WHERE id IN ($1, $2, $3)")
+    b = statement_shape("SELECT * FROM catalogs WHERE id IN ($1)")
+    assert a == b == "SELECT * FROM catalogs WHERE id IN (?)"
+
+
+def test_repeated_statements_reported_per_request():
+    record_query("SELECT 1", 0.1)  # вне запроса — не учитывается
+    stats, token = begin_request()
+    try:
+        for _ in range(4):
+            record_query("SELECT * FROM process_definitions WHERE id = $1", 0.001)
+        record_query("SELECT * FROM process_instances", 0.002)
+    finally:
+        end_request(token)
+    assert stats.count == 5
+    assert stats.repeated(3) == [("SELECT * FROM process_definitions WHERE id = ?", 4)]
+    assert stats.repeated(4) == []
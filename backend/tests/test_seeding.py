@@ -0,0 +1,47 @@
+import pytest
+
+from src import json_codec
+from src.process_design.domain import NodeType
+from src.seeding import SeedSpec, build_definitions, iter_instance_batches
+
+
+def _seed(spec):
+    definitions = build_definitions(spec)
+    instances, submissions = [], []
+    for batch in iter_instance_batches(spec, definitions):
+        instances += batch.instances
+        submissions += batch.submissions
+    return definitions, instances, submissions
+
+
+def test_seed_is_deterministic_and_batched():
+    spec = SeedSpec(projects=1, processes=3, instances=60, batch_size=25, seed=7)
+    definitions, instances, submissions = _seed(spec)
+    assert len(instances) == 60
+    assert [len(b.instances) for b in iter_instance_batches(spec, definitions)] == [25, 25, 10]
+    assert _seed(spec)[1:] == (instances, submissions)
+    assert _seed(SeedSpec(projects=1, processes=3, instances=60, seed=8))[1] != instances
+
+
+def test_instances_follow_the_process_graph():
+    for shape in ("linear", "branching", "loop"):
+        definitions, instances, submissions = _seed(SeedSpec(projects=1, processes=2, shape=shape, instances=80, seed=3))
+        plans = {str(p.process.id): p for p in definitions.plans}
+        steps_by_instance = {}
+        for _, instance_id, node_id, form_id, data, _ in submissions:
+            steps_by_instance.setdefault(instance_id, []).append(node_id)
+        for instance_id, process_id, _, current, status, context in instances:
+            process = plans[process_id].process
+            visited = steps_by_instance.get(instance_id, [])
+            assert all(process.get_node(n).node_type == NodeType.STEP for n in visited)
+            assert set(json_codec.loads(context)) == set(visited)
+            if status == "completed":
+                assert visited and current == visited[-1]
+            else:
+                assert process.get_node(current).node_type == NodeType.STEP
+
+
+def test_rejects_forms_without_condition_fields():
+    with pytest.raises(ValueError):
+        build_definitions(SeedSpec(fields=1))
+
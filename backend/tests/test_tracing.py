@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from src.observability.tracing import Tracer, traced_methods, tracer
+
+
+@traced_methods("repository")
+class _Repo:
+    async def get(self, key):
+        tracer.record("sql", "db", time.perf_counter(), 0.001, statement="SELECT 1")
+        return key
+
+
+def test_spans_form_tree_and_reach_buffer():
+    assert tracer.enabled
+    with tracer.span("outside", "service") as s:
+        assert s is None  # вне трассы спаны не пишутся
+
+    async def handle():
+        with tracer.trace("GET /x", "http") as root:
+            with tracer.span("handler", "handler", name="create"):  # атрибут с именем параметра span()
+                await _Repo().get(1)
+            root.attributes["status"] = 200
+
+    asyncio.run(handle())
+    trace = tracer.buffer.slowest(1)[0]
+    tree = trace.to_dict()["root"]
+    assert tree["attributes"] == {"status": 200}
+    [handler] = tree["children"]
+    assert handler["name"] == "handler" and handler["attributes"] == {"name": "create"}
+    [repo] = handler["children"]
+    assert repo["name"] == "_Repo.get" and repo["layer"] == "repository"
+    assert [c["layer"] for c in repo["children"]] == ["db"]
+
+
+def test_max_spans_drops_extra():
+    t = Tracer(buffer_size=5, max_spans=2)
+    with t.trace("root"):
+        for _ in range(3):
+            with t.span("child", "service"):
+                pass
+    [trace] = t.buffer.slowest(5)
+    assert len(trace.spans) == 2 and trace.dropped_spans == 2
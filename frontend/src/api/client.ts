@@ -22,6 +22,8 @@ export async function api<T>(
   const res = await fetch(`${API_BASE}${path}`, {
     ...options,
     headers,
+    // Cookie read-your-writes от API на другом порту (см. backend src/read_your_writes.py)
+    credentials: "include",
     signal: options.signal ?? controller.signal,
   });
   clearTimeout(timeoutId);
@@ -115,6 +117,8 @@ export interface FieldSchema {
   required: boolean;
   options?: { value: string; label: string }[] | null;
   catalog_id?: string | null;
+  /** Варианты справочника не отдаются с формой, а ищутся на сервере (для больших справочников) */
+  catalog_remote?: boolean;
   validations?: Record<string, unknown> | null;
   access_rules?: FieldAccessRuleSchema[] | null;
   /** Колонок из 12 (1–12): 12 = вся строка, 6 = половина, 4 = треть, 3 = четверть */
@@ -151,11 +155,35 @@ export interface CatalogResponse {
   name: string;
   description: string;
   items: CatalogItemSchema[];
+  version: number;
+}
+
+/** Элемент списка справочников: без элементов, только их число. */
+export interface CatalogSummaryResponse {
+  id: string;
+  name: string;
+  description: string;
+  item_count: number;
+}
+
+export interface CatalogItemsPage {
+  items: CatalogItemSchema[];
+  next_cursor: number | null;
 }
 
 export const catalogs = {
-  list: () => api<CatalogResponse[]>("/api/catalogs"),
+  list: () => api<CatalogSummaryResponse[]>("/api/catalogs"),
   get: (id: string) => api<CatalogResponse>(`/api/catalogs/${id}`),
+  /** Поиск по элементам справочника (для полей с catalog_remote). */
+  searchItems: (id: string, params: { q?: string; limit?: number; cursor?: number | null; values?: string[] } = {}) => {
+    const query = new URLSearchParams();
+    for (const v of params.values ?? []) query.append("values", v);
+    if (params.q) query.set("q", params.q);
+    if (params.limit) query.set("limit", String(params.limit));
+    if (params.cursor != null) query.set("cursor", String(params.cursor));
+    const qs = query.toString();
+    return api<CatalogItemsPage>(`/api/catalogs/${id}/items${qs ? `?${qs}` : ""}`);
+  },
   create: (body: { name: string; description?: string; items?: CatalogItemSchema[] }) =>
     api<CatalogResponse>("/api/catalogs", {
       method: "POST",
@@ -170,6 +198,31 @@ export const catalogs = {
     api<void>(`/api/catalogs/${id}`, { method: "DELETE" }),
 };
 
+// Справочники по ссылке id@version из формы: содержимое версии не меняется, поэтому держим их
+// на всё время жизни страницы; при смене версии форма пришлёт новую ссылку.
+// Кэшируем под версией, которую вернул сервер: GET отдаёт текущую версию справочника (а с реплики —
+// возможно, ещё предыдущую), и под чужой ссылкой она закрепилась бы навсегда.
+const catalogItemsCache = new Map<string, Promise<CatalogItemSchema[]>>();
+
+function catalogItemsByRef(ref: string): Promise<CatalogItemSchema[]> {
+  const cached = catalogItemsCache.get(ref);
+  if (cached) return cached;
+  const [id] = ref.split("@");
+  const catalog = catalogs.get(id);
+  const items = catalog.then((c) => c.items);
+  // Параллельные запросы той же ссылки ждут этот же ответ, пока не станет известна версия
+  catalogItemsCache.set(ref, items);
+  catalog.then(
+    (c) => {
+      const actual = `${id}@${c.version}`;
+      catalogItemsCache.set(actual, items);
+      if (actual !== ref && catalogItemsCache.get(ref) === items) catalogItemsCache.delete(ref);
+    },
+    () => catalogItemsCache.delete(ref),
+  );
+  return items;
+}
+
 // Projects API (подпроекты документов)
 export interface ProjectFieldSchema {
   key: string;
@@ -196,6 +249,14 @@ export interface ProjectResponse {
   validators: ValidatorSchema[];
 }
 
+/** Элемент списка проектов: без полей, колонок и кода валидаторов. */
+export interface ProjectSummaryResponse {
+  id: string;
+  name: string;
+  description: string;
+  sort_order: number;
+}
+
 const BASE_LIST_COLUMN_OPTIONS: { key: string; label: string }[] = [
   { key: "document_number", label: "№ документа" },
   { key: "id", label: "ID документа" },
@@ -211,7 +272,7 @@ export function projectFieldsToColumnOptions(project: ProjectResponse | null): {
 }
 
 export const projects = {
-  list: () => api<ProjectResponse[]>("/api/projects"),
+  list: () => api<ProjectSummaryResponse[]>("/api/projects"),
   get: (id: string) => api<ProjectResponse>(`/api/projects/${id}`),
   create: (body: {
     name: string;
@@ -331,6 +392,10 @@ export interface CurrentFormResponse {
       required: boolean;
       read_only?: boolean;
       options?: { value: string; label: string }[] | null;
+      catalog_id?: string | null;
+      catalog_remote?: boolean;
+      /** "<id>@<version>" — варианты берутся из справочника (см. catalogItemsByRef) */
+      catalog_ref?: string | null;
       validations?: Record<string, unknown> | null;
       width?: number | null;
     }>;
@@ -359,8 +424,17 @@ export const runtime = {
       `/api/runtime/processes/${processDefinitionId}/start`,
       { method: "POST" }
     ),
-  getCurrentForm: (instanceId: string) =>
-    api<CurrentFormResponse>(`/api/runtime/instances/${instanceId}/current-form`),
+  getCurrentForm: async (instanceId: string) => {
+    const res = await api<CurrentFormResponse>(
+      `/api/runtime/instances/${instanceId}/current-form?catalog_refs=true`
+    );
+    await Promise.all(
+      res.form_definition.fields.map(async (f) => {
+        if (f.catalog_ref) f.options = await catalogItemsByRef(f.catalog_ref);
+      })
+    );
+    return res;
+  },
   saveStep: (instanceId: string, nodeId: string, data: Record<string, unknown>) =>
     api<{ saved: boolean }>(`/api/runtime/instances/${instanceId}/nodes/${nodeId}/save`, {
       method: "POST",
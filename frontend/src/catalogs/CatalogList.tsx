@@ -1,10 +1,10 @@
 import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
-import { catalogs, type CatalogResponse } from "../api/client";
+import { catalogs, type CatalogSummaryResponse } from "../api/client";
 import styles from "./CatalogList.module.css";
 
 export function CatalogList() {
-  const [list, setList] = useState<CatalogResponse[]>([]);
+  const [list, setList] = useState<CatalogSummaryResponse[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -33,7 +33,7 @@ export function CatalogList() {
           <li key={c.id}>
             <Link to={c.id ? `/catalogs/${c.id}` : "/catalogs"}>{c.name}</Link>
             {c.description && <span className={styles.desc}> — {c.description}</span>}
-            <span className={styles.count}>{c.items?.length ?? 0} записей</span>
+            <span className={styles.count}>{c.item_count} записей</span>
           </li>
         ))}
       </ul>
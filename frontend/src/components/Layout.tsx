@@ -12,7 +12,7 @@ import {
   LogIn,
 } from "lucide-react";
 import { useAuth } from "../contexts/AuthContext";
-import { projects, type ProjectResponse } from "../api/client";
+import { projects, type ProjectSummaryResponse } from "../api/client";
 import styles from "./Layout.module.css";
 
 const ICON_SIZE = 20;
@@ -24,7 +24,7 @@ export function Layout() {
   const navigate = useNavigate();
   const location = useLocation();
   const [searchParams] = useSearchParams();
-  const [projectList, setProjectList] = useState<ProjectResponse[]>([]);
+  const [projectList, setProjectList] = useState<ProjectSummaryResponse[]>([]);
   const [collapsed, setCollapsed] = useState(() => {
     try {
       return localStorage.getItem(SIDEBAR_COLLAPSED_KEY) === "1";
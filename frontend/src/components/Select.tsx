@@ -1,5 +1,6 @@
 import React from "react";
 import Select, { type StylesConfig, type GroupBase, type MultiValue, type SingleValue } from "react-select";
+import AsyncSelect from "react-select/async";
 
 export interface SelectOption {
   value: string;
@@ -171,3 +172,106 @@ export function AppSelect({
     />
   );
 }
+
+interface AsyncSelectProps extends Omit<SelectProps, "options"> {
+  /** Поиск вариантов на сервере по введённой строке */
+  loadOptions: (input: string) => Promise<SelectOption[]>;
+  /** Подписи уже выбранных значений (например, сохранённых в документе) — запрашиваются при открытии */
+  loadLabels?: (values: string[]) => Promise<SelectOption[]>;
+}
+
+/** Выбор из большого справочника: варианты подгружаются по мере ввода, подписи выбранных значений — через loadLabels
+ * (без него и для значений, которых нет в справочнике, показывается само значение). */
+export function AppAsyncSelect({
+  value,
+  onChange,
+  loadOptions,
+  loadLabels,
+  placeholder = "— Начните вводить —",
+  isMulti = false,
+  isDisabled = false,
+  isRequired = false,
+}: AsyncSelectProps) {
+  const [labels, setLabels] = React.useState<Record<string, string>>({});
+  const remember = (selected: readonly SelectOption[]) =>
+    setLabels((prev) => ({ ...prev, ...Object.fromEntries(selected.map((s) => [s.value, s.label])) }));
+  const toOption = (v: string): SelectOption => ({ value: v, label: labels[v] ?? v });
+
+  // Каждое значение запрашивается один раз, даже если в справочнике его нет
+  const requested = React.useRef(new Set<string>());
+  const valuesKey = (Array.isArray(value) ? value : value ? [value] : []).join("\u0000");
+  React.useEffect(() => {
+    if (!loadLabels || !valuesKey) return;
+    const missing = valuesKey.split("\u0000").filter((v) => !(v in labels) && !requested.current.has(v));
+    if (missing.length === 0) return;
+    missing.forEach((v) => requested.current.add(v));
+    loadLabels(missing)
+      .then((found) => setLabels((prev) => ({ ...Object.fromEntries(found.map((s) => [s.value, s.label])), ...prev })))
+      // Подпись не критична: остаётся само значение
+      .catch(() => missing.forEach((v) => requested.current.delete(v)));
+  }, [valuesKey, labels, loadLabels]);
+
+  if (isMulti) {
+    const selectValue = Array.isArray(value) ? value.map(toOption) : [];
+    return (
+      <AsyncSelect<SelectOption, true>
+        value={selectValue}
+        onChange={(selected: MultiValue<SelectOption>) => {
+          remember(selected);
+          onChange(selected.map((s) => s.value));
+        }}
+        loadOptions={loadOptions}
+        defaultOptions
+        cacheOptions
+        placeholder={placeholder}
+        isMulti={true}
+        isDisabled={isDisabled}
+        isClearable={!isRequired}
+        classNamePrefix="react-select"
+        styles={customStyles}
+        theme={(theme) => ({
+          ...theme,
+          borderRadius: 6,
+          colors: {
+            ...theme.colors,
+            primary: "#2563eb",
+            primary75: "#eff6ff",
+            primary50: "#eff6ff",
+            primary25: "#eff6ff",
+          },
+        })}
+      />
+    );
+  }
+
+  const selectValue = typeof value === "string" && value !== "" ? toOption(value) : null;
+  return (
+    <AsyncSelect<SelectOption, false>
+      value={selectValue}
+      onChange={(selected: SingleValue<SelectOption>) => {
+        if (selected) remember([selected]);
+        onChange(selected ? selected.value : "");
+      }}
+      loadOptions={loadOptions}
+      defaultOptions
+      cacheOptions
+      placeholder={placeholder}
+      isMulti={false}
+      isDisabled={isDisabled}
+      isClearable={!isRequired}
+      classNamePrefix="react-select"
+      styles={customStyles}
+      theme={(theme) => ({
+        ...theme,
+        borderRadius: 6,
+        colors: {
+          ...theme.colors,
+          primary: "#2563eb",
+          primary75: "#eff6ff",
+          primary50: "#eff6ff",
+          primary25: "#eff6ff",
+        },
+      })}
+    />
+  );
+}
@@ -7,7 +7,7 @@ import {
   type FieldSchema,
   type ProjectFieldSchema,
 } from "../api/client";
-import type { CatalogResponse, ProjectResponse } from "../api/client";
+import type { CatalogSummaryResponse, ProjectResponse } from "../api/client";
 import { ChevronLeft, ChevronRight } from "lucide-react";
 import styles from "./FormConstructor.module.css";
 
@@ -38,7 +38,7 @@ export function FormConstructor() {
   const [name, setName] = useState("");
   const [description, setDescription] = useState("");
   const [fields, setFields] = useState<FieldSchema[]>([]);
-  const [catalogList, setCatalogList] = useState<CatalogResponse[]>([]);
+  const [catalogList, setCatalogList] = useState<CatalogSummaryResponse[]>([]);
   const [project, setProject] = useState<ProjectResponse | null>(null);
   const [loading, setLoading] = useState(!isNew);
   const [saving, setSaving] = useState(false);
@@ -523,6 +523,18 @@ export function FormConstructor() {
                         />
                         Обязательное
                       </label>
+                      {selectedField.catalog_id && (
+                        <label className={styles.checkLabel} title="Для больших справочников: варианты не загружаются с формой">
+                          <input
+                            type="checkbox"
+                            checked={Boolean(selectedField.catalog_remote)}
+                            onChange={(e) =>
+                              updateField(selectedFieldIndex!, { catalog_remote: e.target.checked })
+                            }
+                          />
+                          Поиск по справочнику на сервере
+                        </label>
+                      )}
                       <div className={styles.widthControl}>
                         <span className={styles.widthLabel}>Ширина (колонок из 12):</span>
                         <div className={styles.widthButtons}>
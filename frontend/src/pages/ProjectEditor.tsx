@@ -6,7 +6,7 @@ import {
   projectFieldsToColumnOptions,
   type ProjectFieldSchema,
   type ProjectResponse,
-  type CatalogResponse,
+  type CatalogSummaryResponse,
 } from "../api/client";
 import styles from "./ProjectEditor.module.css";
 
@@ -28,7 +28,7 @@ export function ProjectEditor() {
   const [fields, setFields] = useState<ProjectFieldSchema[]>([]);
   const [selectedFieldIndex, setSelectedFieldIndex] = useState<number | null>(null);
   const [closingFieldIndex, setClosingFieldIndex] = useState<number | null>(null);
-  const [catalogList, setCatalogList] = useState<CatalogResponse[]>([]);
+  const [catalogList, setCatalogList] = useState<CatalogSummaryResponse[]>([]);
   const [draggedColumnIndex, setDraggedColumnIndex] = useState<number | null>(null);
   const [dragOverColumnIndex, setDragOverColumnIndex] = useState<number | null>(null);
   const [loading, setLoading] = useState(false);
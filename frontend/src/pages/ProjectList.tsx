@@ -1,12 +1,12 @@
 import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
 import { useAuth } from "../contexts/AuthContext";
-import { projects, type ProjectResponse } from "../api/client";
+import { projects, type ProjectSummaryResponse } from "../api/client";
 import styles from "./ProjectList.module.css";
 
 export function ProjectList() {
   const { isAdmin } = useAuth();
-  const [list, setList] = useState<ProjectResponse[]>([]);
+  const [list, setList] = useState<ProjectSummaryResponse[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
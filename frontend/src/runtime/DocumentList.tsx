@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
-import { runtime, projects, type DocumentListItem, type ProjectResponse } from "../api/client";
+import { runtime, projects, type DocumentListItem, type ProjectSummaryResponse } from "../api/client";
 import styles from "./DocumentList.module.css";
 
 const statusLabel: Record<string, string> = {
@@ -12,7 +12,7 @@ const statusLabel: Record<string, string> = {
 
 export function DocumentList() {
   const [list, setList] = useState<DocumentListItem[]>([]);
-  const [projectList, setProjectList] = useState<ProjectResponse[]>([]);
+  const [projectList, setProjectList] = useState<ProjectSummaryResponse[]>([]);
   const [selectedProjectId, setSelectedProjectId] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -1,7 +1,7 @@
 import { useEffect, useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
-import { runtime, type CurrentFormResponse } from "../api/client";
-import { AppSelect } from "../components/Select";
+import { catalogs, runtime, type CurrentFormResponse } from "../api/client";
+import { AppAsyncSelect, AppSelect } from "../components/Select";
 import styles from "./RuntimeForm.module.css";
 
 export function RuntimeForm() {
@@ -168,6 +168,20 @@ export function RuntimeForm() {
                   if (field.field_type === "select" || field.field_type === "multiselect") {
                     console.log("Field type:", field.field_type, "isMulti:", isMultiSelect);
                   }
+                  if (field.catalog_remote && field.catalog_id) {
+                    const catalogId = field.catalog_id;
+                    return (
+                      <AppAsyncSelect
+                        value={isMultiSelect ? ((formData[field.name] as string[] | undefined) ?? []) : ((formData[field.name] as string | undefined) ?? "")}
+                        onChange={(value) => updateField(field.name, value)}
+                        loadOptions={(input) => catalogs.searchItems(catalogId, { q: input }).then((page) => page.items)}
+                        loadLabels={(values) => catalogs.searchItems(catalogId, { values }).then((page) => page.items)}
+                        isMulti={isMultiSelect}
+                        isDisabled={field.read_only}
+                        isRequired={field.required}
+                      />
+                    );
+                  }
                   return (
                     <AppSelect
                       value={isMultiSelect ? ((formData[field.name] as string[] | undefined) ?? []) : ((formData[field.name] as string | undefined) ?? "")}
@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { useNavigate, useLocation, useParams } from "react-router-dom";
-import { processes, runtime, projects, type ProcessResponse, type ProjectResponse } from "../api/client";
+import { processes, runtime, projects, type ProcessResponse, type ProjectSummaryResponse } from "../api/client";
 import styles from "./StartProcess.module.css";
 
 export function StartProcess() {
@@ -10,7 +10,7 @@ export function StartProcess() {
   const projectIdFromState = (location.state as { projectId?: string } | null)?.projectId ?? null;
   const effectiveProjectId = projectIdFromParams ?? projectIdFromState ?? null;
   const [list, setList] = useState<ProcessResponse[]>([]);
-  const [projectList, setProjectList] = useState<ProjectResponse[]>([]);
+  const [projectList, setProjectList] = useState<ProjectSummaryResponse[]>([]);
   const [selectedProjectId, setSelectedProjectId] = useState<string | null>(effectiveProjectId);
   const [loading, setLoading] = useState(true);
   const [starting, setStarting] = useState<string | null>(null);